@@ -0,0 +1,89 @@
+"""Sözlük tablosunun büyük sözlüklerde açılma, kaydırma ve süzme sürelerini ölçen betik.
+
+Tablo ekransız (offscreen) Qt ile gerçek bir QTableView içinde açılır.
+Kaydırma, tablo her seferinde en alta kaydırılarak ölçülür; her adımda
+görünüm fetchMore() ile bir sonraki sayfayı ister ve olay döngüsü yeni
+satırları çizer. Süzme süreleri modelin yenilenip ilk sayfayı okuması
+dahil ölçülür.
+
+Kullanım:
+    python benchmarks/bench_browser.py 1000000 [kaydırılacak sayfa sayısı]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from bench_suite import generate_database, summarize
+from dictionary_browser import DictionaryBrowser
+from dictionary_core import DictionaryCore
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(size, pages):
+    app = QApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        database_file = os.path.join(tmp, "sozluk.db")
+        generate_database(database_file, size)
+        core = DictionaryCore(database_file, snapshot_file=None)
+        core.load(build_fuzzy_index=False)
+        core.wait_for_indexes()
+        # Türkçe filtre için herhangi bir kaydın anlamındaki ilk sözcük
+        meaning = core.page(limit=1)[0][1].split(",")[0]
+
+        def open_browser():
+            global browser
+            browser = DictionaryBrowser(core)
+            browser.show()
+            app.processEvents()
+
+        opened = timed(open_browser)
+        model = browser.model
+        print(f"{size} kayıt, tablo açılışı {opened:.1f} ms, ilk sayfa {model.rowCount()} satır")
+
+        tracemalloc.start()
+        samples = []
+        for _ in range(pages):
+            samples.append(timed(lambda: (browser.table.scrollToBottom(), app.processEvents())) / 1000)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        stats = summarize(samples)
+        print(f"kaydırma: {pages} adım, {model.rowCount()} satır okundu, adım başı p50 "
+              f"{stats['p50_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, en çok {stats['max_ms']:.2f} ms, "
+              f"satırların belleği {memory / 1e6:.1f} MB")
+
+        for name, text, mode in (('önek', model.rows[len(model.rows) // 2][0][:4], 0),
+                                 ('Türkçe', meaning, 1)):
+            browser.mode_combo.blockSignals(True)
+            browser.mode_combo.setCurrentIndex(mode)
+            browser.mode_combo.blockSignals(False)
+            browser.filter_input.setText(text)
+            elapsed = timed(lambda: (browser.apply_filter(), app.processEvents()))
+            print(f"{name} filtresi '{text}': {elapsed:.1f} ms, {model.rowCount()} satır"
+                  f"{'+' if model.canFetchMore() else ''}")
+
+        browser.mode_combo.setCurrentIndex(0)
+        browser.filter_input.clear()
+        browser.apply_filter()
+        elapsed = timed(lambda: (model.sort(0, 1), app.processEvents()))
+        print(f"ters sıralama: {elapsed:.1f} ms, ilk kelime {model.rows[0][0]}")
+        elapsed = timed(lambda: model.setData(model.index(0, 1), "yeni anlam"))
+        print(f"satır düzenleme: {elapsed:.1f} ms")
+        browser.close()
+        core.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 200)
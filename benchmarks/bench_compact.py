@@ -0,0 +1,80 @@
+"""dict ile CompactDictionary'nin bellek ve arama hızını karşılaştıran betik.
+
+Her iki yapı da uygulamadaki gibi SQLite veritabanından kurulur; bellek
+tracemalloc ile ölçülür (kurulum sonrası kalan ve kurulum sırasındaki en
+yüksek değer).
+
+Kullanım:
+    python benchmarks/bench_compact.py 100000 1000000
+"""
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import generate_database
+from dictionary_compact import CompactDictionary
+from dictionary_storage import SQLiteStorage
+
+LOOKUPS = 200000
+
+
+def build_dict(storage):
+    return storage.load()
+
+
+def build_compact(storage):
+    return CompactDictionary(((english, turkish) for english, turkish, _ in storage.iterate()),
+                             presorted=True)
+
+
+def measure_memory(build, storage):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(storage)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current, peak
+
+
+def measure_lookups(store, words):
+    get = store.get
+    start = time.perf_counter()
+    for word in words:
+        get(word)
+    return (time.perf_counter() - start) / len(words)
+
+
+def main(sizes):
+    print(f"{'kayıt':>9} {'yapı':<8} {'kurulum s':>10} {'bellek MB':>10} {'en yüksek MB':>13} "
+          f"{'kayıt başı B':>13} {'isabet µs':>10} {'isabetsiz µs':>13}")
+    rng = random.Random(2)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"sozluk_{size}.db")
+            generate_database(path, size)
+            storage = SQLiteStorage(path)
+            words = [english for english, _, _ in storage.iterate()]
+            hits = [rng.choice(words) for _ in range(LOOKUPS)]
+            misses = [word + "zz" for word in hits]
+            del words
+            for name, build in (('dict', build_dict), ('compact', build_compact)):
+                store, elapsed, current, peak = measure_memory(build, storage)
+                assert len(store) == size
+                hit = measure_lookups(store, hits)
+                miss = measure_lookups(store, misses)
+                print(f"{size:>9} {name:<8} {elapsed:>10.2f} {current / 1e6:>10.1f} {peak / 1e6:>13.1f} "
+                      f"{current / size:>13.0f} {hit * 1e6:>10.2f} {miss * 1e6:>13.2f}")
+                del store
+            storage.close()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,70 @@
+"""Akış halindeki dışa aktarma biçimlerinin hızını ve bellek kullanımını ölçen betik.
+
+Her biçim için kayıtlar SQLiteStorage.iterate() ile veritabanından okunup
+dosyaya yazılır; süre, saniyedeki kayıt, yazılan MB/s ve dosya boyutu
+raporlanır. --memory verilirse her biçim tracemalloc açıkken bir kez daha
+çalıştırılıp en yüksek Python bellek kullanımı da gösterilir (izleme
+dışa aktarmayı yavaşlattığı için süre ölçümünden ayrı yapılır).
+
+Kullanım:
+    python benchmarks/bench_export.py 1000000
+    python benchmarks/bench_export.py 100000 --memory --formats csv xlsx
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import generate_database
+from dictionary_export import EXPORTERS, export_entries
+from dictionary_storage import SQLiteStorage
+
+EXTENSIONS = {'csv': 'csv', 'jsonl': 'jsonl', 'anki': 'txt', 'xlsx': 'xlsx', 'docx': 'docx'}
+
+
+def run(storage, path, format, memory=False):
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    count = export_entries(storage.iterate(), path, format)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dışa aktarma ölçümü")
+    parser.add_argument('sizes', nargs='*', type=int, default=[1000000])
+    parser.add_argument('--formats', nargs='+', choices=list(EXPORTERS), default=list(EXPORTERS))
+    parser.add_argument('--memory', action='store_true', help="tracemalloc ile en yüksek belleği de ölç")
+    args = parser.parse_args(argv)
+
+    print(f"{'kayıt':>9} {'biçim':<6} {'süre s':>8} {'kayıt/s':>10} {'MB/s':>7} {'MB':>7} {'bellek MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            database_file = os.path.join(tmp, f"sozluk_{size}.db")
+            generate_database(database_file, size)
+            storage = SQLiteStorage(database_file)
+            for format in args.formats:
+                path = os.path.join(tmp, f"sozluk_{size}.{EXTENSIONS[format]}")
+                count, elapsed, _ = run(storage, path, format)
+                assert count == size
+                megabytes = os.path.getsize(path) / 1e6
+                peak = ''
+                if args.memory:
+                    peak = f"{run(storage, path, format, memory=True)[2] / 1e6:.1f}"
+                print(f"{size:>9} {format:<6} {elapsed:>8.2f} {count / elapsed:>10.0f} "
+                      f"{megabytes / elapsed:>7.1f} {megabytes:>7.1f} {peak:>10}", flush=True)
+                os.remove(path)
+            storage.close()
+
+
+if __name__ == "__main__":
+    main()
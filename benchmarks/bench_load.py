@@ -0,0 +1,75 @@
+"""Sözlük yükleme yöntemlerini karşılaştıran ölçüm betiği.
+
+Kullanım:
+    python benchmarks/bench_load.py 10000 100000 1000000
+"""
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from dictionary_storage import COLUMNS, read_entries
+
+
+def random_word(rng, length):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def generate_workbook(path, size, seed=0):
+    """Verilen sayıda rastgele kayıt içeren Excel dosyası oluştur"""
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Sheet1')
+    worksheet.append(COLUMNS)
+    for i in range(size):
+        worksheet.append([f"{random_word(rng, 7)}{i}", random_word(rng, 9), "2024-01-01"])
+    workbook.save(path)
+
+
+def load_iterrows(path):
+    """Eski yöntem: read_excel + iterrows"""
+    df = pd.read_excel(path)
+    return {row['English'].lower(): row['Turkish'] for _, row in df.iterrows()}
+
+
+def load_vectorized(path):
+    """read_excel + sütunların zip ile birleştirilmesi"""
+    df = pd.read_excel(path, usecols=['English', 'Turkish'])
+    return dict(zip(df['English'].astype(str).str.lower(), df['Turkish']))
+
+
+def load_streaming(path):
+    """Salt okunur openpyxl ile satır satır okuma"""
+    return dict(read_entries(path))
+
+
+def measure(func, path):
+    start = time.perf_counter()
+    result = func(path)
+    return time.perf_counter() - start, len(result)
+
+
+def main(sizes):
+    loaders = [load_iterrows, load_vectorized, load_streaming]
+    print(f"{'kayıt':>10} " + " ".join(f"{f.__name__:>16}" for f in loaders))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"dict_{size}.xlsx")
+            generate_workbook(path, size)
+            timings = []
+            for loader in loaders:
+                elapsed, count = measure(loader, path)
+                assert count == size, (loader.__name__, count)
+                timings.append(elapsed)
+            print(f"{size:>10} " + " ".join(f"{t:>15.2f}s" for t in timings))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000])
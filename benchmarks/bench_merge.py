@@ -0,0 +1,88 @@
+"""İki büyük sözlük dosyasının birleştirilme süresini ölçen betik.
+
+İlk dosya bench_suite'in rastgele verisinden üretilir. İkinci dosya
+kayıtların bir kısmını paylaşır; paylaşılanların bir kısmının anlamı ve
+tarihi değiştirilir, kalanı yeni kelimelerdir. Dosyalar seçilen biçimde
+(varsayılan csv) yazılır; okuma, her kural için birleştirme ve sonucun
+yazılması ayrı ayrı ölçülür.
+
+Kullanım:
+    python benchmarks/bench_merge.py 500000
+    python benchmarks/bench_merge.py 500000 --format xlsx --rules newest
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import generate_database
+from dictionary_export import export_entries
+from dictionary_merge import RULES, diff_report, merge_frames, read_dictionary
+from dictionary_storage import SQLiteStorage
+
+# İkinci dosyada ilk dosyayla paylaşılan kayıtların oranı ve bunlardan anlamı değişenler
+SHARED = 0.6
+CHANGED = 0.2
+
+
+def make_files(tmp, size, extension):
+    database_file = os.path.join(tmp, "sozluk.db")
+    generate_database(database_file, size)
+    storage = SQLiteStorage(database_file)
+    rows = list(storage.iterate())
+    storage.close()
+
+    rng = random.Random(1)
+    other = []
+    for english, turkish, date in rows:
+        if rng.random() >= SHARED:
+            continue
+        if rng.random() < CHANGED:
+            other.append((english, turkish + ", yeni", "2025-01-01"))
+        else:
+            other.append((english, turkish, date))
+    other += [(f"yeni{i}", f"anlam{i}", "2025-01-01") for i in range(size - len(other))]
+    other.sort()
+
+    local_file = os.path.join(tmp, f"yerel.{extension}")
+    other_file = os.path.join(tmp, f"diger.{extension}")
+    export_entries(rows, local_file)
+    export_entries(other, other_file)
+    return local_file, other_file
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sözlük birleştirme ölçümü")
+    parser.add_argument('size', nargs='?', type=int, default=500000)
+    parser.add_argument('--format', choices=['csv', 'jsonl', 'xlsx'], default='csv')
+    parser.add_argument('--rules', nargs='+', choices=RULES, default=list(RULES))
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        local_file, other_file = make_files(tmp, args.size, args.format)
+        frames, elapsed = timed(lambda: [read_dictionary(local_file), read_dictionary(other_file)])
+        print(f"{args.size} + {len(frames[1])} kayıt ({args.format}), okuma {elapsed:.2f} s")
+        for rule in args.rules:
+            (result, conflicts), merged = timed(lambda: merge_frames(frames, rule))
+            names = ["yerel", "diğer"]
+            _, reported = timed(lambda: diff_report(conflicts, result, names).to_csv(
+                os.path.join(tmp, "fark.csv"), index=False))
+            output = os.path.join(tmp, f"birlesik.{args.format}")
+            _, written = timed(lambda: export_entries(result.itertuples(index=False, name=None), output))
+            print(f"{rule:<7} birleştirme {merged:.2f} s, fark raporu {reported:.2f} s, "
+                  f"yazma {written:.2f} s; {len(result)} kelime, "
+                  f"{conflicts['english'].nunique()} çakışma")
+
+
+if __name__ == "__main__":
+    main()
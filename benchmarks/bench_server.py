@@ -0,0 +1,162 @@
+"""Sözlük servisini eşzamanlı istemcilerle yükleyen betik.
+
+--url verilmezse geçici bir veritabanı üretilir ve servis ayrı bir süreçte
+başlatılır. Her bağlantı kalıcı (keep-alive) bir HTTP/1.1 bağlantısıdır ve
+istekleri art arda gönderir; istemci tarafı gecikmeler ve servisin
+kendi /metrics ölçümleri raporlanır.
+
+Kullanım:
+    python benchmarks/bench_server.py --size 100000 --connections 50 --requests 20000
+    python benchmarks/bench_server.py --url http://127.0.0.1:8765 --mix lookup
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_suite import generate_database, summarize
+
+BATCH_SIZE = 20
+
+
+class Client:
+    """Tek bir kalıcı bağlantı üzerinden JSON istekleri gönderir"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self):
+        self.writer.close()
+
+
+def make_request(rng, words, mix):
+    kind = rng.choice(mix)
+    if kind == 'lookup':
+        return 'GET', f"/lookup?word={quote(rng.choice(words))}", None
+    if kind == 'complete':
+        return 'GET', f"/complete?prefix={quote(rng.choice(words)[:3])}", None
+    return 'POST', "/lookup", {'words': rng.sample(words, BATCH_SIZE)}
+
+
+async def run_load(host, port, words, connections, total, mix):
+    samples = []
+    errors = 0
+    remaining = [total]
+    rng = random.Random(3)
+
+    async def worker():
+        nonlocal errors
+        client = Client(host, port)
+        await client.connect()
+        try:
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                method, path, payload = make_request(rng, words, mix)
+                began = time.perf_counter()
+                status, _ = await client.request(method, path, payload)
+                samples.append(time.perf_counter() - began)
+                if status != 200:
+                    errors += 1
+        finally:
+            client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    client = Client(host, port)
+    await client.connect()
+    _, metrics = await client.request('GET', "/metrics")
+    client.close()
+    return samples, errors, elapsed, metrics
+
+
+def start_server(workdir, size):
+    database = os.path.join(workdir, "sozluk.db")
+    generate_database(database, size)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'dictionary_cli', '--database', database, 'serve', '--port', '0'],
+        cwd=workdir, stdout=subprocess.PIPE, text=True, env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+    # "Sözlük servisi http://127.0.0.1:PORT adresinde" satırı beklenir
+    line = process.stdout.readline()
+    url = line.split()[2]
+    return process, url, database
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sözlük servisi yük testi")
+    parser.add_argument('--url', help="çalışan servis; verilmezse geçici bir servis başlatılır")
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--connections', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--mix', nargs='+', default=['lookup', 'complete', 'batch'],
+                        choices=['lookup', 'complete', 'batch'])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        if args.url:
+            url = args.url
+            words = [f"word{i}" for i in range(1000)]
+        else:
+            process, url, database = start_server(tmp, args.size)
+            from dictionary_storage import SQLiteStorage
+            storage = SQLiteStorage(database)
+            words = [english for english, _, _ in storage.iterate()]
+            storage.close()
+        parts = urlsplit(url)
+        try:
+            samples, errors, elapsed, metrics = asyncio.run(
+                run_load(parts.hostname, parts.port, words, args.connections, args.requests, args.mix)
+            )
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    stats = summarize(samples)
+    print(f"{len(samples)} istek, {args.connections} bağlantı, {elapsed:.2f} s, "
+          f"{len(samples) / elapsed:.0f} istek/s, {errors} hata")
+    print(f"istemci: p50 {stats['p50_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+          f"p99 {stats['p99_ms']:.2f} ms, en çok {stats['max_ms']:.2f} ms")
+    for name, timing in sorted(metrics['timings'].items()):
+        print(f"servis {name:<16} {timing['count']:>7} istek, p50 {timing['p50_ms']:.3f} ms, "
+              f"p95 {timing['p95_ms']:.3f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
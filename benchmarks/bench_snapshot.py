@@ -0,0 +1,77 @@
+"""Sözlüğün veritabanından ve ikili görüntüden açılma sürelerini karşılaştıran betik.
+
+Her boyut için DictionaryCore.load() üç yoldan ölçülür: veritabanından
+dict, veritabanından CompactDictionary ve görüntü dosyasından mmap. Ayrıca
+görüntünün yazılma süresi ve açılışta yapılan CRC32 kontrolünün payı
+verilir. Yaklaşık arama dizini ölçüme karışmasın diye kurulmaz.
+
+Kullanım:
+    python benchmarks/bench_snapshot.py 100000 1000000
+"""
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import generate_database
+from dictionary_core import DictionaryCore
+
+REPEAT = 3
+
+
+def timed_load(database_file, snapshot_file, compact=False):
+    """En iyi load() süresini ve yüklenen sözlüğün türünü döndür"""
+    best = None
+    kind = None
+    for _ in range(REPEAT):
+        core = DictionaryCore(database_file, snapshot_file=snapshot_file, compact=compact)
+        start = time.perf_counter()
+        core.load(build_fuzzy_index=False)
+        elapsed = time.perf_counter() - start
+        kind = type(core.database).__name__
+        core.wait_for_indexes()
+        core.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, kind
+
+
+def main(sizes):
+    print(f"{'kayıt':>9} {'yol':<22} {'load ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            database_file = os.path.join(tmp, f"sozluk_{size}.db")
+            snapshot_file = os.path.join(tmp, f"sozluk_{size}.snapshot")
+            generate_database(database_file, size)
+
+            for name, compact in (('veritabanı (dict)', False), ('veritabanı (compact)', True)):
+                elapsed, _ = timed_load(database_file, None, compact)
+                print(f"{size:>9} {name:<22} {elapsed * 1000:>10.1f}")
+
+            core = DictionaryCore(database_file, snapshot_file=snapshot_file, compact=True)
+            core.load(build_fuzzy_index=False)
+            core.wait_for_indexes()
+            core._snapshot_source = None
+            start = time.perf_counter()
+            core.save_snapshot()
+            written = time.perf_counter() - start
+            core.close()
+            print(f"{size:>9} {'görüntü yazma':<22} {written * 1000:>10.1f}")
+
+            elapsed, kind = timed_load(database_file, snapshot_file)
+            assert kind == 'CompactDictionary'
+            print(f"{size:>9} {'görüntü (mmap)':<22} {elapsed * 1000:>10.1f}")
+
+            with open(snapshot_file, 'rb') as f:
+                data = f.read()
+            start = time.perf_counter()
+            zlib.crc32(data)
+            crc = time.perf_counter() - start
+            print(f"{size:>9} {'  bunun CRC32 payı':<22} {crc * 1000:>10.1f}"
+                  f"   ({len(data) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,102 @@
+"""Uygulamanın açılış süresini ölçen betik.
+
+Her ölçüm ayrı bir Python sürecinde yapılır; modül içe aktarma süresi,
+pencerenin ilk çizimine kadar geçen süre ve sözlüğün arka planda
+yüklenip butonların açıldığı an raporlanır.
+
+Kullanım:
+    python benchmarks/bench_startup.py [kayıt sayısı] [tekrar]
+"""
+import json
+import os
+import random
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(workdir):
+    """Ölçümü yapan alt süreç; sonucu JSON olarak yazar"""
+    start = time.perf_counter()
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+
+    import dictionary_gui
+    imported = time.perf_counter()
+
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+
+    timings = {'import': imported - start}
+
+    class PaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint' not in timings:
+                timings['first_paint'] = time.perf_counter() - start
+            return False
+
+    app = QApplication([])
+    app.setStyleSheet(dictionary_gui.APP_STYLESHEET)
+    window = dictionary_gui.DictionaryApp()
+    window.installEventFilter(PaintFilter(window))
+    window.show()
+
+    while 'loaded' not in timings:
+        app.processEvents()
+        task = window.load_task
+        if task is not None and not task.is_running() and window.add_button.isEnabled():
+            timings['loaded'] = time.perf_counter() - start
+        time.sleep(0.001)
+    timings['words'] = window.core.count()
+    window.close()
+    print(json.dumps(timings))
+
+
+def generate_database(path, size, seed=0):
+    """Verilen sayıda rastgele kayıt içeren veritabanı oluştur"""
+    sys.path.insert(0, ROOT)
+    from dictionary_storage import SQLiteStorage
+
+    rng = random.Random(seed)
+    storage = SQLiteStorage(path)
+    storage.set_meta('excel_migrated', '1')
+    storage.put_many(
+        (''.join(rng.choice(string.ascii_lowercase) for _ in range(7)) + str(i),
+         ''.join(rng.choice(string.ascii_lowercase) for _ in range(9)),
+         "2024-01-01")
+        for i in range(size)
+    )
+    storage.close()
+
+
+def main(size, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        if size:
+            generate_database(os.path.join(tmp, "sozluk.db"), size)
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', tmp],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+    result = {
+        key: round(statistics.median(run[key] for run in runs) * 1000, 1)
+        for key in ('import', 'first_paint', 'loaded')
+    }
+    result['words'] = runs[0]['words']
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2])
+    else:
+        args = [int(arg) for arg in sys.argv[1:]]
+        main(args[0] if args else 100000, args[1] if len(args) > 1 else 5)
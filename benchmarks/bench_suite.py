@@ -0,0 +1,266 @@
+"""Uygulamanın ana işlemlerini farklı sözlük boyutlarında ölçen betik.
+
+Her boyut ayrı bir Python sürecinde, ekransız (offscreen) Qt ile ve
+sahte bir çevirmenle çalıştırılır; ağ ölçüme karışmaz. İşlemler
+arayüzdeki metotlar üzerinden yürütülür: load_database, save_word,
+search_word, search_meaning, update_word_file ve clear_dictionary.
+
+Kullanım:
+    python benchmarks/bench_suite.py                       # 1k ve 100k kayıt
+    python benchmarks/bench_suite.py --sizes 1000 1000000
+    python benchmarks/bench_suite.py --save-baseline       # baseline.json'a yaz
+    python benchmarks/bench_suite.py --compare             # baseline.json ile karşılaştır
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+DEFAULT_SIZES = [1000, 100000]
+# Karşılaştırmada bu orandan fazla yavaşlama gerileme sayılır; tek
+# örnekli ölçümlerin gürültüsü için çok kısa işlemlerde en az MIN_DELTA_MS
+# fark aranır
+DEFAULT_THRESHOLD = 0.5
+MIN_DELTA_MS = 2.0
+
+ENGLISH_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+TURKISH_LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+# Tekrarlanan işlemlerin örnek sayıları
+SAVE_COUNT = 200
+SEARCH_COUNT = 500
+MISS_COUNT = 100
+REVERSE_COUNT = 200
+
+
+class FakeTranslator:
+    """Ağa çıkmadan sabit sürede cevap veren çevirmen"""
+
+    def translate(self, text):
+        return text[::-1]
+
+    def translate_batch(self, words):
+        return [self.translate(word) for word in words]
+
+
+def random_text(rng, letters, low, high):
+    return ''.join(rng.choice(letters) for _ in range(rng.randint(low, high)))
+
+
+def generate_database(path, size, seed=0):
+    """Rastgele İngilizce kelimeler ve bir ya da birkaç Türkçe anlam üret"""
+    from dictionary_storage import SQLiteStorage
+
+    rng = random.Random(seed)
+    storage = SQLiteStorage(path)
+    storage.set_meta('excel_migrated', '1')
+    storage.put_many(
+        (random_text(rng, ENGLISH_LETTERS, 4, 9) + str(i),
+         ", ".join(random_text(rng, TURKISH_LETTERS, 3, 10) for _ in range(rng.randint(1, 3))),
+         "2024-01-01")
+        for i in range(size)
+    )
+    storage.close()
+
+
+def summarize(samples):
+    """Milisaniye cinsinden gecikme yüzdelikleri ve saniyedeki işlem sayısı"""
+    samples = sorted(samples)
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+
+    total = sum(samples)
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(50) * 1000, 3),
+        'p95_ms': round(percentile(95) * 1000, 3),
+        'p99_ms': round(percentile(99) * 1000, 3),
+        'max_ms': round(samples[-1] * 1000, 3),
+        'ops_per_s': round(len(samples) / total, 1) if total else None,
+    }
+
+
+def peak_memory_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt cinsinden
+    return round(peak / (1024 * 1024 if platform.system() == 'Darwin' else 1024), 1)
+
+
+def child(size, workdir):
+    """Tek bir sözlük boyutu için ölçümleri yapar, sonucu JSON olarak yazar"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+
+    import dictionary_workers
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+
+    # Ağ kontrolü ve iletişim kutuları ölçümü beklemesin
+    dictionary_workers.ConnectivityMonitor.check = lambda self: True
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.Yes)
+    for name in ('information', 'warning', 'critical'):
+        setattr(QMessageBox, name, staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+
+    import dictionary_gui
+
+    generate_database(os.path.join(workdir, "sozluk.db"), size)
+    app = QApplication([])
+
+    def wait_until(condition, timeout=600):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("ölçüm zaman aşımına uğradı")
+            app.processEvents()
+            time.sleep(0.0005)
+
+    results = {}
+    start = time.perf_counter()
+    window = dictionary_gui.DictionaryApp()
+    window.core.translator = FakeTranslator()
+    window.show()
+    wait_until(lambda: window.load_task is not None and not window.load_task.is_running()
+               and window.add_button.isEnabled())
+    results['load_database'] = summarize([time.perf_counter() - start])
+    # Word belgesi yalnızca update_word_file ölçümünde yazılsın
+    window.export_timer.stop()
+    # Arka plandaki dizinler ve ilk sözlük görüntüsü ölçümleri yavaşlatmasın
+    wait_until(lambda: not window.core.index_thread.is_alive())
+
+    rng = random.Random(1)
+    core = window.core
+    words = rng.sample(list(core.database), min(SEARCH_COUNT, size))
+
+    def timed(action, items):
+        samples = []
+        for item in items:
+            began = time.perf_counter()
+            action(item)
+            samples.append(time.perf_counter() - began)
+        return summarize(samples)
+
+    def save(word):
+        window.word_input.setText(word)
+        window.meaning_input.setText(word[::-1])
+        window.save_word()
+
+    results['save_word'] = timed(save, [f"newword{i}" for i in range(SAVE_COUNT)])
+    window.export_timer.stop()
+
+    def search(word):
+        window.word_input.setText(word)
+        window.search_word()
+
+    results['search_word_hit'] = timed(search, words)
+
+    def search_miss(word):
+        # Bulunamayan kelime arka planda çevrilir; sonuç gelene kadar ölçülür
+        search(word)
+        if window.last_fuzzy_word == word and window.translation_worker.current_word != word:
+            search(word)
+        wait_until(lambda: window.translation_worker.current_word is None)
+
+    results['search_word_miss'] = timed(
+        search_miss, [random_text(rng, "qxzj", 12, 14) for _ in range(MISS_COUNT)]
+    )
+
+    meanings = [core.lookup(word).split(",")[0] for word in words[:REVERSE_COUNT]]
+    results['search_meaning'] = timed(window.search_meaning, meanings)
+
+    def export(_):
+        window.update_word_file()
+        wait_until(lambda: not window.export_task.is_running())
+
+    # İlk dışa aktarma belgeyi yazar, ikincisi değişiklik olmadığı için atlanır
+    results['update_word_file'] = timed(export, [None])
+    results['update_word_file_clean'] = timed(export, [None])
+    results['clear_dictionary'] = timed(lambda _: window.clear_dictionary(), [None])
+
+    window.close()
+    print(json.dumps({'size': size, 'peak_rss_mb': peak_memory_mb(), 'operations': results}))
+
+
+def run_size(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', str(size), tmp],
+            check=True, stdout=subprocess.PIPE, text=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_report(runs):
+    print(f"{'kayıt':>9} {'işlem':<24} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'işlem/s':>10}")
+    for run in runs:
+        for name, stats in run['operations'].items():
+            print(f"{run['size']:>9} {name:<24} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+                  f"{stats['p99_ms']:>10.2f} {stats['ops_per_s'] or 0:>10.1f}")
+        print(f"{run['size']:>9} {'en yüksek bellek (MB)':<24} {run['peak_rss_mb']:>10.1f}")
+
+
+def compare(runs, baseline, threshold):
+    """p50 süresi ve bellek baseline'a göre eşikten fazla artan ölçümleri döndür"""
+    previous = {run['size']: run for run in baseline['runs']}
+    regressions = []
+    for run in runs:
+        base = previous.get(run['size'])
+        if base is None:
+            continue
+        for name, stats in run['operations'].items():
+            before = base['operations'].get(name)
+            if (before and stats['p50_ms'] > before['p50_ms'] * (1 + threshold)
+                    and stats['p50_ms'] - before['p50_ms'] > MIN_DELTA_MS):
+                regressions.append((run['size'], name, before['p50_ms'], stats['p50_ms']))
+        if run['peak_rss_mb'] > base['peak_rss_mb'] * (1 + threshold):
+            regressions.append((run['size'], 'peak_rss_mb', base['peak_rss_mb'], run['peak_rss_mb']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sözlük işlemlerinin ölçüm takımı")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="sonuçları baseline olarak kaydet")
+    parser.add_argument('--compare', action='store_true', help="baseline ile karşılaştır")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    runs = [run_size(size) for size in args.sizes]
+    print_report(runs)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'runs': runs,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"Baseline kaydedildi: {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(runs, json.load(f), args.threshold)
+        for size, name, before, after in regressions:
+            print(f"GERİLEME: {size} kayıt, {name}: {before} -> {after}")
+        if regressions:
+            return 1
+        print("Gerileme yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--child']:
+        child(int(sys.argv[2]), sys.argv[3])
+    else:
+        sys.exit(main())
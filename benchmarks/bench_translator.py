@@ -0,0 +1,75 @@
+"""Çeviri sağlayıcısının istek başına maliyetini yerel sahte sunucuyla ölçen betik.
+
+Karşılaştırılanlar:
+    yeni bağlantı   deep_translator gibi her istekte requests.get
+    oturum          GoogleProvider, bağlantılar oturumda tekrar kullanılır
+    devre açık      CircuitBreaker açıkken reddedilen çağrı
+
+Sunucu yerel olduğundan ölçülen fark yalnızca TCP bağlantısı ve oturum
+kurulumudur; gerçek Google isteklerinde TLS el sıkışması da eklenir.
+
+Kullanım:
+    python benchmarks/bench_translator.py [istek sayısı]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import summarize
+from dictionary_translators import (CircuitBreaker, CircuitOpenError, GoogleProvider,
+                                    StubTranslationServer)
+
+
+class NewConnectionProvider(GoogleProvider):
+    """Her istekte yeni oturum açan, deep_translator'a benzer sağlayıcı"""
+
+    @property
+    def session(self):
+        import requests
+        return requests.Session()
+
+
+class FailingProvider(GoogleProvider):
+    def translate(self, text):
+        raise ConnectionError("bağlantı yok")
+
+
+def measure(translate, count):
+    samples = []
+    for i in range(count):
+        began = time.perf_counter()
+        try:
+            translate(f"word{i}")
+        except CircuitOpenError:
+            pass
+        samples.append(time.perf_counter() - began)
+    return summarize(samples)
+
+
+def main(count):
+    server = StubTranslationServer()
+    fresh = NewConnectionProvider(base_url=server.url)
+    pooled = GoogleProvider(base_url=server.url)
+    breaker = CircuitBreaker(FailingProvider(base_url=server.url), threshold=1)
+    try:
+        breaker.translate("word")
+    except ConnectionError:
+        pass
+
+    print(f"{'yol':<16} {'p50 ms':>10} {'p95 ms':>10} {'işlem/s':>10}")
+    for name, provider in (('yeni bağlantı', fresh), ('oturum', pooled), ('devre açık', breaker)):
+        # İlk istek bağlantıyı ve modül yüklemesini ısıtır
+        try:
+            provider.translate("warmup")
+        except CircuitOpenError:
+            pass
+        stats = measure(provider.translate, count)
+        print(f"{name:<16} {stats['p50_ms']:>10.3f} {stats['p95_ms']:>10.3f} {stats['ops_per_s']:>10.1f}")
+    pooled.close()
+    server.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,313 @@
+"""Sözlüğü uygulama içinde gösteren, düzenlenebilir tablo.
+
+Kayıtlar veritabanından sayfa sayfa okunur: tablo yalnızca kaydırıldıkça
+fetchMore() ile bir sonraki sayfayı ister, görünmeyen satırlar için widget
+oluşturulmaz. İngilizce sıralama ve önek filtresi veritabanının birincil
+anahtar indeksinde aralık sorgusuyla, Türkçe filtre ters arama dizininden
+yapılır; hiçbir adımda sözlüğün tamamı okunmaz.
+
+Düzenleme ve silme DictionaryCore.apply_changes() ile doğrudan veritabanına
+ve bellekteki dizinlere yazılır.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QKeySequence
+from PyQt5.QtWidgets import (QAbstractItemView, QComboBox, QDialog, QHBoxLayout, QHeaderView,
+                             QLabel, QLineEdit, QMessageBox, QPushButton, QShortcut, QTableView,
+                             QVBoxLayout)
+
+from dictionary_core import normalize_word
+
+# fetchMore() ile tek seferde okunan kayıt sayısı
+PAGE_SIZE = 500
+
+# Filtre yazılırken sorgunun kaç ms sonra yapılacağı
+FILTER_DELAY_MS = 200
+
+ENGLISH, TURKISH, DATE = range(3)
+HEADERS = ("İngilizce", "Türkçe", "Tarih")
+# Word belgesi ve Excel dosyasıyla aynı renkler
+COLORS = {ENGLISH: QColor(255, 0, 0), TURKISH: QColor(0, 0, 255)}
+
+
+class DictionaryTableModel(QAbstractTableModel):
+    """Sözlük kayıtlarını (ingilizce, türkçe, tarih) satırları olarak sunar"""
+
+    # Model üzerinden sözlük değiştirildi
+    changed = pyqtSignal()
+    # Düzenleme reddedildi ya da başarısız oldu
+    error = pyqtSignal(str)
+
+    def __init__(self, core, parent=None):
+        super().__init__(parent)
+        self.core = core
+        self.rows = []
+        self.prefix = ""
+        self.meaning = ""
+        self.descending = False
+        # Türkçe filtrede eşleşen kelimeler ve bunların kaçının okunduğu
+        self._matches = None
+        self._offset = 0
+        # Veritabanından okunan son kelime; satırlar düzenlense de yalnızca _fetch ilerletir
+        self._cursor = None
+        self._exhausted = False
+        # Modelin gösterdiği sözlük sürümü; dışarıdan değişiklik olursa yenilenir
+        self.revision = core.revision
+        self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole:
+            return COLORS.get(index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return section + 1
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() != DATE:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        rows = self._fetch()
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def _fetch(self):
+        if self._matches is not None:
+            words = self._matches[self._offset:self._offset + PAGE_SIZE]
+            self._offset += len(words)
+            self._exhausted = self._offset >= len(self._matches)
+            return self.core.get_rows(words)
+        rows = self.core.page(self._cursor, PAGE_SIZE, self.prefix, self.descending)
+        self._exhausted = len(rows) < PAGE_SIZE
+        if rows:
+            self._cursor = rows[-1][ENGLISH]
+        return rows
+
+    def refresh(self):
+        """Satırları bırakıp mevcut sıralama ve filtreyle baştan oku"""
+        self.beginResetModel()
+        self.rows = []
+        self._exhausted = False
+        self._offset = 0
+        self._cursor = None
+        self._matches = None
+        if self.meaning:
+            words = [english for english, _ in self.core.reverse_lookup(self.meaning)]
+            prefix = normalize_word(self.prefix)
+            self._matches = sorted(
+                (word for word in words if word.startswith(prefix)), reverse=self.descending
+            )
+        self.revision = self.core.revision
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_filter(self, prefix="", meaning=""):
+        """İngilizce önek ve/veya Türkçe anlamdaki sözcüklere göre süz"""
+        self.prefix = prefix.strip()
+        self.meaning = meaning.strip()
+        self.refresh()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Yalnızca indeksli İngilizce sütuna göre sıralanır
+        if column != ENGLISH:
+            return
+        self.descending = order == Qt.DescendingOrder
+        self.refresh()
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() == DATE:
+            return False
+        english, turkish, _ = self.rows[index.row()]
+        value = value.strip()
+        if index.column() == ENGLISH:
+            new_english, new_turkish = normalize_word(value), turkish
+        else:
+            new_english, new_turkish = english, value
+        if not new_english or not new_turkish:
+            self.error.emit("Kelime ve anlamı boş olamaz!")
+            return False
+        if (new_english, new_turkish) == (english, turkish):
+            return False
+        if new_english != english and self.core.contains(new_english):
+            self.error.emit("Bu kelime zaten sözlükte mevcut!")
+            return False
+        try:
+            removed = [english] if new_english != english else []
+            self.core.apply_changes({new_english: new_turkish}, removed)
+            row = self.core.get_rows([new_english])
+        except Exception as e:
+            self.error.emit(f"Kayıt güncellenirken hata oluştu: {e}")
+            return False
+        self.revision = self.core.revision
+        self.rows[index.row()] = row[0] if row else (new_english, new_turkish, "")
+        self.dataChanged.emit(self.index(index.row(), 0), self.index(index.row(), len(HEADERS) - 1))
+        self.changed.emit()
+        if new_english != english:
+            # Yeni kelime sıralamada başka yere düşer; sayfalar baştan okunur.
+            # Model düzenleyici kapanmadan sıfırlanmasın diye yenileme ertelenir
+            QTimer.singleShot(0, self.refresh)
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self.rows):
+            return False
+        words = [entry[ENGLISH] for entry in self.rows[row:row + count]]
+        try:
+            self.core.apply_changes({}, words)
+        except Exception as e:
+            self.error.emit(f"Kayıt silinirken hata oluştu: {e}")
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.rows[row:row + count]
+        self.endRemoveRows()
+        self.revision = self.core.revision
+        self.changed.emit()
+        return True
+
+
+class DictionaryBrowser(QDialog):
+    """Sözlük tablosu, filtre alanı ve silme/Word belgesi/Excel butonları"""
+
+    # "Word Belgesi" butonuna basıldı
+    document_requested = pyqtSignal()
+    # "Excel Dosyası" butonuna basıldı
+    excel_requested = pyqtSignal()
+
+    def __init__(self, core, parent=None):
+        super().__init__(parent)
+        self.core = core
+        self.setWindowTitle("Sözlük")
+        self.resize(640, 520)
+
+        layout = QVBoxLayout(self)
+        filters = QHBoxLayout()
+        self.mode_combo = QComboBox(self)
+        self.mode_combo.addItems(["İngilizce", "Türkçe"])
+        self.filter_input = QLineEdit(self)
+        self.filter_input.setPlaceholderText("Süzmek için yazın...")
+        self.filter_input.setClearButtonEnabled(True)
+        filters.addWidget(self.mode_combo)
+        filters.addWidget(self.filter_input)
+        layout.addLayout(filters)
+
+        self.model = DictionaryTableModel(core, self)
+        self.model.error.connect(lambda message: QMessageBox.warning(self, "Uyarı", message))
+        self.model.modelReset.connect(self.update_status)
+        self.model.rowsInserted.connect(self.update_status)
+        self.model.rowsRemoved.connect(self.update_status)
+
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+        # Satır yükseklikleri ve sütun genişlikleri içeriğe göre hesaplanmaz;
+        # aksi halde tablo her sayfada tüm satırları ölçerdi
+        vertical = self.table.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(self.fontMetrics().height() + 6)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        self.table.setColumnWidth(ENGLISH, 200)
+        self.table.setColumnWidth(TURKISH, 280)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(ENGLISH, Qt.AscendingOrder)
+        header.sectionClicked.connect(self.sort_clicked)
+        layout.addWidget(self.table)
+
+        bottom = QHBoxLayout()
+        self.status_label = QLabel(self)
+        delete_button = QPushButton("Sil", self)
+        delete_button.clicked.connect(self.delete_selected)
+        document_button = QPushButton("Word Belgesi", self)
+        document_button.clicked.connect(self.document_requested)
+        excel_button = QPushButton("Excel Dosyası", self)
+        excel_button.clicked.connect(self.excel_requested)
+        bottom.addWidget(self.status_label)
+        bottom.addStretch()
+        bottom.addWidget(delete_button)
+        bottom.addWidget(document_button)
+        bottom.addWidget(excel_button)
+        layout.addLayout(bottom)
+
+        QShortcut(QKeySequence.Delete, self.table, self.delete_selected)
+
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(lambda _: self.filter_timer.start())
+        self.mode_combo.currentIndexChanged.connect(lambda _: self.apply_filter())
+
+    def apply_filter(self):
+        self.filter_timer.stop()
+        text = self.filter_input.text()
+        if self.mode_combo.currentIndex() == 0:
+            self.model.set_filter(prefix=text)
+        else:
+            self.model.set_filter(meaning=text)
+
+    def sort_clicked(self, section):
+        header = self.table.horizontalHeader()
+        if section != ENGLISH:
+            # Diğer sütunlar için indeks yok; gösterge İngilizce sütunda kalır
+            header.setSortIndicator(ENGLISH, Qt.DescendingOrder if self.model.descending else Qt.AscendingOrder)
+            return
+        self.model.sort(ENGLISH, header.sortIndicatorOrder())
+
+    def delete_selected(self):
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        if not rows:
+            return
+        reply = QMessageBox.question(
+            self, "Sil", f"{len(rows)} kelime silinecek. Emin misiniz?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        # Ardışık satırlar tek seferde, sondan başa doğru silinir
+        while rows:
+            end = rows.pop()
+            start = end
+            while rows and rows[-1] == start - 1:
+                start = rows.pop()
+            if not self.model.removeRows(start, end - start + 1):
+                break
+
+    def update_status(self):
+        shown = self.model.rowCount()
+        more = "+" if self.model.canFetchMore() else ""
+        self.status_label.setText(f"{self.core.count()} kelime, {shown}{more} gösteriliyor")
+
+    def refresh_if_changed(self):
+        """Sözlük pencere dışında değiştiyse tabloyu yenile"""
+        if self.model.revision != self.core.revision:
+            self.model.refresh()
+
+    def showEvent(self, event):
+        self.refresh_if_changed()
+        super().showEvent(event)
@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+import time
+
+# Varsayılan önbellek sınırları
+MAX_ENTRIES = 10000
+TTL_SECONDS = 30 * 24 * 3600  # Başarılı çeviriler 30 gün geçerli
+NEGATIVE_TTL_SECONDS = 5 * 60  # Başarısız çeviriler 5 dakika sonra tekrar denenir
+
+# get() bu kelimenin çevirisi kısa süre önce başarısız olduysa bunu döndürür
+NEGATIVE = object()
+
+
+class TranslationCache:
+    """Oturumlar arasında kalıcı, boyutu sınırlı çeviri önbelleği.
+
+    Kayıtlar SQLite'ta tutulur; en uzun süredir kullanılmayan kayıtlar
+    sınır aşıldığında silinir. Başarısız çeviriler kısa süreliğine saklanır.
+    """
+
+    def __init__(self, path, max_entries=MAX_ENTRIES, ttl=TTL_SECONDS,
+                 negative_ttl=NEGATIVE_TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "word TEXT PRIMARY KEY, translation TEXT NOT NULL, "
+                "ok INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed)"
+            )
+
+    def get(self, word):
+        """Geçerli bir kayıt varsa çeviriyi, yoksa None döndür.
+
+        Olumsuz kayıtlar için çeviri metni yerine NEGATIVE döner.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation, ok, created FROM translations WHERE word = ?", (word,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            translation, ok, created = row
+            if now - created > (self.ttl if ok else self.negative_ttl):
+                # Süresi dolmuş kayıt
+                with self._conn:
+                    self._conn.execute("DELETE FROM translations WHERE word = ?", (word,))
+                self.misses += 1
+                return None
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE translations SET accessed = ? WHERE word = ?", (now, word)
+                )
+            if not ok:
+                self.negative_hits += 1
+                return NEGATIVE
+            self.hits += 1
+            return translation
+
+    def put(self, word, translation, ok=True):
+        """Çeviriyi kaydet; ok=False ise kısa süreli olumsuz kayıt olarak tutulur"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (word, translation, ok, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (word, translation, int(ok), now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        # Sınır aşıldıysa en uzun süredir kullanılmayan kayıtlar silinir
+        excess = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE word IN "
+                "(SELECT word FROM translations ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    def put_many(self, items):
+        """(kelime, çeviri) çiftlerini tek işlemde başarılı çeviri olarak kaydet"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (word, translation, ok, created, accessed) "
+                "VALUES (?, ?, 1, ?, ?)",
+                ((word, translation, now, now) for word, translation in items),
+            )
+            self._evict()
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM translations")
+
+    def stats(self):
+        """Önbellek sayaçlarını döndür"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            'size': size,
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,188 @@
+"""Kişisel sözlük için komut satırı arayüzü.
+
+Kullanım:
+    python -m dictionary_cli lookup apple
+    python -m dictionary_cli add apple elma
+    python -m dictionary_cli import kelimeler.csv
+    python -m dictionary_cli export sozluk.xlsx
+    python -m dictionary_cli export kartlar.txt --format anki
+    python -m dictionary_cli merge benim.xlsx arkadas.xlsx -o birlesik.xlsx --report fark.csv
+    python -m dictionary_cli merge sozluk.db arkadas.xlsx --apply
+    python -m dictionary_cli stats
+    python -m dictionary_cli serve --port 8765
+"""
+import argparse
+import os
+import sys
+
+from dictionary_core import DictionaryCore, TRANSLATION_FAILED
+from dictionary_export import EXPORTERS
+from dictionary_merge import DEFAULT_RULE, RULES
+from dictionary_translators import PROVIDERS
+
+
+def cmd_lookup(core, args):
+    status = 0
+    for word in args.words:
+        meaning = core.lookup(word)
+        if meaning is not None:
+            print(f"{word}\t{meaning}")
+            continue
+        status = 1
+        if args.translate:
+            try:
+                translation = core.translate(word)
+            except Exception as e:
+                translation = TRANSLATION_FAILED
+                print(f"Çeviri hatası: {e}", file=sys.stderr)
+            print(f"{word}\t{translation}\t(öneri)")
+        else:
+            print(f"{word}\t(sözlükte yok)")
+    return status
+
+
+def cmd_add(core, args):
+    if not core.add(args.word, " ".join(args.meaning)):
+        print("Bu kelime zaten sözlükte mevcut!", file=sys.stderr)
+        return 1
+    print(f"'{args.word.strip().lower()}' kelimesi başarıyla kaydedildi!")
+    return 0
+
+
+def cmd_import(core, args):
+    # Verilmeyen ayarlar için dictionary_import varsayılanları kullanılır
+    options = {
+        'batch_size': args.batch_size,
+        'max_workers': args.workers,
+        'requests_per_second': args.rate,
+    }
+    result = core.import_file(
+        args.path,
+        translate=not args.no_translate,
+        progress=lambda done, total: print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True),
+        **{name: value for name, value in options.items() if value is not None}
+    )
+    print(file=sys.stderr)
+    print(f"Eklenen: {result['added']}, atlanan: {result['skipped']}, çevrilemeyen: {result['failed']}")
+    return 0
+
+
+def cmd_export(core, args):
+    if args.path is None and args.format in (None, 'xlsx'):
+        path = core.export_excel()
+        print(f"Sözlük {path} dosyasına aktarıldı.")
+        return 0
+    if args.path is None:
+        print("Dosya yolu gerekli.", file=sys.stderr)
+        return 2
+    try:
+        count = core.export(args.path, args.format)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(f"{count} kelime {args.path} dosyasına aktarıldı.")
+    return 0
+
+
+def cmd_merge(core, args):
+    from dictionary_merge import merge_files
+    storage = core.storage if args.apply else None
+    summary = merge_files(args.paths, args.output, args.rule, args.report, storage)
+    sources = ", ".join(f"{path}: {count}" for path, count in zip(args.paths, summary['sources']))
+    print(f"Okunan kelimeler: {sources}")
+    targets = [target for target in (args.output and f"{args.output} dosyası",
+                                     args.apply and "sözlük veritabanı") if target]
+    print(f"{summary['entries']} kelime {' ve '.join(targets)} içine yazıldı "
+          f"({summary['added']} yeni, {summary['conflicts']} çakışma).")
+    if args.report is not None:
+        print(f"Çakışmalar {args.report} dosyasına yazıldı.")
+    return 0
+
+
+def cmd_stats(core, args):
+    stats = core.stats()
+    cache = stats['translation_cache']
+    print(f"Kelime sayısı: {stats['words']}")
+    print(f"Çeviri önbelleği: {cache['size']} kayıt")
+    if stats['lexicon'] is not None:
+        print(f"Çevrimdışı sözlük: {stats['lexicon']} kelime")
+    return 0
+
+
+def cmd_serve(core, args):
+    from dictionary_server import serve
+    return serve(core, args.host, args.port)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="dictionary_cli", description="Kişisel İngilizce-Türkçe sözlük")
+    parser.add_argument('--database', default=None, help="Veritabanı dosyası")
+    parser.add_argument('--lexicon', default=None, help="Çevrimdışı sözlük dosyası (TSV)")
+    parser.add_argument('--translator', default=None, choices=sorted(PROVIDERS),
+                        help="Çeviri sağlayıcısı (varsayılan: SOZLUK_TRANSLATOR ya da google)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    lookup = commands.add_parser('lookup', help="Kelimelerin anlamını göster")
+    lookup.add_argument('words', nargs='+')
+    lookup.add_argument('--translate', action='store_true',
+                        help="Sözlükte olmayan kelimeler için çeviri öner")
+    lookup.set_defaults(func=cmd_lookup)
+
+    add = commands.add_parser('add', help="Sözlüğe kelime ekle")
+    add.add_argument('word')
+    add.add_argument('meaning', nargs='+')
+    add.set_defaults(func=cmd_add)
+
+    import_ = commands.add_parser('import', help="Kelime listesi veya CSV dosyasını içe aktar")
+    import_.add_argument('path')
+    import_.add_argument('--batch-size', type=int)
+    import_.add_argument('--workers', type=int)
+    import_.add_argument('--rate', type=float, help="Saniyedeki en fazla çeviri isteği")
+    import_.add_argument('--no-translate', action='store_true',
+                         help="Anlamı olmayan kelimeleri çevirmeden atla")
+    import_.set_defaults(func=cmd_import)
+
+    export = commands.add_parser('export', help="Sözlüğü Excel, CSV, JSONL, Anki veya Word dosyasına aktar")
+    export.add_argument('path', nargs='?', default=None)
+    export.add_argument('--format', choices=sorted(EXPORTERS), default=None,
+                        help="verilmezse dosya uzantısından anlaşılır")
+    export.set_defaults(func=cmd_export)
+
+    merge = commands.add_parser('merge', help="Sözlük dosyalarını (xlsx, csv, jsonl, db) birleştir")
+    merge.add_argument('paths', nargs='+', metavar='path', help="ilk dosya yerel kopya sayılır")
+    merge.add_argument('-o', '--output', help="biçim dosya uzantısından anlaşılır; .db SQLite sözlüğüne yazar")
+    merge.add_argument('--apply', action='store_true',
+                       help="sonucu kullanılan sözlük veritabanına işle (var olan anlamlar değiştirilir)")
+    merge.add_argument('--rule', choices=RULES, default=DEFAULT_RULE,
+                       help="çakışmada: newest en yeni tarih, both iki anlam da, local yerel kopya")
+    merge.add_argument('--report', help="çakışmaların yazılacağı CSV fark raporu")
+    merge.set_defaults(func=cmd_merge)
+
+    stats = commands.add_parser('stats', help="Sözlük istatistiklerini göster")
+    stats.set_defaults(func=cmd_stats)
+
+    serve = commands.add_parser('serve', help="Sözlüğü yerel HTTP/JSON servisi olarak sun")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765, help="0 verilirse boş bir port seçilir")
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    options = {name: value for name, value in
+               (('database_file', args.database), ('lexicon_file', args.lexicon),
+                ('translator_name', args.translator),
+                ('compact', os.environ.get('SOZLUK_COMPACT') == '1')) if value}
+    core = DictionaryCore(**options)
+    try:
+        return args.func(core, args)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    finally:
+        core.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Çok büyük sözlükler için düşük bellekli sözlük yapısı.
+
+Kelimeler ve anlamlar UTF-8 olarak iki bitişik bayt dizisinde, başlangıç
+konumları birer array içinde tutulur. Kelimeler sıralı olduğundan arama
+ikili aramayla yapılır; kayıt başına Python nesnesi oluşturulmaz. Sonradan
+eklenen ve silinen kayıtlar küçük bir ek sözlükte tutulur, ek sözlük
+büyüyünce yapı yeniden kurulur.
+
+benchmarks/bench_compact.py ile ölçülen değerler (Python 3.11, 1 çekirdek,
+bench_suite'in rastgele verisi; bellek tracemalloc ile, kurulum sonrası):
+
+    kayıt   yapı     kurulum   bellek    en yüksek  kayıt başı  isabetli  isabetsiz
+    100k    dict     0.29 s    19.7 MB   19.7 MB    197 B       0.17 µs   0.08 µs
+    100k    compact  0.82 s     4.1 MB    5.7 MB     41 B       5.2 µs    4.6 µs
+    1M      dict     2.96 s   190.0 MB  190.0 MB    190 B       0.46 µs   0.19 µs
+    1M      compact  8.14 s    39.0 MB   55.4 MB     39 B       6.5 µs    5.9 µs
+
+Bellek yaklaşık 5 kat azalırken kurulum ~2.7 kat, tek arama 15-30 kat
+yavaşlar; arayüzdeki bir arama için bu fark hissedilmez. Yaklaşık arama
+ve ters arama dizinleri kelimelerin str kopyalarını tuttuğundan çok büyük
+sözlüklerde asıl belleği onlar kullanır.
+"""
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+# Ek sözlük ana yapının bu oranını aşınca yapı yeniden kurulur
+REBUILD_RATIO = 0.1
+REBUILD_MIN = 1024
+
+
+class _KeyView:
+    """Bayt dizisindeki i. kelimeyi bisect için dizi gibi gösterir"""
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]]
+
+
+def _pack_offsets(offsets):
+    # Toplam boyut 4 GB'ın altındaysa konumlar 4 baytta tutulur
+    if offsets[-1] < 2 ** 32:
+        return array('I', offsets)
+    return offsets
+
+
+class CompactDictionary:
+    """{ingilizce: türkçe} sözlüğünün get/in/len/yineleme arayüzünü sunan sıkışık yapı.
+
+    presorted=True verilirse kayıtların kelimeye göre sıralı geldiği
+    varsayılır (SQLiteStorage.iterate böyle döndürür) ve sıralama atlanır.
+    """
+
+    def __init__(self, items=(), presorted=False):
+        self._mapping = None
+        if not presorted:
+            items = sorted(items)
+        self._build(items)
+
+    @classmethod
+    def from_buffers(cls, keys, key_offsets, values, value_offsets, mapping=None):
+        """Hazır bayt ve konum dizilerinden (ör. mmap ile açılmış dosya) yapı kur.
+
+        Konumlar doğrudan `keys` ve `values` içindeki mutlak konumlardır.
+        `mapping` verilirse close() ile kapatılır.
+        """
+        store = cls.__new__(cls)
+        store._mapping = mapping
+        store._set_buffers(keys, key_offsets, values, value_offsets)
+        return store
+
+    def _build(self, items):
+        keys = bytearray()
+        values = bytearray()
+        key_offsets = array('Q', [0])
+        value_offsets = array('Q', [0])
+        previous = None
+        for key, value in items:
+            encoded = key.encode('utf-8')
+            if previous is not None and encoded <= previous:
+                raise ValueError(f"Kayıtlar sıralı ve tekil olmalı: {key!r}")
+            previous = encoded
+            keys += encoded
+            values += value.encode('utf-8')
+            key_offsets.append(len(keys))
+            value_offsets.append(len(values))
+
+        # bytes() kopyası kurulumdaki en yüksek belleği ikiye katlardı
+        self._set_buffers(keys, _pack_offsets(key_offsets), values, _pack_offsets(value_offsets))
+
+    def _set_buffers(self, keys, key_offsets, values, value_offsets):
+        self._keys = _KeyView(keys, key_offsets)
+        self._values = values
+        self._value_offsets = value_offsets
+        self._added = {}
+        self._deleted = set()
+        self._length = len(self._keys)
+
+    def _find(self, key):
+        """Kelimenin ana yapıdaki sırasını, yoksa -1 döndür"""
+        encoded = key.encode('utf-8')
+        i = bisect_left(self._keys, encoded)
+        if i < len(self._keys) and self._keys[i] == encoded:
+            return i
+        return -1
+
+    def _value(self, i):
+        return self._values[self._value_offsets[i]:self._value_offsets[i + 1]].decode('utf-8')
+
+    def _base_items(self, start=0):
+        # Yineleme sürerken yapı yeniden kurulursa eski diziler kullanılmaya devam eder
+        keys, values, value_offsets = self._keys, self._values, self._value_offsets
+        for i in range(start, len(keys)):
+            yield (keys[i].decode('utf-8'),
+                   values[value_offsets[i]:value_offsets[i + 1]].decode('utf-8'))
+
+    def get(self, key, default=None):
+        value = self._added.get(key)
+        if value is not None:
+            return value
+        if key in self._deleted:
+            return default
+        i = self._find(key)
+        return default if i < 0 else self._value(i)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return self._length
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._length += 1
+        self._added[key] = value
+        self._deleted.discard(key)
+        self._maybe_rebuild()
+
+    def pop(self, key, default=None):
+        value = self.get(key)
+        if value is None:
+            return default
+        self._added.pop(key, None)
+        if self._find(key) >= 0:
+            self._deleted.add(key)
+        self._length -= 1
+        self._maybe_rebuild()
+        return value
+
+    def __delitem__(self, key):
+        if self.pop(key) is None:
+            raise KeyError(key)
+
+    def clear(self):
+        self._build(())
+
+    def items(self, start=0):
+        """(kelime, anlam) çiftlerini alfabetik sırayla döndür"""
+        added = sorted(self._added.items())
+        base = (
+            (key, value) for key, value in self._base_items(start)
+            if key not in self._deleted and key not in self._added
+        )
+        return merge(base, added)
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return (value for _, value in self.items())
+
+    def complete(self, prefix, limit=10):
+        """Önekle başlayan ilk `limit` kelimeyi alfabetik sırayla döndür"""
+        if not prefix:
+            return []
+        start = bisect_left(self._keys, prefix.encode('utf-8'))
+        result = []
+        for key, _ in self.items(start):
+            if len(result) >= limit:
+                break
+            if key.startswith(prefix):
+                result.append(key)
+            elif key > prefix:
+                break
+        return result
+
+    def buffers(self):
+        """Ek sözlük dahil tüm kayıtları (kelimeler, kelime konumları, anlamlar,
+        anlam konumları) olarak döndür; konumlar 0'dan başlar.
+
+        Ek sözlük arasındaki kayıtlar tek tek çözülmeden blok olarak
+        kopyalanır, bu yüzden büyük yapılarda items() ile yeniden kurmaktan
+        çok daha hızlıdır.
+        """
+        keys, values = self._keys, self._values
+        key_offsets, value_offsets = keys.offsets, self._value_offsets
+        count = len(keys)
+
+        # Ana yapıdan atlanacak sıralar ve sıralara göre araya girecek kayıtlar
+        skipped = set()
+        inserts = {}
+        for key in self._deleted:
+            i = self._find(key)
+            if i >= 0:
+                skipped.add(i)
+        for key, value in sorted(self._added.items()):
+            encoded = key.encode('utf-8')
+            i = bisect_left(keys, encoded)
+            if i < count and keys[i] == encoded:
+                skipped.add(i)
+            inserts.setdefault(i, []).append((encoded, value.encode('utf-8')))
+
+        out_keys, out_values = bytearray(), bytearray()
+        out_key_offsets, out_value_offsets = array('Q', [0]), array('Q', [0])
+
+        def copy(start, end):
+            if start >= end:
+                return
+            key_shift = len(out_keys) - key_offsets[start]
+            value_shift = len(out_values) - value_offsets[start]
+            out_keys.extend(keys.data[key_offsets[start]:key_offsets[end]])
+            out_values.extend(values[value_offsets[start]:value_offsets[end]])
+            out_key_offsets.extend(key_offsets[i] + key_shift for i in range(start + 1, end + 1))
+            out_value_offsets.extend(value_offsets[i] + value_shift for i in range(start + 1, end + 1))
+
+        position = 0
+        for cut in sorted(skipped | set(inserts)):
+            copy(position, cut)
+            for encoded, value in inserts.get(cut, ()):
+                out_keys.extend(encoded)
+                out_values.extend(value)
+                out_key_offsets.append(len(out_keys))
+                out_value_offsets.append(len(out_values))
+            position = cut + 1 if cut in skipped else cut
+        copy(position, count)
+        return out_keys, out_key_offsets, out_values, out_value_offsets
+
+    def close(self):
+        """mmap ile açılmış dosyayı bırak; yapı bundan sonra kullanılamaz"""
+        if self._mapping is None:
+            return
+        for offsets in (self._keys.offsets, self._value_offsets):
+            if isinstance(offsets, memoryview):
+                offsets.release()
+        self._mapping.close()
+        self._mapping = None
+
+    def nbytes(self):
+        """Ana yapının bayt dizileri ve konum dizileri için kullandığı bellek"""
+        return (len(self._keys.data) + len(self._values)
+                + self._keys.offsets.itemsize * len(self._keys.offsets)
+                + self._value_offsets.itemsize * len(self._value_offsets))
+
+    def _maybe_rebuild(self):
+        if len(self._added) + len(self._deleted) > max(REBUILD_MIN, len(self._keys) * REBUILD_RATIO):
+            keys, key_offsets, values, value_offsets = self.buffers()
+            self._set_buffers(keys, _pack_offsets(key_offsets), values, _pack_offsets(value_offsets))
@@ -0,0 +1,602 @@
+"""Arayüzden bağımsız sözlük motoru.
+
+Depolama, arama dizinleri, çeviri ve dışa aktarma burada toplanır; PyQt
+arayüzü ve komut satırı aynı çekirdeği kullanır. Ağır bağımlılıklar
+(openpyxl, requests) yalnızca ilk kullanıldıklarında yüklenir.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from dictionary_cache import NEGATIVE, TranslationCache
+from dictionary_compact import CompactDictionary
+from dictionary_diagnostics import diagnostics
+from dictionary_export import INVALID_XML_CHARS, content_hash, export_docx, export_entries, export_xlsx
+from dictionary_index import FuzzyIndex, PrefixIndex, ReverseIndex
+from dictionary_lexicon import LEXICON_FILE, Lexicon
+from dictionary_snapshot import open_snapshot, write_snapshot
+from dictionary_translators import CircuitOpenError, TranslationError, create_translator
+from dictionary_storage import DATABASE_FILE, SQLiteStorage, iter_rows, migrate_from_excel
+
+EXCEL_FILE = "Personal_Dictionary.xlsx"
+DOCX_FILE = "Personal_Dictionary.docx"
+CACHE_FILE = "ceviri_onbellegi.db"
+SNAPSHOT_FILE = "sozluk.snapshot"
+
+# Çeviri başarısız olduğunda dönen metin
+TRANSLATION_FAILED = "çeviri yapılamadı"
+
+
+class RecentlyFailedError(TranslationError):
+    """Kelimenin çevirisi kısa süre önce başarısız oldu; yeniden denenmedi"""
+
+
+class DictionaryCore:
+    """Kişisel sözlüğün tüm işlemleri.
+
+    load() çağrılmadan da kelime arama, ekleme ve istatistik doğrudan
+    veritabanı üzerinden çalışır; load() sözlüğü belleğe alır ve arama
+    dizinlerini kurar. compact=True ile sözlük dict yerine daha az bellek
+    kullanan CompactDictionary olarak tutulur. snapshot_file verilirse
+    sözlüğün ikili görüntüsü tutulur ve sonraki açılışlar ondan yapılır;
+    None görüntüyü kapatır. lexicon_file dosyası varsa çeviriler önce bu
+    çevrimdışı sözlükte aranır. translator verilmezse translator_name ile
+    seçilen sağlayıcı (bkz. dictionary_translators) kullanılır.
+    """
+
+    def __init__(self, database_file=DATABASE_FILE, excel_file=EXCEL_FILE,
+                 cache_file=CACHE_FILE, docx_file=DOCX_FILE, translator=None, compact=False,
+                 snapshot_file=SNAPSHOT_FILE, lexicon_file=LEXICON_FILE, translator_name=None):
+        self.compact = compact
+        self.snapshot_file = snapshot_file
+        self.lexicon_file = lexicon_file
+        self.excel_file = excel_file
+        self.docx_file = docx_file
+        self.cache_file = cache_file
+        self._storage = SQLiteStorage(database_file)
+        self._migrated = False
+        self._migrate_lock = threading.Lock()
+        self._excel_lock = threading.Lock()
+        self._translator = translator
+        self.translator_name = translator_name
+        self._translation_cache = None
+        self._lexicon = None
+        self._lexicon_lock = threading.Lock()
+        self.lexicon_hits = 0
+        self.database = None
+        self.prefix_index = PrefixIndex()
+        self.reverse_index = ReverseIndex()
+        self.fuzzy_index = FuzzyIndex()
+        self.index_thread = None
+        self._closing = threading.Event()
+        # load() ve clear() artırır; arka planda eski sözlükten doldurulan dizinler bırakılır
+        self._index_generation = 0
+        # Yüklenen sözlüğün veritabanı sürümü ve o andaki kendi yazma sayımız
+        self._loaded_source = None
+        self._snapshot_source = None
+        # Sözlük her değiştiğinde artar; dışa aktarmanın güncel olup olmadığını gösterir
+        self.revision = 0
+        self._exported_revisions = {}
+
+    @property
+    def translator(self):
+        if self._translator is None:
+            self._translator = create_translator(self.translator_name)
+        return self._translator
+
+    @translator.setter
+    def translator(self, translator):
+        self._translator = translator
+
+    @property
+    def translation_cache(self):
+        if self._translation_cache is None:
+            self._translation_cache = TranslationCache(self.cache_file)
+        return self._translation_cache
+
+    @property
+    def lexicon(self):
+        """Çevrimdışı sözlük; dosya yoksa None. İlk kullanımda yüklenir."""
+        if self._lexicon is None and self.lexicon_file and os.path.exists(self.lexicon_file):
+            with self._lexicon_lock:
+                if self._lexicon is None:
+                    self._lexicon = Lexicon.from_file(self.lexicon_file)
+        return self._lexicon
+
+    @property
+    def loaded(self):
+        return self.database is not None
+
+    @property
+    def storage(self):
+        """Sözlük deposu; ilk erişimde eski Excel sözlüğü bir kez aktarılır.
+
+        Komut satırı gibi load() çağırmayan kullanımlar da aktarılmış
+        sözlüğü görür; aktarma yapıldıktan sonra maliyeti tek meta okumasıdır.
+        """
+        if not self._migrated:
+            self.migrate()
+        return self._storage
+
+    def migrate(self):
+        """İlk çalıştırmada eski Excel sözlüğünü veritabanına aktar"""
+        with self._migrate_lock:
+            if self._migrated:
+                return 0
+            count = migrate_from_excel(self._storage, self.excel_file)
+            self._migrated = True
+            return count
+
+    @diagnostics.timed('load_database')
+    def load(self, build_fuzzy_index=True):
+        """Sözlüğü belleğe al ve arama dizinlerini kur.
+
+        Veritabanı son görüntüden beri değişmediyse sözlük görüntü dosyasından
+        mmap ile açılır, kayıtlar tek tek okunmaz. Arka plan iş parçacığında
+        çağrılabilir; dizinler hazır olana kadar eski durum korunur. Ters
+        arama ve yaklaşık arama dizinleri büyük sözlüklerde uzun sürdüğü için
+        ayrıca arka planda doldurulur.
+        """
+        self.migrate()
+        # Sürüm kayıtlardan önce okunur; arada yapılan bir yazma görüntüyü
+        # yalnızca eskitir, yanlış etiketlemez
+        source = self.storage.version()
+        writes = self.storage.writes
+        database = open_snapshot(self.snapshot_file, source) if self.snapshot_file else None
+        from_snapshot = database is not None
+        if database is None and self.compact:
+            # Kayıtlar veritabanından sıralı geldiği için ara dict kurulmaz
+            database = CompactDictionary(
+                ((english, turkish) for english, turkish, _ in self.storage.iterate()), presorted=True
+            )
+        elif database is None:
+            database = self.storage.load()
+        if isinstance(database, CompactDictionary):
+            # Sıralı yapı önek sorgularını da karşılar
+            prefix_index = database
+            entries = database.items()
+        else:
+            prefix_index = PrefixIndex(database)
+            entries = list(database.items())
+        reverse_index = ReverseIndex()
+        fuzzy_index = FuzzyIndex()
+        self.prefix_index, self.reverse_index, self.fuzzy_index = prefix_index, reverse_index, fuzzy_index
+        self._loaded_source = (source, writes)
+        self._snapshot_source = source if from_snapshot else None
+        self.database = database
+        self._index_generation += 1
+        self.index_thread = threading.Thread(
+            target=self._build_indexes,
+            args=(entries, reverse_index, fuzzy_index if build_fuzzy_index else None, not from_snapshot,
+                  database, self._index_generation),
+            daemon=True,
+        )
+        self.index_thread.start()
+        return database
+
+    def _build_indexes(self, entries, reverse_index, fuzzy_index, save_snapshot, database, generation):
+        words = []
+
+        def stale():
+            # Kapanırken eşlenmiş dosya bırakılmadan önce, sözlük yeniden
+            # yüklenir ya da temizlenirse hemen durulur
+            return self._closing.is_set() or generation != self._index_generation
+
+        def collect():
+            for english, turkish in entries:
+                if stale():
+                    return
+                # Bu arada silinen kelimeler dizinlere geri eklenmez
+                if english in database:
+                    words.append(english)
+                    yield english, turkish
+
+        reverse_index.add_many(collect())
+        if fuzzy_index is not None and not stale():
+            fuzzy_index.add_many(word for word in words if not stale() and word in database)
+        if save_snapshot and not stale():
+            try:
+                self.save_snapshot()
+            except sqlite3.Error:
+                # Uygulama kapanırken veritabanı bağlantısı kapatılmış olabilir
+                pass
+
+    def wait_for_indexes(self, timeout=None):
+        """Arka planda kurulan dizinler (ve ilk görüntü) bitene kadar bekle"""
+        if self.index_thread is not None:
+            self.index_thread.join(timeout)
+            return not self.index_thread.is_alive()
+        return True
+
+    def save_snapshot(self, release=False):
+        """Sözlüğün ikili görüntüsünü yaz; yazıldıysa True döndür.
+
+        Yüklemeden beri veritabanına başka bir süreç yazdıysa bellekteki
+        sözlük eksik olabileceğinden görüntü yazılmaz. release=True ise
+        mmap ile açık eski görüntü dosya değiştirilmeden önce kapatılır;
+        bundan sonra bellekteki sözlük kullanılamaz.
+        """
+        if not self.snapshot_file or not self.loaded:
+            return False
+        (database_id, version), writes = self._loaded_source
+        current = self.storage.version()
+        if current == self._snapshot_source:
+            return False
+        if current != (database_id, version + self.storage.writes - writes):
+            return False
+        database = self.database
+        if not isinstance(database, CompactDictionary):
+            database = CompactDictionary(
+                ((english, turkish) for english, turkish, _ in self.storage.iterate()), presorted=True
+            )
+        try:
+            write_snapshot(self.snapshot_file, database, current,
+                           release=self.database.close if release and database is self.database else None)
+        except (OSError, RuntimeError) as e:
+            print(f"Sözlük görüntüsü yazılamadı: {e}")
+            return False
+        self._snapshot_source = current
+        return True
+
+    def count(self):
+        return len(self.database) if self.loaded else self.storage.count()
+
+    def contains(self, word):
+        return self.lookup(word) is not None
+
+    def lookup(self, word):
+        """Kelimenin sözlükteki anlamını, yoksa None döndür"""
+        word = normalize_word(word)
+        if self.loaded:
+            return self.database.get(word)
+        return self.storage.get(word)
+
+    def complete(self, prefix, limit=10):
+        return self.prefix_index.complete(normalize_word(prefix), limit)
+
+    def suggest(self, word, limit=5):
+        """Kelimeye yakın kayıtları (kelime, anlam) olarak döndür"""
+        result = []
+        for _, match in self.fuzzy_index.lookup(normalize_word(word), limit):
+            # Dizin arka planda dolarken silinmiş kayıtlar atlanır
+            meaning = self.lookup(match)
+            if meaning is not None:
+                result.append((match, meaning))
+        return result
+
+    def reverse_lookup(self, meaning):
+        """Türkçe anlamdan (ingilizce, anlam) kayıtlarını bul"""
+        result = []
+        for english in self.reverse_index.lookup(meaning):
+            # Dizin arka planda dolarken silinmiş kayıtlar atlanır
+            turkish = self.lookup(english)
+            if turkish is not None:
+                result.append((english, turkish))
+        return result
+
+    def page(self, after=None, limit=500, prefix="", descending=False):
+        """Kayıtları (ingilizce, türkçe, tarih) olarak veritabanından sayfa sayfa döndür"""
+        return self.storage.page(after, limit, normalize_word(prefix), descending)
+
+    def get_rows(self, words):
+        """Kelimelerin (ingilizce, türkçe, tarih) kayıtlarını verilen sırayla döndür"""
+        return self.storage.get_rows(words)
+
+    def add(self, word, meaning, date=None):
+        """Yeni kelime ekle; kelime zaten varsa False döndür"""
+        word = normalize_word(word)
+        meaning = meaning.strip()
+        if not word or not meaning:
+            raise ValueError("Kelime ve anlamı boş olamaz!")
+        if self.contains(word):
+            return False
+        self.storage.put(word, meaning, date or datetime.now().strftime("%Y-%m-%d"))
+        self.revision += 1
+        self.index_entry(word, meaning)
+        return True
+
+    def index_entry(self, word, meaning):
+        """Depoya yazılmış kaydı bellekteki sözlüğe ve dizinlere ekle"""
+        if not self.loaded:
+            return
+        self.database[word] = meaning
+        if self.prefix_index is not self.database:
+            self.prefix_index.add(word)
+        self.fuzzy_index.add(word)
+        self.reverse_index.add(word, meaning)
+
+    def unindex_entry(self, word):
+        """Silinen kaydı bellekteki sözlükten ve dizinlerden çıkar"""
+        if not self.loaded:
+            return
+        meaning = self.database.pop(word, None)
+        if meaning is None:
+            return
+        if self.prefix_index is not self.database:
+            self.prefix_index.remove(word)
+        self.fuzzy_index.remove(word)
+        self.reverse_index.remove(word, meaning)
+
+    def read_excel(self, path=None):
+        """Excel dosyasındaki kayıtları {ingilizce: türkçe} olarak oku, dosya yoksa boş döndür"""
+        path = path or self.excel_file
+        if not os.path.exists(path):
+            return {}
+        entries = {}
+        for english, turkish, _ in iter_rows(path):
+            turkish = turkish.strip()
+            if english and turkish:
+                entries[english] = turkish
+        return entries
+
+    def read_excel_changes(self):
+        """Excel dosyası son okunduğundan beri değiştiyse (değişen, silinen, taban) döndür.
+
+        Dosyanın boyutu ve değiştirilme zamanı ile satır özetleri meta
+        tablosunda tutulur; dosya değişmediyse okunmaz ve None döner. Taban
+        yoksa yalnızca taban oluşturulur. Arka plan iş parçacığında
+        çağrılabilir; değişiklikler işlendikten sonra taban
+        save_excel_baseline ile kaydedilmelidir.
+        """
+        path = self.excel_file
+        if not os.path.exists(path):
+            return None
+        stat_key, rows_key = self._excel_baseline_keys()
+        signature = json.dumps(_file_signature(path))
+        saved = self.storage.get_meta(stat_key)
+        if saved == signature:
+            return None
+
+        entries = self.read_excel(path)
+        rows = {english: _row_hash(turkish) for english, turkish in entries.items()}
+        baseline = (saved, signature, rows)
+        old = self.storage.get_meta(rows_key)
+        if saved is None or old is None:
+            return {}, [], baseline
+        old = json.loads(old)
+        changed = {english: turkish for english, turkish in entries.items() if old.get(english) != rows[english]}
+        removed = [english for english in old if english not in rows]
+        return changed, removed, baseline
+
+    def save_excel_baseline(self, baseline):
+        previous, signature, rows = baseline
+        with self._excel_lock:
+            # Okuma sürerken dosya uygulama tarafından yeniden yazıldıysa onun tabanı korunur
+            if self.storage.get_meta(self._excel_baseline_keys()[0]) == previous:
+                self._set_excel_baseline(signature, rows)
+
+    def _excel_baseline_keys(self):
+        path = os.path.abspath(self.excel_file)
+        return 'excel_stat:' + path, 'excel_rows:' + path
+
+    def _set_excel_baseline(self, signature, rows):
+        stat_key, rows_key = self._excel_baseline_keys()
+        # Özetler önce yazılır; arada kesilirse dosya bir kez daha okunur
+        self.storage.set_meta(rows_key, json.dumps(rows))
+        self.storage.set_meta(stat_key, signature)
+
+    def _write_excel(self, rows):
+        """Excel dosyasını yaz; yazılan hali eşitleme tabanı olur"""
+        hashes = {}
+
+        def record():
+            for english, turkish, date in rows:
+                # read_excel ile aynı biçimde özetlenir
+                meaning = INVALID_XML_CHARS.sub('', turkish).strip()
+                if meaning:
+                    hashes[english] = _row_hash(meaning)
+                yield english, turkish, date
+
+        with self._excel_lock:
+            export_xlsx(record(), self.excel_file)
+            self._set_excel_baseline(json.dumps(_file_signature(self.excel_file)), hashes)
+
+    def apply_changes(self, changed, removed):
+        """Dışarıda yapılan değişiklikleri veritabanına ve dizinlere işle.
+
+        Sözlükte zaten aynı olan kayıtlar atlanır; (güncellenen, silinen)
+        kayıt sayılarını döndürür. Dizinler güncellendiği için ana iş
+        parçacığında çağrılmalıdır.
+        """
+        changed = {word: meaning for word, meaning in changed.items() if self.lookup(word) != meaning}
+        removed = [word for word in removed if word not in changed and self.contains(word)]
+        if not changed and not removed:
+            return 0, 0
+        date = datetime.now().strftime("%Y-%m-%d")
+        if changed:
+            self.storage.put_many((word, meaning, date) for word, meaning in changed.items())
+        if removed:
+            self.storage.delete_many(removed)
+        self.revision += 1
+        for word in removed:
+            self.unindex_entry(word)
+        for word, meaning in changed.items():
+            self.unindex_entry(word)
+            self.index_entry(word, meaning)
+        return len(changed), len(removed)
+
+    def clear(self):
+        """Sözlüğü tamamen temizle"""
+        self.storage.clear()
+        self.revision += 1
+        if os.path.exists(self.excel_file):
+            # Dışa aktarılmış Excel dosyasını da boşalt
+            self._write_excel(())
+        if self.loaded:
+            self.database.clear()
+        if self.prefix_index is not self.database:
+            self.prefix_index.clear()
+        # Arka planda dolan dizinler durdurulur; geç gelen eklemeler eski
+        # nesnelere gider, yenileri boş başlar
+        self._index_generation += 1
+        self.fuzzy_index = FuzzyIndex()
+        self.reverse_index = ReverseIndex()
+
+    def cached_translation(self, word):
+        """Önbellekteki çeviriyi; yoksa None, kısa süre önce başarısız olduysa NEGATIVE döndür"""
+        return self.translation_cache.get(normalize_word(word))
+
+    def lexicon_translation(self, word):
+        """Kelimenin çevrimdışı sözlükteki karşılığını, yoksa None döndür"""
+        lexicon = self.lexicon
+        if lexicon is None:
+            return None
+        translation = lexicon.get(normalize_word(word))
+        if translation is not None:
+            self.lexicon_hits += 1
+            diagnostics.count('lexicon_hits')
+        return translation
+
+    def offline_translation(self, word):
+        """Ağa çıkmadan bulunabilen çeviriyi (önbellek ya da çevrimdışı sözlük) döndür"""
+        translation = self.cached_translation(word)
+        # Başarısız çeviri öneri olarak gösterilmez, çevrimdışı sözlüğe bakılır
+        if translation is None or translation is NEGATIVE:
+            translation = self.lexicon_translation(word)
+        return translation
+
+    def translate(self, word):
+        """Önce önbelleğe ve çevrimdışı sözlüğe bak, yoksa çevirmeni kullan.
+
+        Çevirmen hatası kısa süreliğine önbelleğe alınır ve istisna
+        olarak yükseltilir; bu süre içinde kelime yeniden denenmez,
+        RecentlyFailedError yükseltilir.
+        """
+        word = normalize_word(word)
+        cached = self.cached_translation(word)
+        if cached is not None and cached is not NEGATIVE:
+            return cached
+        translation = self.lexicon_translation(word)
+        if translation is not None:
+            return translation
+        if cached is NEGATIVE:
+            raise RecentlyFailedError(TRANSLATION_FAILED)
+        try:
+            translation = self.translator.translate(word)
+        except CircuitOpenError:
+            # Kelime denenmedi, olumsuz kayıt bırakılmaz
+            raise
+        except Exception:
+            # Hata kısa süreliğine saklanır, sonra tekrar denenir
+            self.translation_cache.put(word, TRANSLATION_FAILED, ok=False)
+            raise
+        self.translation_cache.put(word, translation)
+        return translation
+
+    def import_file(self, path, translate=True, progress=None, index=True, **options):
+        """Kelime listesi veya CSV dosyasını içe aktar.
+
+        Zaten olan kelimeler veritabanında aranır; arka plan iş
+        parçacığında çalışırken bellekteki sözlüğe dokunulmaz. Bu durumda
+        index=False verilip eklenen kayıtlar ana iş parçacığında
+        index_entry ile dizinlere işlenmelidir.
+        """
+        from dictionary_import import bulk_import, translate_lines
+        translate_func = None
+        if translate:
+            translator = self.translator
+
+            def translate_func(words, limiter):
+                # Önbellekte ve çevrimdışı sözlükte bulunanlar için istek atılmaz
+                translations = [self.offline_translation(word) for word in words]
+                missing = [word for word, translation in zip(words, translations) if translation is None]
+                if missing:
+                    fetched = translate_lines(translator, missing, limiter)
+                    self.translation_cache.put_many(
+                        (word, translation) for word, translation in zip(missing, fetched) if translation
+                    )
+                    fetched = iter(fetched)
+                    translations = [translation if translation is not None else next(fetched)
+                                    for translation in translations]
+                return translations
+        result = bulk_import(self.storage, path, translate_func, progress=progress, **options)
+        if result['added']:
+            self.revision += 1
+        if index:
+            for word, meaning in result['entries']:
+                self.index_entry(word, meaning)
+        return result
+
+    def export_excel(self, path=None):
+        """Sözlüğü Excel dosyasına aktar ve dosya yolunu döndür"""
+        path = path or self.excel_file
+        if os.path.abspath(path) == os.path.abspath(self.excel_file):
+            self._write_excel(self.storage.iterate())
+        else:
+            export_xlsx(self.storage.iterate(), path)
+        return path
+
+    def export(self, path, format=None):
+        """Sözlüğü alfabetik sırayla csv, jsonl, anki, xlsx ya da docx olarak aktar.
+
+        Biçim verilmezse dosya uzantısından anlaşılır. Kayıtlar veritabanından
+        parça parça okunur; yazılan kayıt sayısını döndürür.
+        """
+        return export_entries(self.storage.iterate(), path, format)
+
+    @diagnostics.timed('update_word_file')
+    def export_docx(self, path=None, force=False):
+        """Sözlüğü Word belgesine aktar; (dosya yolu, yeniden yazıldı mı) döndür.
+
+        Son dışa aktarmadan beri sözlük değişmediyse ya da içerik özeti
+        belgedekiyle aynıysa belge yeniden üretilmez. Arka plan iş
+        parçacığında çağrılabilir.
+        """
+        path = path or self.docx_file
+        revision = self.revision
+        if not force and self._exported_revisions.get(path) == revision and os.path.exists(path):
+            return path, False
+
+        # Özet ve belge ayrı okumalarla üretilir, sözlük bellekte toplanmaz
+        digest = content_hash((english, turkish) for english, turkish, _ in self.storage.iterate())
+        key = 'docx_hash:' + os.path.abspath(path)
+        written = force or self.storage.get_meta(key) != digest or not os.path.exists(path)
+        if written:
+            export_docx(self.storage.iterate(), path)
+            self.storage.set_meta(key, digest)
+        self._exported_revisions[path] = revision
+        return path, written
+
+    def translation_cache_stats(self):
+        """Önbellek açıldıysa istatistiklerini, açılmadıysa None döndür"""
+        if self._translation_cache is None:
+            return None
+        return self._translation_cache.stats()
+
+    def stats(self):
+        return {
+            'words': self.count(),
+            'translation_cache': self.translation_cache.stats(),
+            'lexicon': len(self.lexicon) if self.lexicon is not None else None,
+        }
+
+    def close(self):
+        self._closing.set()
+        if self.index_thread is not None:
+            self.index_thread.join(1)
+        if isinstance(self.database, CompactDictionary):
+            # Görüntü yalnızca blok kopyayla hızlı yazılabildiğinde kapanışta güncellenir
+            self.save_snapshot(release=True)
+            self.database.close()
+        if self._translation_cache is not None:
+            self._translation_cache.close()
+        if self._translator is not None and hasattr(self._translator, 'close'):
+            self._translator.close()
+        self._storage.close()
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _row_hash(turkish):
+    return hashlib.blake2b(turkish.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def normalize_word(word):
+    """İngilizce kelimeyi sözlük anahtarı biçimine getir"""
+    return word.strip().lower()
@@ -0,0 +1,113 @@
+"""Sıcak yollar için hafif süre ölçümü ve sayaçlar.
+
+Ölçüm varsayılan olarak kapalıdır; kapalıyken sarılmış fonksiyonlar
+yalnızca bir bayrak kontrolü kadar yavaşlar. SOZLUK_DIAGNOSTICS=1 ortam
+değişkeniyle ya da tanılama penceresinden açılır.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+# Bellekte tutulacak en fazla ölçüm kaydı
+MAX_EVENTS = 10000
+
+
+class Diagnostics:
+    """Süre ölçümlerini, sayaçları ve isteğe bağlı bellek izlemeyi toplar"""
+
+    def __init__(self, enabled=False, max_events=MAX_EVENTS):
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self.timings = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def timed(self, name):
+        """Fonksiyonun süresini `name` adıyla kaydeden dekoratör"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.timings.setdefault(name, deque(maxlen=self.events.maxlen)).append(seconds)
+            self.events.append({'time': time.time(), 'name': name, 'ms': round(seconds * 1000, 3)})
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self.events.clear()
+            self.timings.clear()
+            self.counters.clear()
+
+    def start_memory_trace(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop_memory_trace(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def memory(self):
+        """İzleme açıksa (şu anki, en yüksek) bellek kullanımını bayt olarak döndür"""
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.get_traced_memory()
+
+    def summary(self):
+        """Her ölçüm için sayı ve milisaniye cinsinden ortalama/p50/p95/en yüksek süre"""
+        with self._lock:
+            timings = {name: sorted(samples) for name, samples in self.timings.items()}
+            counters = dict(self.counters)
+
+        result = {}
+        for name, samples in timings.items():
+            def percentile(p):
+                return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+            result[name] = {
+                'count': len(samples),
+                'mean_ms': round(sum(samples) / len(samples) * 1000, 3),
+                'p50_ms': round(percentile(50) * 1000, 3),
+                'p95_ms': round(percentile(95) * 1000, 3),
+                'max_ms': round(samples[-1] * 1000, 3),
+            }
+        summary = {'timings': result, 'counters': counters}
+        memory = self.memory()
+        if memory is not None:
+            summary['memory'] = {'current_bytes': memory[0], 'peak_bytes': memory[1]}
+        return summary
+
+    def export_jsonl(self, path, extra=None):
+        """Ölçüm kayıtlarını satır başına bir JSON olarak, en sona özetle yaz"""
+        with self._lock:
+            events = list(self.events)
+        summary = self.summary()
+        if extra:
+            summary.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(dict(event, type='timing'), ensure_ascii=False) + "\n")
+            f.write(json.dumps(dict(summary, type='summary', time=time.time()), ensure_ascii=False) + "\n")
+        return len(events)
+
+
+# Uygulama genelinde kullanılan tek örnek
+diagnostics = Diagnostics(enabled=os.environ.get('SOZLUK_DIAGNOSTICS') == '1')
@@ -0,0 +1,226 @@
+"""Sözlüğün dosya olarak dışa aktarılması.
+
+Tüm biçimler kayıtları (ingilizce, türkçe, tarih) üçlüleri olarak tek tek
+alır ve dosyaya akış halinde yazar; sözlük bellekte toplanmaz, bellek
+kullanımı sözlük boyutundan bağımsızdır. SQLiteStorage.iterate() kayıtları
+alfabetik sırayla ve parça parça verdiği için doğrudan kullanılabilir.
+
+    csv    Excel uyumlu (UTF-8 BOM) virgülle ayrılmış dosya
+    jsonl  Satır başına bir JSON nesnesi
+    anki   Anki'nin "Düz metinden içe aktar" biçimi (sekmeyle ayrılmış)
+    xlsx   openpyxl yalnız yazma kipi ve adlandırılmış hücre stilleri
+    docx   Word belgesi
+
+openpyxl ve python-docx yalnızca ilgili dışa aktarma sırasında yüklenir.
+Her dosya önce geçici dosyaya yazılır; yarım kalmış bir dışa aktarma
+önceki dosyayı bozmaz.
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+import zipfile
+from contextlib import contextmanager
+from xml.sax.saxutils import escape
+
+from dictionary_storage import COLUMNS
+
+DOCX_TITLE = "Kişisel Sözlük"
+
+# Her kelime için renk atamak yerine belgede bir kez tanımlanan stiller;
+# aynı adlar Excel'de adlandırılmış hücre stili olarak kullanılır
+ENGLISH_STYLE = "Sozluk Ingilizce"
+TURKISH_STYLE = "Sozluk Turkce"
+HEADER_STYLE = "Sozluk Baslik"
+
+# Uzantıdan biçime
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.tsv': 'anki',
+    '.txt': 'anki',
+    '.xlsx': 'xlsx',
+    '.docx': 'docx',
+}
+
+# XML'de bulunamayacak denetim karakterleri
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def content_hash(entries):
+    """(ingilizce, türkçe) kayıtlarının içerik özetini döndür"""
+    digest = hashlib.sha1()
+    for english, turkish in entries:
+        digest.update(f"{english}\t{turkish}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+@contextmanager
+def _replacing(path):
+    """Geçici dosya yolunu ver; blok hatasız biterse dosyayı yerine taşı"""
+    tmp_file = path + ".tmp"
+    try:
+        yield tmp_file
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    os.replace(tmp_file, path)
+
+
+def export_csv(rows, path):
+    count = 0
+    with _replacing(path) as tmp_file, open(tmp_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for count, row in enumerate(rows, 1):
+            writer.writerow(row)
+    return count
+
+
+def export_jsonl(rows, path):
+    count = 0
+    with _replacing(path) as tmp_file, open(tmp_file, 'w', encoding='utf-8') as f:
+        for count, (english, turkish, date) in enumerate(rows, 1):
+            f.write(json.dumps({'english': english, 'turkish': turkish, 'date': date},
+                               ensure_ascii=False))
+            f.write("\n")
+    return count
+
+
+def export_anki(rows, path):
+    """Anki'ye "Ön yüz / Arka yüz" notları olarak alınabilen sekmeli metin yaz"""
+    def field(text):
+        # Alan içinde sekme ve satır sonu bulunamaz
+        return " ".join(str(text).split())
+
+    count = 0
+    with _replacing(path) as tmp_file, open(tmp_file, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("#separator:tab\n#html:false\n#columns:English\tTurkish\n")
+        for count, (english, turkish, _) in enumerate(rows, 1):
+            f.write(f"{field(english)}\t{field(turkish)}\n")
+    return count
+
+
+def export_xlsx(rows, path):
+    """Sözlüğü uygulamanın Excel biçiminde (sarı başlık, kırmızı/mavi sütunlar) yaz.
+
+    Yalnız yazma kipinde satırlar dosyaya hemen yazılır. Renkler her hücre
+    için ayrı Font nesnesi yerine bir kez tanımlanan adlandırılmış
+    stillerle verilir.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, NamedStyle, PatternFill
+
+    workbook = Workbook(write_only=True)
+    for style in (
+        NamedStyle(HEADER_STYLE, fill=PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')),
+        NamedStyle(ENGLISH_STYLE, font=Font(color='FF0000')),
+        NamedStyle(TURKISH_STYLE, font=Font(color='0000FF')),
+    ):
+        workbook.add_named_style(style)
+    worksheet = workbook.create_sheet('Sheet1')
+    worksheet.column_dimensions['A'].width = 20
+    worksheet.column_dimensions['B'].width = 20
+    worksheet.column_dimensions['C'].width = 15
+
+    def cell(value, style):
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = style
+        return cell
+
+    worksheet.append([cell(name, HEADER_STYLE) for name in COLUMNS])
+    # Satırlar append() sırasında hemen yazıldığından stil atanmış iki hücre
+    # her satırda yeniden kullanılır
+    english_cell = cell(None, ENGLISH_STYLE)
+    turkish_cell = cell(None, TURKISH_STYLE)
+    count = 0
+    for count, (english, turkish, date) in enumerate(rows, 1):
+        english_cell.value = INVALID_XML_CHARS.sub('', english)
+        turkish_cell.value = INVALID_XML_CHARS.sub('', turkish)
+        worksheet.append([english_cell, turkish_cell, date])
+
+    with _replacing(path) as tmp_file:
+        workbook.save(tmp_file)
+    return count
+
+
+def _add_styles(doc):
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import RGBColor
+
+    # İngilizce kelime kalın ve kırmızı
+    english = doc.styles.add_style(ENGLISH_STYLE, WD_STYLE_TYPE.CHARACTER)
+    english.font.bold = True
+    english.font.color.rgb = RGBColor(255, 0, 0)
+
+    # Türkçe anlam normal ve mavi
+    turkish = doc.styles.add_style(TURKISH_STYLE, WD_STYLE_TYPE.CHARACTER)
+    turkish.font.bold = False
+    turkish.font.color.rgb = RGBColor(0, 0, 255)
+
+
+def export_docx(rows, path):
+    """Kayıtları sırayla Word belgesine yaz.
+
+    python-docx yalnızca başlığı ve stilleri içeren boş belgeyi kurar;
+    kelime paragrafları belgenin XML'ine metin olarak akıtılır, belge
+    nesnesi bellekte büyümez.
+    """
+    from io import BytesIO
+
+    from docx import Document
+
+    doc = Document()
+    _add_styles(doc)
+    heading = doc.add_heading(DOCX_TITLE, level=1)
+    heading.alignment = 1  # Ortalı
+    english_style = doc.styles[ENGLISH_STYLE].style_id
+    turkish_style = doc.styles[TURKISH_STYLE].style_id
+    template = BytesIO()
+    doc.save(template)
+
+    def run(text, style_id=None):
+        style = f'<w:rPr><w:rStyle w:val="{style_id}"/></w:rPr>' if style_id else ''
+        text = escape(INVALID_XML_CHARS.sub('', text))
+        return f'<w:r>{style}<w:t xml:space="preserve">{text}</w:t></w:r>'
+
+    separator = run(" - ")
+    count = 0
+    with _replacing(path) as tmp_file, zipfile.ZipFile(template) as source, \
+            zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            if item.filename != 'word/document.xml':
+                target.writestr(item, source.read(item))
+                continue
+            document = source.read(item).decode('utf-8')
+            # Paragraflar bölüm ayarlarından (sectPr) önce gelmeli
+            split = document.rindex('<w:sectPr')
+            with target.open('word/document.xml', 'w', force_zip64=True) as f:
+                f.write(document[:split].encode('utf-8'))
+                for count, (english, turkish, *_) in enumerate(rows, 1):
+                    f.write(f'<w:p>{run(english, english_style)}{separator}'
+                            f'{run(turkish, turkish_style)}</w:p>'.encode('utf-8'))
+                f.write(document[split:].encode('utf-8'))
+    return count
+
+
+EXPORTERS = {
+    'csv': export_csv,
+    'jsonl': export_jsonl,
+    'anki': export_anki,
+    'xlsx': export_xlsx,
+    'docx': export_docx,
+}
+
+
+def export_entries(rows, path, format=None):
+    """Kayıtları biçimi verilen ya da uzantıdan anlaşılan dosyaya yaz, sayısını döndür"""
+    if format is None:
+        format = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if format not in EXPORTERS:
+        raise ValueError(f"Desteklenmeyen dışa aktarma biçimi: {format or path} "
+                         f"(seçenekler: {', '.join(EXPORTERS)})")
+    return EXPORTERS[format](rows, path)
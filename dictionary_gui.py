@@ -1,22 +1,19 @@
+import os
+import platform
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QLineEdit, QPushButton, QLabel, QMessageBox,
-                            QHBoxLayout, QFrame, QSizePolicy)
-from docx import Document
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QIcon
-from docx.shared import RGBColor
-from deep_translator import GoogleTranslator
-import urllib.request
-from functools import lru_cache
-import pandas as pd
-from datetime import datetime
-import os
-from openpyxl.styles import PatternFill,Font
-
-# Veri tabanı dosyası
-DATABASE_FILE = "sozluk.json"
-WORD_FILE = "Personal_Dictionary.xlsx"
+                            QHBoxLayout, QFrame, QSizePolicy, QCompleter,
+                            QComboBox, QFileDialog, QDialog, QPlainTextEdit,
+                            QShortcut)
+from PyQt5.QtCore import Qt, QTimer, QStringListModel
+from PyQt5.QtGui import QFont, QIcon, QKeySequence
+from dictionary_browser import DictionaryBrowser
+from dictionary_core import DictionaryCore, RecentlyFailedError, TRANSLATION_FAILED
+from dictionary_diagnostics import diagnostics
+from dictionary_lexicon import LEXICON_FILE
+from dictionary_translators import CircuitOpenError
+from dictionary_workers import BackgroundTask, ConnectivityMonitor, FileWatcher, TranslationWorker
 
 input_card_color="#E1E8F0"
 result_card_color="#E1E8F0"
@@ -25,6 +22,240 @@ title_color="black"
 font_color="black"
 background_color = "#9fb6cd"  # Arka plan rengi değişkeni
 
+# Yazma durduktan kaç ms sonra öneriler güncellensin
+AUTOCOMPLETE_DELAY_MS = 150
+
+# Yazma durduktan kaç ms sonra sözlükte olmayan kelimenin çevirisi önceden başlasın
+PREFETCH_DELAY_MS = 400
+
+# Art arda yapılan değişikliklerden sonra Word belgesi kaç ms sonra güncellensin
+EXPORT_DELAY_MS = 2000
+
+# Çeviri yapılamadığında öneri yerine gösterilen metin
+NO_INTERNET = "İnternet bağlantısı yok"
+
+# Uygulama genelinde bir kez uygulanan stil sayfası
+APP_STYLESHEET = f"""
+    QWidget#mainWidget {{
+        background-color: {background_color};
+    }}
+    QLabel#titleLabel {{
+        color: {title_color};  /* Yazı rengi */
+        margin-bottom: 10px;  /* Alt boşluk */
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;  /* Modern yazı tipi */
+        font-weight: bold;  /* Kalın yazı tipi */
+    }}
+    QFrame#inputCard {{
+        background-color: {input_card_color};  /* Arka plan rengi */
+        border-radius: 15px;  /* Kenar yuvarlama */
+        padding: 20px;  /* İç boşluk */
+        border: 1px solid #ccc;  /* Kenar rengi */
+    }}
+    QComboBox#modeCombo {{
+        color: {font_color};
+        background-color: #f5f5f5;
+        padding: 3px;
+    }}
+    QLabel#fieldLabel {{
+        color: {font_color};
+        padding: 3px;
+    }}
+    QLineEdit {{
+        padding: 10px;  /* İç boşluk */
+        font-size: 12px;  /* Font boyutu */
+        font-weight: bold;  /* Kalın yazı tipi */
+        color: {font_color};  /* Yazı rengi */
+        background-color: #f5f5f5;  /* Arka plan rengi */
+        border: 2px solid #3498db;  /* Kenar rengi */
+        border-radius: 5px;  /* Kenar yuvarlama */
+    }}
+    QLineEdit:focus {{
+        border: 2px solid #2980b9;  /* Odaklandığında kenar rengi */
+    }}
+    QPushButton#searchButton, QPushButton#addButton,
+    QPushButton#viewDictButton, QPushButton#cancelButton {{
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 11px;
+        padding: 5px;
+    }}
+    QPushButton#searchButton {{
+        background-color: #3498db;
+        font-weight: bold;
+    }}
+    QPushButton#searchButton:hover {{
+        background-color: #2980b9;
+    }}
+    QPushButton#searchButton:pressed {{
+        background-color: #1c598a;
+    }}
+    QPushButton#addButton {{
+        background-color: #27ae60;  /* Yeşil arka plan rengi */
+        font-weight: bold;
+        padding: 5px 10px;
+    }}
+    QPushButton#addButton:hover {{
+        background-color: #219a52;
+    }}
+    QPushButton#viewDictButton {{
+        background-color: #8e44ad;  /* Mor arka plan rengi */
+    }}
+    QPushButton#viewDictButton:hover {{
+        background-color: #732d91;
+    }}
+    QPushButton#cancelButton {{
+        background-color: #e74c3c;  /* Kırmızı arka plan rengi */
+    }}
+    QPushButton#cancelButton:hover {{
+        background-color: #c0392b;
+    }}
+    QFrame#resultCard {{
+        background-color: {result_card_color};
+        border-radius: 10px;
+        padding: 15px;  /* İç boşluk */
+    }}
+    QLabel#resultLabel {{
+        color: {font_color};
+        padding: 5px;
+    }}
+    QLabel#wordCountLabel {{
+        color: {counter_color};
+        font-size: 12px;
+        margin-top: 5px;
+    }}
+    QPushButton#githubButton, QPushButton#importButton, QPushButton#clearButton {{
+        color: white;
+        border: none;
+        padding: 5px 10px;
+        border-radius: 3px;
+    }}
+    QPushButton#githubButton {{
+        background-color: #333;
+    }}
+    QPushButton#githubButton:hover {{
+        background-color: #444;
+    }}
+    QPushButton#importButton {{
+        background-color: #2980b9;
+    }}
+    QPushButton#importButton:hover {{
+        background-color: #1c598a;
+    }}
+    QPushButton#clearButton {{
+        background-color: #e74c3c;
+    }}
+    QPushButton#clearButton:hover {{
+        background-color: #c0392b;
+    }}
+"""
+
+
+class DiagnosticsDialog(QDialog):
+    """Süre ölçümlerini, sayaçları ve önbellek istatistiklerini gösterir"""
+
+    def __init__(self, core, translation_worker=None, parent=None):
+        super().__init__(parent)
+        self.core = core
+        self.translation_worker = translation_worker
+        self.setWindowTitle("Tanılama")
+        self.resize(560, 420)
+
+        layout = QVBoxLayout(self)
+        self.report = QPlainTextEdit(self)
+        self.report.setReadOnly(True)
+        self.report.setFont(QFont("Monospace", 9))
+        layout.addWidget(self.report)
+
+        buttons = QHBoxLayout()
+        self.toggle_button = QPushButton(self)
+        self.toggle_button.clicked.connect(self.toggle_enabled)
+        self.memory_button = QPushButton(self)
+        self.memory_button.clicked.connect(self.toggle_memory)
+        reset_button = QPushButton("Sıfırla", self)
+        reset_button.clicked.connect(self.reset)
+        export_button = QPushButton("Kaydet (JSONL)", self)
+        export_button.clicked.connect(self.export)
+        for button in (self.toggle_button, self.memory_button, reset_button, export_button):
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+
+        # Pencere açıkken rapor her saniye yenilenir
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(1000)
+        self.refresh()
+
+    def extra(self):
+        """Ölçümlere eklenen önbellek ve sözlük bilgileri"""
+        extra = {'words': self.core.count()}
+        cache_stats = self.core.translation_cache_stats()
+        if cache_stats is not None:
+            extra['translation_cache'] = cache_stats
+        if self.translation_worker is not None:
+            extra['prefetch'] = self.translation_worker.prefetch_stats()
+        return extra
+
+    def refresh(self):
+        self.toggle_button.setText("Ölçümü Durdur" if diagnostics.enabled else "Ölçümü Başlat")
+        self.memory_button.setText(
+            "Bellek İzlemeyi Durdur" if diagnostics.memory() is not None else "Bellek İzlemeyi Başlat"
+        )
+        summary = diagnostics.summary()
+        lines = [f"{'işlem':<26} {'sayı':>6} {'ort. ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'en çok ms':>10}"]
+        for name, stats in sorted(summary['timings'].items()):
+            lines.append(
+                f"{name:<26} {stats['count']:>6} {stats['mean_ms']:>9.2f} {stats['p50_ms']:>9.2f} "
+                f"{stats['p95_ms']:>9.2f} {stats['max_ms']:>10.2f}"
+            )
+        lines.append("")
+        for name, value in sorted(summary['counters'].items()):
+            lines.append(f"{name}: {value}")
+        for name, value in self.extra().items():
+            lines.append(f"{name}: {value}")
+        if 'memory' in summary:
+            memory = summary['memory']
+            lines.append(
+                f"bellek: {memory['current_bytes'] / 1e6:.1f} MB, en yüksek {memory['peak_bytes'] / 1e6:.1f} MB"
+            )
+        self.report.setPlainText("\n".join(lines))
+
+    def reset(self):
+        diagnostics.reset()
+        self.refresh()
+
+    def toggle_enabled(self):
+        diagnostics.enabled = not diagnostics.enabled
+        self.refresh()
+
+    def toggle_memory(self):
+        if diagnostics.memory() is None:
+            diagnostics.start_memory_trace()
+        else:
+            diagnostics.stop_memory_trace()
+        self.refresh()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Tanılama Kaydını Kaydet", "tanilama.jsonl", "JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+        try:
+            count = diagnostics.export_jsonl(path, self.extra())
+        except OSError as e:
+            QMessageBox.warning(self, "Hata", f"Tanılama kaydı yazılamadı: {e}")
+            return
+        QMessageBox.information(self, "Bilgi", f"{count} ölçüm kaydedildi.")
+
+    def closeEvent(self, event):
+        self.refresh_timer.stop()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        self.refresh_timer.start(1000)
+        super().showEvent(event)
+
 
 class DictionaryApp(QMainWindow):
     def __init__(self):
@@ -33,24 +264,53 @@ class DictionaryApp(QMainWindow):
         self.setMinimumSize(600, 480)  # Minimum boyut
         self.setMaximumSize(900, 720)  # Maksimum boyut
         
-        # Önce veritabanını yükle
-        self.excel_file = "Personal_Dictionary.xlsx"
-        self.database = self.load_database()
+        # Sözlük çekirdeği; kayıtlar pencere çizildikten sonra arka planda yüklenir
+        self.core = DictionaryCore(
+            compact=os.environ.get('SOZLUK_COMPACT') == '1',
+            lexicon_file=os.environ.get('SOZLUK_LEXICON', LEXICON_FILE),
+        )
+        self.load_task = None
+        self.index_task = None
+        self.last_fuzzy_word = None
+        # Sözlük tablosu ilk açılışta oluşturulur
+        self.browser = None
+
+        # Arka plan çeviri işçisi
+        self.translation_worker = TranslationWorker(self.translate_word, self)
+        self.translation_worker.translated.connect(self.on_translation_ready)
+        # Yazma durunca çeviri Enter beklenmeden başlatılır; SOZLUK_PREFETCH=0 kapatır
+        self.prefetch_enabled = os.environ.get('SOZLUK_PREFETCH', '1') != '0'
+        self.import_task = None
+
+        # Word belgesi arka planda, değişikliklerden kısa süre sonra güncellenir
+        self.export_task = None
+        self.export_pending = False
+        self.open_export_when_ready = False
+        # Excel dosyası yalnızca istendiğinde yeniden yazılır
+        self.excel_export_task = None
+        self.export_timer = QTimer(self)
+        self.export_timer.setSingleShot(True)
+        self.export_timer.setInterval(EXPORT_DELAY_MS)
+        self.export_timer.timeout.connect(self.update_word_file)
         
         # Sonra UI'ı başlat
         self.init_ui()
-        
-        # İnternet bağlantısı kontrolü
+
+        # İnternet bağlantısı arka planda izlenir, açılış ağı beklemez
         self.internet_available = True
-        self.connection_timer = QTimer()
-        self.connection_timer.timeout.connect(self.check_internet_connection)
-        self.connection_timer.start(30000)
-        
-        # Translator'ı başlat
-        self.translator = GoogleTranslator(source='en', target='tr')
-        
-        # İlk internet kontrolü
-        self.check_internet_connection()
+        self.connectivity = ConnectivityMonitor(self)
+        self.connectivity.status_changed.connect(self.on_connectivity_changed)
+        self.connectivity.start()
+
+        # Excel dosyası dışarıdan düzenlenirse yalnızca değişen kayıtlar sözlüğe alınır
+        self.sync_task = None
+        self.sync_pending = False
+        self.excel_watcher = FileWatcher(self.core.excel_file, parent=self)
+        self.excel_watcher.changed.connect(self.sync_excel)
+
+        # Pencere ilk çizildiğinde de sözlük yüklenene kadar düzenleme kapalı
+        self.set_editing_enabled(False)
+        QTimer.singleShot(0, self.load_database)
 
     def init_ui(self):
         self.setWindowTitle("Modern Sözlük Uygulaması")
@@ -60,7 +320,7 @@ class DictionaryApp(QMainWindow):
         
         # Ana widget ve layout
         main_widget = QWidget()
-        main_widget.setStyleSheet(f"background-color: {background_color};")
+        main_widget.setObjectName("mainWidget")
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout()
         layout.setSpacing(10)  # Daha az boşluk
@@ -71,84 +331,45 @@ class DictionaryApp(QMainWindow):
         title = QLabel("Modern Sözlük")
         title.setFont(QFont("Arial", 28, QFont.Bold))  # Font boyutu artırıldı
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            color: {title_color};  /* Yazı rengi */
-            margin-bottom: 10px;  /* Alt boşluk */
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;  /* Modern yazı tipi */
-            font-weight: bold;  /* Kalın yazı tipi */
-        """)
+        title.setObjectName("titleLabel")
         layout.addWidget(title)
 
         # Giriş kartı
         input_card = QFrame()
-        input_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {input_card_color};  /* Arka plan rengi */
-                border-radius: 15px;  /* Kenar yuvarlama */
-                padding: 20px;  /* İç boşluk */
-                border: 1px solid #ccc;  /* Kenar rengi */
-            }}
-        """)
+        input_card.setObjectName("inputCard")
         input_card.setMinimumHeight(250)  # Kart yüksekliği
         input_layout = QVBoxLayout()
         input_layout.setSpacing(8)  # Daha az boşluk
         input_layout.setContentsMargins(10, 10, 10, 10)  # Kenar boşlukları
         input_card.setLayout(input_layout)
 
+        # Arama yönü seçimi
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["İngilizce → Türkçe", "Türkçe → İngilizce"])
+        self.mode_combo.setObjectName("modeCombo")
+        self.mode_combo.currentIndexChanged.connect(self.change_search_mode)
+        input_layout.addWidget(self.mode_combo)
+
         # İngilizce kelime bölümü
-        eng_label = QLabel("İngilizce Kelime")
-        eng_label.setFont(QFont("Arial", 10, QFont.Bold))  # Font boyutu ve kalınlık ayarlandı
-        eng_label.setStyleSheet(f"color: {font_color}; padding: 3px;")
-        input_layout.addWidget(eng_label)
+        self.eng_label = QLabel("İngilizce Kelime")
+        self.eng_label.setFont(QFont("Arial", 10, QFont.Bold))  # Font boyutu ve kalınlık ayarlandı
+        self.eng_label.setObjectName("fieldLabel")
+        input_layout.addWidget(self.eng_label)
 
         self.word_input = QLineEdit()
         self.word_input.setPlaceholderText("Aramak istediğiniz kelimeyi girin...")
         self.word_input.setMinimumHeight(30)  # Yüksekliği artırdık
-        self.word_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 10px;  /* İç boşluk */
-                font-size: 12px;  /* Font boyutu */
-                font-weight: bold;  /* Kalın yazı tipi */
-                color: {font_color};  /* Yazı rengi */
-                background-color: #f5f5f5;  /* Arka plan rengi */
-                border: 2px solid #3498db;  /* Kenar rengi */
-                border-radius: 5px;  /* Kenar yuvarlama */
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #2980b9;  /* Odaklandığında kenar rengi */
-            }}
-            QLineEdit::placeholder {{
-                color: #bdc3c7;  /* Yer tutucu yazı rengi */
-            }}
-        """)
         input_layout.addWidget(self.word_input)
 
         # Türkçe anlam bölümü
         self.meaning_label = QLabel("Türkçe Anlam")
         self.meaning_label.setFont(QFont("Arial", 10, QFont.Bold))  # Font boyutu küçültüldü
-        self.meaning_label.setStyleSheet(f"color: {font_color}; padding: 3px;")
+        self.meaning_label.setObjectName("fieldLabel")
         input_layout.addWidget(self.meaning_label)
 
         self.meaning_input = QLineEdit()
         self.meaning_input.setPlaceholderText("Türkçe anlamını girin...")
         self.meaning_input.setMinimumHeight(30)  # Yüksekliği artırdık
-        self.meaning_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 10px;  /* İç boşluk */
-                font-size: 12px;  /* Font boyutu */
-                font-weight: bold;  /* Kalın yazı tipi */
-                color: {font_color};  /* Yazı rengi */
-                background-color: #f5f5f5;  /* Arka plan rengi */
-                border: 2px solid #3498db;  /* Kenar rengi */
-                border-radius: 5px;  /* Kenar yuvarlama */
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #2980b9;  /* Odaklandığında kenar rengi */
-            }}
-            QLineEdit::placeholder {{
-                color: #bdc3c7;  /* Yer tutucu yazı rengi */
-            }}
-        """)
         input_layout.addWidget(self.meaning_input)
 
         # Butonlar için yatay layout
@@ -159,78 +380,25 @@ class DictionaryApp(QMainWindow):
         # Ara butonu
         self.search_button = QPushButton("Ara")
         self.search_button.setMinimumSize(80, 25)  # Daha küçük buton boyutu
-        self.search_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1c598a;
-            }
-        """)
+        self.search_button.setObjectName("searchButton")
         button_layout.addWidget(self.search_button)
 
         # Ekle butonu
         self.add_button = QPushButton("Ekle")
         self.add_button.setMinimumSize(80, 25)  # Daha küçük buton boyutu
-        self.add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;  /* Yeşil arka plan rengi */
-                color: white;  /* Yazı rengi */
-                border: none;  /* Kenar çizgisi yok */
-                border-radius: 5px;  /* Kenar yuvarlama */
-                font-size: 11px;  /* Font boyutu */
-                font-weight: bold;  /* Font kalınlığı */
-                padding: 5px 10px;  /* İç boşluk */
-            }
-            QPushButton:hover {
-                background-color: #219a52;  /* Hover durumunda arka plan rengi */
-            }
-        """)
+        self.add_button.setObjectName("addButton")
         button_layout.addWidget(self.add_button)
 
         # View Dictionary butonu
         self.view_dict_button = QPushButton("Sözlüğü Görüntüle")
         self.view_dict_button.setMinimumSize(80, 25)  # Daha küçük buton boyutu
-        self.view_dict_button.setStyleSheet("""
-            QPushButton {
-                background-color: #8e44ad;  /* Mor arka plan rengi */
-                color: white;  /* Yazı rengi */
-                border: none;  /* Kenar çizgisi yok */
-                border-radius: 5px;  /* Kenar yuvarlama */
-                font-size: 11px;  /* Font boyutu */
-                padding: 5px;  /* İç boşluk */
-            }
-            QPushButton:hover {
-                background-color: #732d91;  /* Hover durumunda arka plan rengi */
-            }
-        """)
+        self.view_dict_button.setObjectName("viewDictButton")
         button_layout.addWidget(self.view_dict_button)
 
         # İptal butonu
         self.cancel_button = QPushButton("İptal")
         self.cancel_button.setMinimumSize(80, 25)  # Daha küçük buton boyutu
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;  /* Kırmızı arka plan rengi */
-                color: white;  /* Yazı rengi */
-                border: none;  /* Kenar çizgisi yok */
-                border-radius: 5px;  /* Kenar yuvarlama */
-                font-size: 11px;  /* Font boyutu */
-                padding: 5px;  /* İç boşluk */
-            }
-            QPushButton:hover {
-                background-color: #c0392b;  /* Hover durumunda arka plan rengi */
-            }
-        """)
+        self.cancel_button.setObjectName("cancelButton")
         button_layout.addWidget(self.cancel_button)
 
         input_layout.addLayout(button_layout)
@@ -238,13 +406,7 @@ class DictionaryApp(QMainWindow):
 
         # Sonuç bölümü
         self.result_card = QFrame()
-        self.result_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {input_card_color};
-                border-radius: 10px;
-                padding: 15px;  # İç boşluk
-            }}
-        """)
+        self.result_card.setObjectName("resultCard")
         self.result_layout = QVBoxLayout()
         self.result_layout.setSpacing(8)  # Daha az boşluk
         self.result_layout.setContentsMargins(10, 10, 10, 10)  # Kenar boşlukları
@@ -254,7 +416,7 @@ class DictionaryApp(QMainWindow):
         self.result_label.setAlignment(Qt.AlignCenter)
         self.result_label.setFont(QFont("Arial", 10))  # Font boyutu ayarlandı
         self.result_label.setWordWrap(True)  # Satır sarmayı etkinleştir
-        self.result_label.setStyleSheet(f"color: {font_color}; padding: 5px;")  # Stil ayarlandı
+        self.result_label.setObjectName("resultLabel")
         self.result_layout.addWidget(self.result_label)
 
         layout.addWidget(self.result_card)
@@ -264,14 +426,9 @@ class DictionaryApp(QMainWindow):
         
         # Kelime sayısı göstergesi
         self.word_count_label = QLabel(self)
-        self.word_count_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                font-size: 12px;
-                margin-top: 5px;
-            }
-        """)
-        self.update_word_count()  # Kelime sayısını güncelle
+        self.word_count_label.setObjectName("wordCountLabel")
+        # Sayı yüklemeden sonra yazılır; ilk açılıştaki Excel aktarımı arayüzü bekletmesin
+        self.word_count_label.setText("Sözlük yükleniyor...")
 
         # Github ve Temizle butonları için horizontal layout
         self.button_layout = QHBoxLayout()
@@ -280,40 +437,26 @@ class DictionaryApp(QMainWindow):
         self.github_button = QPushButton("Github", self)
         self.github_button.setFixedSize(100, 30)
         self.github_button.setCursor(Qt.PointingHandCursor)
-        self.github_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #444;
-            }
-        """)
+        self.github_button.setObjectName("githubButton")
         self.github_button.clicked.connect(self.open_github)
         
         # Temizle butonu
         self.clear_button = QPushButton("Sözlüğü Temizle", self)
         self.clear_button.setFixedSize(100, 30)
         self.clear_button.setCursor(Qt.PointingHandCursor)
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        self.clear_button.setObjectName("clearButton")
         self.clear_button.clicked.connect(self.clear_dictionary)
+
+        # Toplu içe aktarma butonu
+        self.import_button = QPushButton("İçe Aktar", self)
+        self.import_button.setFixedSize(100, 30)
+        self.import_button.setCursor(Qt.PointingHandCursor)
+        self.import_button.setObjectName("importButton")
+        self.import_button.clicked.connect(self.import_words)
         
         # Butonları yan yana ekle
         self.button_layout.addWidget(self.github_button)
+        self.button_layout.addWidget(self.import_button)
         self.button_layout.addWidget(self.clear_button)
         self.button_layout.setSpacing(10)
         self.button_layout.setAlignment(Qt.AlignCenter)
@@ -327,63 +470,93 @@ class DictionaryApp(QMainWindow):
 
         # Bağlantılar
         self.word_input.returnPressed.connect(self.search_word)
+
+        # Otomatik tamamlama: yazma durunca önek dizininden öneriler alınır
+        self.completion_model = QStringListModel(self)
+        self.completer = QCompleter(self.completion_model, self)
+        self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
+        self.completer.activated[str].connect(lambda _: self.search_word())
+        self.word_input.setCompleter(self.completer)
+        self.completion_timer = QTimer(self)
+        self.completion_timer.setSingleShot(True)
+        self.completion_timer.timeout.connect(self.update_completions)
+        self.word_input.textEdited.connect(lambda _: self.completion_timer.start(AUTOCOMPLETE_DELAY_MS))
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.prefetch_translation)
+        if self.prefetch_enabled:
+            self.word_input.textEdited.connect(lambda _: self.prefetch_timer.start(PREFETCH_DELAY_MS))
+        # Yeni kelime yazılırken süren çevirinin sonucu yok sayılır
+        self.word_input.textChanged.connect(lambda _: self.translation_worker.cancel())
         self.meaning_input.returnPressed.connect(self.add_word)
-        self.search_button.clicked.connect(self.search_word)
+        self.search_button.clicked.connect(lambda: self.search_word())
         self.add_button.clicked.connect(self.add_word)
         self.view_dict_button.clicked.connect(self.open_dictionary)
 
         # İptal butonu için bağlantı eklendi
         self.cancel_button.clicked.connect(self.cancel_add)
 
+        # Gizli tanılama penceresi
+        self.diagnostics_dialog = None
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.show_diagnostics)
+
     def load_database(self):
-        """Excel dosyasından veritabanını yükle"""
-        try:
-            if os.path.exists(self.excel_file):
-                df = pd.read_excel(self.excel_file)
-                return {row['English'].lower(): row['Turkish'] for _, row in df.iterrows()}
-            else:
-                # İlk kez çalıştırılıyorsa boş Excel dosyası oluştur
-                df = pd.DataFrame(columns=['English', 'Turkish', 'Date'])
-                
-                # Excel yazıcı oluştur
-                with pd.ExcelWriter(self.excel_file, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False)
-                    
-                    # Excel çalışma sayfasını al
-                    worksheet = writer.sheets['Sheet1']
-                    
-                    # Başlık satırını sarı yap
-                    from openpyxl.styles import PatternFill, Font
-                    yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                    red_font = Font(color='FF0000')
-                    blue_font = Font(color='0000FF')
-                    
-                    # Başlıkları formatla
-                    for cell in worksheet[1]:
-                        cell.fill = yellow_fill
-                    
-                    # Sütunları formatla (2. satırdan itibaren)
-                    for row in worksheet.iter_rows(min_row=2):
-                        # İngilizce kelimeler kırmızı
-                        row[0].font = red_font
-                        # Türkçe kelimeler mavi
-                        row[1].font = blue_font
-                    
-                    # Sütun genişliklerini ayarla
-                    worksheet.column_dimensions['A'].width = 20
-                    worksheet.column_dimensions['B'].width = 20
-                    worksheet.column_dimensions['C'].width = 15
-                
-                # Kullanıcıya bilgi ver
-                QMessageBox.information(self, "Bilgi", "Excel dosyası oluşturuldu. Lütfen uygulamayı tekrar başlatın.", QMessageBox.Ok)
-                
-                return {}
-        except Exception as e:
-            print(f"Excel okuma hatası: {e}")
-            QMessageBox.critical(self, "Hata", f"Excel dosyası yüklenirken hata oluştu: {e}", QMessageBox.Ok)
-            return {}
+        """Veritabanını arka planda yükle, ilk çalıştırmada eski Excel sözlüğünü aktar.
+
+        Yükleme bitene kadar aramalar doğrudan veritabanından yapılır,
+        sözlüğü değiştiren butonlar devre dışı kalır. İçe aktarma ve
+        temizleme arka plandaki dizinler kurulana kadar kapalı kalır.
+        """
+        self.set_editing_enabled(False)
+        self.statusBar().showMessage("Sözlük yükleniyor...")
+        def load(progress):
+            database = self.core.load()
+            # Çevrimdışı sözlük ilk aramada arayüzü bekletmesin
+            self.core.lexicon
+            return database
+
+        self.load_task = BackgroundTask(load, self)
+        self.load_task.finished.connect(self.on_database_loaded)
+        self.load_task.failed.connect(self.on_database_load_failed)
+        self.load_task.start()
+
+    def on_database_loaded(self, database):
+        self.add_button.setEnabled(True)
+        self.index_task = BackgroundTask(lambda progress: self.core.wait_for_indexes(), self)
+        self.index_task.finished.connect(lambda _: self.set_editing_enabled(True))
+        self.index_task.start()
+        self.statusBar().clearMessage()
+        self.update_word_count()
+        self.export_timer.start()
+        self.excel_watcher.start()
+        self.sync_excel()
+
+    def on_database_load_failed(self, error):
+        self.core.database = {}
+        self.set_editing_enabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Hata", f"Veritabanı yüklenirken hata oluştu: {error}", QMessageBox.Ok)
 
+    def editing_blocked(self):
+        """Sözlük yükleniyor ya da içe aktarılıyorsa kullanıcıyı uyar ve True döndür"""
+        if not self.core.loaded:
+            message = "Sözlük henüz yükleniyor, lütfen bekleyin."
+        elif self.import_task is not None and self.import_task.is_running():
+            message = "İçe aktarma sürüyor, lütfen bitmesini bekleyin."
+        else:
+            return False
+        QMessageBox.information(self, "Bilgi", message)
+        return True
+
+    def set_editing_enabled(self, enabled):
+        self.add_button.setEnabled(enabled)
+        self.import_button.setEnabled(enabled)
+        self.clear_button.setEnabled(enabled)
+
+    @diagnostics.timed('save_word')
     def save_word(self):
+        if self.editing_blocked():
+            return
         try:
             word = self.word_input.text().strip().lower()
             meaning = self.meaning_input.text().strip()
@@ -392,114 +565,148 @@ class DictionaryApp(QMainWindow):
                 QMessageBox.warning(self, "Uyarı", "Kelime ve anlamı boş olamaz!")
                 return
     
-            # Excel dosyasının açık olup olmadığını kontrol et
-            if os.path.exists(self.excel_file):
-                # Dosyayı açmaya çalış
-                try:
-                    df = pd.read_excel(self.excel_file)
-                except PermissionError:
-                    QMessageBox.warning(
-                        self,
-                        "Hata",
-                        "Excel dosyası açık. Lütfen dosyayı kapatın ve tekrar deneyin.",
-                        QMessageBox.Ok
-                    )
-                    return
-            else:
-                df = pd.DataFrame(columns=['English', 'Turkish', 'Date'])
-    
-            # Kelime zaten var mı kontrol et
-            if word in df['English'].str.lower().values:
+            # Yeni kaydı veritabanına, RAM'deki sözlüğe ve dizinlere ekle
+            if not self.core.add(word, meaning):
                 QMessageBox.warning(self, "Uyarı", "Bu kelime zaten sözlükte mevcut!")
                 return
     
-            # Yeni satır ekle
-            new_row = {
-                'English': word,
-                'Turkish': meaning,
-                'Date': datetime.now().strftime("%Y-%m-%d")  # Sadece tarih bilgisi
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-    
-            # Excel yazıcı oluştur
-            with pd.ExcelWriter(self.excel_file, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False)
-    
-                # Excel çalışma sayfasını al
-                worksheet = writer.sheets['Sheet1']
-    
-                # Başlıkları formatla
-                yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                red_font = Font(color='FF0000')
-                blue_font = Font(color='0000FF')
-    
-                # Başlık satırını sarı yap
-                for cell in worksheet[1]:
-                    cell.fill = yellow_fill
-    
-                # Sütunları formatla (2. satırdan itibaren)
-                for row in worksheet.iter_rows(min_row=2):
-                    # İngilizce kelimeler kırmızı
-                    row[0].font = red_font
-                    # Türkçe kelimeler mavi
-                    row[1].font = blue_font
-    
-                # Sütun genişliklerini ayarla
-                worksheet.column_dimensions['A'].width = 20
-                worksheet.column_dimensions['B'].width = 20
-                worksheet.column_dimensions['C'].width = 15
-    
-            # RAM'deki sözlüğü güncelle
-            self.database[word] = meaning
-    
             self.result_label.setText(f"'{word}' kelimesi başarıyla kaydedildi!")
             self.result_label.setStyleSheet("color: green;")
             self.word_input.clear()
             self.meaning_input.clear()
             self.hide_input_fields()
     
-            # Kelime kaydedildikten sonra sayıyı güncelle
+            # Kelime kaydedildikten sonra sayıyı ve Word belgesini güncelle
             self.update_word_count()
+            self.export_timer.start()
     
         except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Kayıt sırasında hata oluştu lütfen Personal_Dictionary.xlsx dosyasını kapatınız: {str(e)}")
+            QMessageBox.critical(self, "Hata", f"Kayıt sırasında hata oluştu: {str(e)}")
+
+    def import_words(self):
+        """Kelime listesi veya CSV dosyasını arka planda içe aktar"""
+        if self.editing_blocked():
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Kelime Listesi Seç", "", "Kelime listeleri (*.txt *.csv);;Tüm dosyalar (*)"
+        )
+        if not path:
+            return
+
+        translate = self.internet_available
+        # Dizinler ana iş parçacığında, on_import_finished içinde güncellenir
+        self.import_task = BackgroundTask(
+            lambda progress: self.core.import_file(path, translate, progress, index=False), self
+        )
+        self.import_task.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"İçe aktarılıyor: {done}/{total}")
+        )
+        self.import_task.finished.connect(self.on_import_finished)
+        self.import_task.failed.connect(
+            lambda error: QMessageBox.critical(self, "Hata", f"İçe aktarma sırasında hata oluştu: {error}")
+        )
+        # İçe aktarılan kayıtlar eklenen ya da silinen kelimelerin üzerine yazmasın
+        self.set_editing_enabled(False)
+        self.import_task.failed.connect(lambda _: self.set_editing_enabled(True))
+        self.import_task.start()
+
+    def on_import_finished(self, result):
+        for word, meaning in result['entries']:
+            self.core.index_entry(word, meaning)
+        self.update_word_count()
+        self.export_timer.start()
+        self.set_editing_enabled(True)
+        self.statusBar().showMessage(
+            f"{result['added']} kelime eklendi, {result['skipped']} kelime zaten vardı, "
+            f"{result['failed']} kelime çevrilemedi."
+        )
 
     def update_word_file(self):
-        try:
-            doc = Document()
-            # Başlık stili
-            heading = doc.add_heading("Kişisel Sözlük", level=1)
-            heading.alignment = 1  # Ortalı
-            
-            # Sözlüğü alfabetik sıraya göre düzenle
-            for english, turkish in sorted(self.database.items()):
-                paragraph = doc.add_paragraph()
-                # İngilizce kelime (kalın ve kırmızı)
-                eng_run = paragraph.add_run(f"{english}")
-                eng_run.bold = True
-                eng_run.font.color.rgb = RGBColor(255, 0, 0)  # Kırmızı
-                
-                # Ayraç
-                paragraph.add_run(" - ")
-                
-                # Türkçe kelime (mavi ve normal)
-                tr_run = paragraph.add_run(f"{turkish}")
-                tr_run.bold = False
-                tr_run.font.color.rgb = RGBColor(0, 0, 255)  # Mavi
-            
-            doc.save(WORD_FILE)
-        except Exception as e:
-            QMessageBox.warning(self, "Hata", f"Word dosyası güncellenirken hata oluştu: {e}")
+        """Word belgesini arka planda güncelle; sözlük değişmediyse belge yeniden yazılmaz"""
+        if self.export_task is not None and self.export_task.is_running():
+            # Süren dışa aktarma bitince bir kez daha çalıştırılır
+            self.export_pending = True
+            return
+        self.export_timer.stop()
+        self.export_task = BackgroundTask(lambda progress: self.core.export_docx(), self)
+        self.export_task.finished.connect(self.on_export_finished)
+        self.export_task.failed.connect(self.on_export_failed)
+        self.export_task.start()
 
-    def check_internet_connection(self):
-        """İnternet bağlantısını kontrol et"""
-        try:
-            urllib.request.urlopen('http://google.com', timeout=1)
-            self.internet_available = True
-        except:
-            self.internet_available = False
-            self.handle_connection_loss()  # Bağlantı kaybı durumunu yönet
+    def on_export_finished(self, result):
+        path, _ = result
+        if self.export_pending:
+            self.export_pending = False
+            self.update_word_file()
+        elif self.open_export_when_ready:
+            self.open_export_when_ready = False
+            self.statusBar().clearMessage()
+            self.open_file(path)
+
+    def on_export_failed(self, error):
+        self.export_pending = False
+        self.open_export_when_ready = False
+        QMessageBox.warning(self, "Hata", f"Word dosyası güncellenirken hata oluştu: {error}")
+
+    def sync_excel(self, path=None):
+        """Excel dosyası değiştiyse arka planda okuyup son okunan haliyle karşılaştır.
+
+        Dosya değişmediyse okunmaz. İlk okuma yalnızca karşılaştırma
+        tabanını oluşturur; sonraki okumalarda eklenen, değişen ve silinen
+        satırlar sözlüğe işlenir.
+        """
+        if self.sync_task is not None and self.sync_task.is_running():
+            self.sync_pending = True
+            return
+        self.sync_task = BackgroundTask(lambda progress: self.core.read_excel_changes(), self)
+        self.sync_task.finished.connect(self.on_excel_synced)
+        self.sync_task.failed.connect(lambda _: self.on_excel_synced(None))
+        self.sync_task.start()
+
+    def on_excel_synced(self, result):
+        if result is not None:
+            changed, removed, baseline = result
+            updated, deleted = self.core.apply_changes(changed, removed)
+            self.core.save_excel_baseline(baseline)
+            if updated or deleted:
+                self.update_word_count()
+                self.export_timer.start()
+                self.statusBar().showMessage(
+                    f"Excel dosyasından {updated} kayıt güncellendi, {deleted} kayıt silindi."
+                )
+        if self.sync_pending:
+            self.sync_pending = False
+            self.sync_excel()
 
+    def update_completions(self):
+        """Yazılan öneke göre otomatik tamamlama listesini güncelle"""
+        if self.reverse_mode():
+            return
+        prefix = self.word_input.text().strip().lower()
+        completions = self.core.complete(prefix)
+        self.completion_model.setStringList(completions)
+        if completions and completions != [prefix]:
+            self.completer.complete()
+
+    def prefetch_translation(self):
+        """Yazma durunca sözlükte olmayan kelimenin çevirisini arka planda başlat"""
+        if not self.internet_available or self.reverse_mode() or not self.core.loaded:
+            return
+        word = self.word_input.text().strip().lower()
+        if not word or self.core.lookup(word) is not None:
+            return
+        self.translation_worker.prefetch(word)
+
+    def on_connectivity_changed(self, online):
+        """Bağlantı durumu değiştiğinde arayüzü güncelle"""
+        self.internet_available = online
+        if online:
+            self.statusBar().clearMessage()
+        else:
+            self.statusBar().showMessage("İnternet bağlantısı yok")
+
+    @diagnostics.timed('search_word')
     def search_word(self):
         try:
             word = self.word_input.text().strip().lower()
@@ -508,54 +715,139 @@ class DictionaryApp(QMainWindow):
                 self.result_label.setStyleSheet("color: #e74c3c;")
                 return
 
+            if self.reverse_mode():
+                # str.lower() Türkçe I/İ harflerini yanlış çevirir, ham metni kullan
+                self.search_meaning(self.word_input.text().strip())
+                return
+
             # Veritabanı araması (RAM'den)
-            if word in self.database:
+            meaning = self.core.lookup(word)
+            if meaning is not None:
                 message = (
                     f"Bu kelime sözlüğünüzde bulunuyor!\n\n"
                     f"İngilizce: {word}\n"
-                    f"Türkçe Anlamı: {self.database[word]}"
+                    f"Türkçe Anlamı: {meaning}"
                 )
                 self.result_label.setText(message)
                 self.result_label.setStyleSheet("color: #27ae60;")  # Yeşil renk
                 self.hide_input_fields()
                 return
 
-            # İnternet bağlantısı kontrolü artık daha hızlı
-            if self.internet_available:
-                translated_word = self.translate_word(word)
+            # Yakın kayıtlar varsa çeviriden önce onları göster,
+            # aynı kelime tekrar aranırsa çeviriye geç
+            if word != self.last_fuzzy_word:
+                matches = self.core.suggest(word, limit=5)
+                if matches:
+                    self.last_fuzzy_word = word
+                    suggestions = "\n".join(f"{match} - {meaning}" for match, meaning in matches)
+                    self.result_label.setText(
+                        "Bu kelime sözlüğünüzde bulunmuyor.\n\n"
+                        f"Bunu mu demek istediniz?\n{suggestions}\n\n"
+                        "Çeviri için tekrar arayın."
+                    )
+                    self.result_label.setStyleSheet("color: #e67e22;")
+                    self.hide_input_fields()
+                    return
+            self.last_fuzzy_word = None
+            self.translation_worker.record_lookup(word)
+
+            # Önbellekteki ve çevrimdışı sözlükteki çeviriler beklemeden,
+            # internet olmadan da gösterilir
+            cached = self.core.offline_translation(word)
+            if cached is not None:
+                self.show_input_fields(self.suggestion_message(cached), cached)
+            elif self.internet_available:
+                # Çeviri arka planda yapılır, sonuç on_translation_ready ile gelir
                 message = (
                     "Bu kelime sözlüğünüzde bulunmuyor.\n\n"
-                    f"Önerilen Türkçe karşılığı: {translated_word}\n\n"
+                    "Çeviri yapılıyor...\n\n"
                     "Kaydetmek isterseniz Türkçe anlamını girin."
                 )
+                self.show_input_fields(message)
+                self.translation_worker.request(word)
             else:
                 message = (
                     "Bu kelime sözlüğünüzde bulunmuyor.\n\n"
                     "Çeviri için internet bağlantısı gerekli.\n"
                     "Lütfen bağlantınızı kontrol edin."
                 )
-                translated_word = ""
-            
-            self.show_input_fields(message, translated_word)
+                self.show_input_fields(message)
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Bir hata oluştu: {str(e)}")
 
-    @lru_cache(maxsize=1000)  # Son 1000 çeviriyi önbellekte tut
+    def reverse_mode(self):
+        return self.mode_combo.currentIndex() == 1
+
+    def change_search_mode(self):
+        """Arama yönü değiştiğinde etiketleri ve alanları sıfırla"""
+        if self.reverse_mode():
+            self.eng_label.setText("Türkçe Kelime")
+            self.word_input.setPlaceholderText("Aramak istediğiniz Türkçe anlamı girin...")
+        else:
+            self.eng_label.setText("İngilizce Kelime")
+            self.word_input.setPlaceholderText("Aramak istediğiniz kelimeyi girin...")
+        self.cancel_add()
+
+    @diagnostics.timed('search_meaning')
+    def search_meaning(self, meaning):
+        """Türkçe anlamdan sözlükteki İngilizce kelimeleri bul"""
+        self.hide_input_fields()
+        matches = self.core.reverse_lookup(meaning)
+        if not matches:
+            self.result_label.setText(f"'{meaning}' anlamına sahip bir kelime sözlüğünüzde bulunmuyor.")
+            self.result_label.setStyleSheet("color: #e74c3c;")
+            return
+        lines = "\n".join(f"{english} - {turkish}" for english, turkish in matches[:20])
+        self.result_label.setText(f"'{meaning}' anlamına sahip kelimeler:\n\n{lines}")
+        self.result_label.setStyleSheet("color: #27ae60;")
+
+    def on_translation_ready(self, word, translated_word):
+        """Arka plandaki çeviri tamamlandığında öneriyi göster"""
+        if word != self.word_input.text().strip().lower():
+            return
+        self.result_label.setText(self.suggestion_message(translated_word))
+        # Kullanıcı bu arada kendi anlamını yazdıysa ya da çeviri
+        # yapılamadıysa anlam alanı doldurulmaz
+        if translated_word in (TRANSLATION_FAILED, NO_INTERNET):
+            return
+        if not self.meaning_input.text():
+            self.meaning_input.setText(translated_word)
+
+    def suggestion_message(self, translated_word):
+        return (
+            "Bu kelime sözlüğünüzde bulunmuyor.\n\n"
+            f"Önerilen Türkçe karşılığı: {translated_word}\n\n"
+            "Kaydetmek isterseniz Türkçe anlamını girin."
+        )
+
+    @diagnostics.timed('translate_word')
     def translate_word(self, word):
-        """Google Translate API kullanarak çeviri yap"""
+        """Önce önbelleğe bak, yoksa Google Translate API kullanarak çeviri yap"""
+        if not self.internet_available:
+            cached = self.core.offline_translation(word)
+            return cached if cached is not None else NO_INTERNET
+
         try:
-            if not self.internet_available:
-                return "İnternet bağlantısı yok"
-            
-            translation = self.translator.translate(text=word)
-            return translation
+            translation = self.core.translate(word)
+        except (CircuitOpenError, RecentlyFailedError):
+            # Servis art arda hata verdi ya da kelime az önce çevrilemedi;
+            # istek gönderilmediği için bağlantı hatası sayılmaz
+            diagnostics.count('translation_failures')
+            return TRANSLATION_FAILED
         except Exception as e:
             print(f"Çeviri hatası: {e}")
-            return "çeviri yapılamadı"
+            diagnostics.count('translation_failures')
+            self.connectivity.report_failure()
+            return TRANSLATION_FAILED
+
+        self.connectivity.report_success()
+        return translation
 
     def add_word(self):
         """Yeni kelime ekle butonuna tıklandığında"""
+        if self.editing_blocked():
+            return
         try:
             word = self.word_input.text().strip().lower()
             meaning = self.meaning_input.text().strip()
@@ -572,29 +864,93 @@ class DictionaryApp(QMainWindow):
 
     def update_word_count(self):
         """Kelime sayısını güncelle"""
-        count = len(self.database)
+        count = self.core.count()
         self.word_count_label.setText(f"Sözlüğünüzde {count} kelime bulunuyor")
-        self.word_count_label.setStyleSheet(f"color: {counter_color};")  
+        if self.browser is not None and self.browser.isVisible():
+            self.browser.refresh_if_changed()
 
     def open_dictionary(self):
-        """Word dosyasını aç"""
+        """Sözlüğü uygulama içindeki tabloda göster"""
+        if self.browser is None:
+            self.browser = DictionaryBrowser(self.core, self)
+            self.browser.model.changed.connect(self.on_browser_changed)
+            self.browser.document_requested.connect(self.open_word_file)
+            self.browser.excel_requested.connect(self.open_excel_file)
+        self.browser.show()
+        self.browser.raise_()
+        self.browser.activateWindow()
+
+    def on_browser_changed(self):
+        self.update_word_count()
+        self.export_timer.start()
+
+    def open_word_file(self):
+        """Son hazırlanan Word belgesini aç, yoksa hazırlanınca aç"""
+        docx_file = self.core.docx_file
+        if os.path.exists(docx_file):
+            self.open_file(docx_file)
+            # Sözlük değiştiyse bir sonraki açılış için belgeyi güncelle
+            self.update_word_file()
+            return
+        self.open_export_when_ready = True
+        self.statusBar().showMessage("Sözlük belgesi hazırlanıyor...")
+        self.update_word_file()
+
+    def open_excel_file(self):
+        """Sözlüğü Excel dosyasına arka planda yazıp aç; dosyada yapılan değişiklikler sözlüğe alınır"""
+        if self.excel_export_task is not None and self.excel_export_task.is_running():
+            return
+        self.statusBar().showMessage("Excel dosyası hazırlanıyor...")
+        self.excel_export_task = BackgroundTask(lambda progress: self.core.export_excel(), self)
+        self.excel_export_task.finished.connect(self.on_excel_exported)
+        self.excel_export_task.failed.connect(
+            lambda error: QMessageBox.warning(self, "Hata", f"Excel dosyası yazılırken hata oluştu: {error}")
+        )
+        self.excel_export_task.start()
+
+    def on_excel_exported(self, path):
+        self.statusBar().clearMessage()
+        self.open_file(path)
+
+    def open_file(self, path):
+        """Dosyayı sistemin varsayılan uygulamasıyla aç"""
         try:
-            import os
-            import platform
-            
             if platform.system() == 'Windows':
-                os.startfile(WORD_FILE)
+                os.startfile(path)
             elif platform.system() == 'Darwin':  # macOS
-                os.system(f'open {WORD_FILE}')
+                os.system(f'open "{path}"')
             else:  # Linux
-                os.system(f'xdg-open {WORD_FILE}')
+                os.system(f'xdg-open "{path}"')
         except Exception as e:
             QMessageBox.warning(self, "Hata", f"Sözlük dosyası açılırken bir hata oluştu: {e}")
 
     def closeEvent(self, event):
         """Uygulama kapatılırken event loop'u temizle"""
+        self.connectivity.stop()
+        self.export_timer.stop()
+        self.prefetch_timer.stop()
+        self.excel_watcher.stop()
+        if self.load_task is not None:
+            self.load_task.wait()
+        if self.export_task is not None:
+            self.export_task.wait()
+        if self.excel_export_task is not None:
+            self.excel_export_task.wait()
+        if self.sync_task is not None:
+            self.sync_task.wait()
+        if self.import_task is not None:
+            self.import_task.wait()
+        self.translation_worker.shutdown()
+        self.core.close()
         super().closeEvent(event)
 
+    def show_diagnostics(self):
+        """Ctrl+Shift+D ile açılan tanılama penceresi"""
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self.core, self.translation_worker, self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
     def cancel_add(self):
         """İptal butonuna tıklandığında"""
         self.word_input.clear()
@@ -627,6 +983,8 @@ class DictionaryApp(QMainWindow):
 
     def clear_dictionary(self):
         """Sözlüğü temizle"""
+        if self.editing_blocked():
+            return
         reply = QMessageBox.question(
             self,
             'Sözlüğü Temizle',
@@ -637,31 +995,8 @@ class DictionaryApp(QMainWindow):
 
         if reply == QMessageBox.Yes:
             try:
-                # Boş DataFrame oluştur
-                df = pd.DataFrame(columns=['English', 'Turkish', 'Date'])
-                
-                # Excel yazıcı oluştur
-                with pd.ExcelWriter(self.excel_file, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False)
-                    
-                    # Excel çalışma sayfasını al
-                    worksheet = writer.sheets['Sheet1']
-                    
-                    # Başlık satırını sarı yap
-                    from openpyxl.styles import PatternFill
-                    yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                    
-                    # Başlıkları formatla
-                    for cell in worksheet[1]:
-                        cell.fill = yellow_fill
-                    
-                    # Sütun genişliklerini ayarla
-                    worksheet.column_dimensions['A'].width = 20
-                    worksheet.column_dimensions['B'].width = 20
-                    worksheet.column_dimensions['C'].width = 15
-
-                # RAM'deki sözlüğü temizle
-                self.database.clear()
+                # Veritabanını, dışa aktarılmış Excel dosyasını ve dizinleri temizle
+                self.core.clear()
                 
                 # Input alanlarını temizle
                 self.word_input.clear()
@@ -681,8 +1016,9 @@ class DictionaryApp(QMainWindow):
                 self.result_label.setText("Sözlük temizlendi!")
                 self.result_label.setStyleSheet("color: #27ae60;")
 
-                # Sözlük temizlendikten sonra sayıyı güncelle
+                # Sözlük temizlendikten sonra sayıyı ve Word belgesini güncelle
                 self.update_word_count()
+                self.export_timer.start()
 
             except Exception as e:
                 QMessageBox.critical(
@@ -694,6 +1030,7 @@ class DictionaryApp(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
     window = DictionaryApp()
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,171 @@
+"""Kelime listesi veya CSV dosyasından toplu içe aktarma.
+
+Komut satırından: python -m dictionary_cli import kelimeler.csv
+"""
+import csv
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from itertools import islice
+
+from dictionary_translators import CircuitOpenError
+
+# Varsayılan içe aktarma ayarları
+BATCH_SIZE = 50
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 5
+MAX_RETRIES = 3
+
+
+def read_word_list(path):
+    """Dosyadaki (ingilizce, türkçe) çiftlerini akış halinde oku.
+
+    CSV dosyalarında ilk iki sütun kullanılır, 'English' başlığı atlanır.
+    Düz metin dosyalarında her satır bir kelimedir; sekmeyle ayrılmış
+    ikinci sütun varsa anlam olarak alınır. Anlamı olmayan kelimeler
+    için türkçe değeri boş döner.
+    """
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            rows = csv.reader(f)
+        else:
+            rows = (line.rstrip('\r\n').split('\t') for line in f)
+        for row in rows:
+            if not row or not row[0].strip():
+                continue
+            english = row[0].strip().lower()
+            if english == 'english':
+                continue
+            turkish = row[1].strip() if len(row) > 1 else ""
+            yield english, turkish
+
+
+def translate_lines(translator, words, limiter=None):
+    """Kelimeleri satır satır birleştirip tek istekte çevir.
+
+    Dönen satır sayısı tutmazsa kelimeler tek tek, her istekten önce
+    `limiter` beklenerek çevrilir; çevrilemeyen kelimeler için None döner,
+    diğerlerinin çevirisi korunur.
+    """
+    result = translator.translate("\n".join(words))
+    lines = [line.strip() for line in (result or "").split("\n")]
+    if len(lines) == len(words):
+        return lines
+
+    translations = []
+    for word in words:
+        if limiter is not None:
+            limiter.wait()
+        try:
+            translations.append(translator.translate(word))
+        except CircuitOpenError:
+            # Kalan kelimeler ağa çıkmadan çevrilemedi sayılır
+            break
+        except Exception as e:
+            print(f"Çeviri hatası ({word}): {e}")
+            translations.append(None)
+    return translations + [None] * (len(words) - len(translations))
+
+
+class RateLimiter:
+    """İş parçacıkları arasında saniyedeki istek sayısını sınırlar"""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second else 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _translate_chunk(translate, chunk, limiter, retries, circuit_open):
+    # Parça içindeki ek istekler de aynı hız sınırına uyar
+    for attempt in range(retries):
+        # Devre açıldıysa kalan parçalar ağa çıkmadan çevrilemedi sayılır
+        if circuit_open.is_set():
+            return None
+        limiter.wait()
+        try:
+            return translate(chunk, limiter)
+        except CircuitOpenError as e:
+            print(f"Toplu çeviri durduruldu: {e}")
+            circuit_open.set()
+            return None
+        except Exception as e:
+            print(f"Toplu çeviri hatası ({attempt + 1}/{retries}): {e}")
+            if attempt + 1 < retries:
+                time.sleep(2 ** attempt)
+    return None
+
+
+def bulk_import(storage, path, translate=None, existing=None, progress=None,
+                batch_size=BATCH_SIZE, max_workers=MAX_WORKERS,
+                requests_per_second=REQUESTS_PER_SECOND, retries=MAX_RETRIES):
+    """Dosyadaki kelimeleri sözlüğe ekle.
+
+    Sözlükte zaten olan kelimeler atlanır, anlamı olmayanlar
+    `translate(kelimeler, limiter)` ile parça parça ve eşzamanlı çevrilir;
+    parça içinde birden çok istek atılırsa her biri `limiter.wait()` ile
+    beklenmelidir. Tüm kayıtlar tek işlemde yazılır.
+    `existing` verilmezse kelimeler sözlük belleğe kopyalanmadan
+    veritabanında aranır. `progress(tamamlanan, toplam)` her parça
+    sonrası çağrılır.
+    """
+    if existing is None:
+        def exists(english):
+            return storage.get(english) is not None
+    else:
+        exists = existing.__contains__
+
+    date = datetime.now().strftime("%Y-%m-%d")
+    entries = {}
+    missing = []
+    skipped = 0
+    for english, turkish in read_word_list(path):
+        if english in entries or exists(english):
+            skipped += 1
+            continue
+        entries[english] = turkish
+        if not turkish:
+            missing.append(english)
+
+    total = len(entries)
+    done = total - len(missing)
+    if progress:
+        progress(done, total)
+
+    if missing and translate is not None:
+        limiter = RateLimiter(requests_per_second)
+        circuit_open = threading.Event()
+        words = iter(missing)
+        chunks = iter(lambda: list(islice(words, batch_size)), [])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_translate_chunk, translate, chunk, limiter, retries, circuit_open): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                translations = future.result()
+                if translations is not None:
+                    for english, turkish in zip(chunk, translations):
+                        entries[english] = turkish or ""
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+
+    rows = [(english, turkish, date) for english, turkish in entries.items() if turkish]
+    storage.put_many(rows)
+    return {
+        'added': len(rows),
+        'skipped': skipped,
+        'failed': total - len(rows),
+        'entries': [(english, turkish) for english, turkish, _ in rows],
+    }
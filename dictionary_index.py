@@ -0,0 +1,247 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from itertools import islice
+
+# Otomatik tamamlamada gösterilecek varsayılan öneri sayısı
+DEFAULT_LIMIT = 10
+
+# Türkçe anlamlardaki sözcükler (harf ve rakam dizileri)
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class PrefixIndex:
+    """Sıralı anahtar dizisi üzerinde ikili arama ile önek sorguları.
+
+    Dizi yüklemede bir kez sıralanır, ekleme ve silmeler yerinde yapılır.
+    """
+
+    def __init__(self, words=()):
+        self.keys = sorted(set(words))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, word):
+        i = bisect_left(self.keys, word)
+        return i < len(self.keys) and self.keys[i] == word
+
+    def add(self, word):
+        if word not in self:
+            insort(self.keys, word)
+
+    def remove(self, word):
+        i = bisect_left(self.keys, word)
+        if i < len(self.keys) and self.keys[i] == word:
+            del self.keys[i]
+
+    def clear(self):
+        self.keys.clear()
+
+    def complete(self, prefix, limit=DEFAULT_LIMIT):
+        """Önekle başlayan ilk `limit` kelimeyi alfabetik sırayla döndür"""
+        if not prefix:
+            return []
+        result = []
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            word = self.keys[i]
+            if not word.startswith(prefix) or len(result) >= limit:
+                break
+            result.append(word)
+        return result
+
+
+def edit_distance(a, b, max_distance):
+    """Sınırlı Damerau-Levenshtein (bitişik yer değiştirme dahil) uzaklığı.
+
+    Uzaklık max_distance değerini aşarsa max_distance + 1 döndürülür.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class FuzzyIndex:
+    """SymSpell yöntemiyle yaklaşık kelime araması.
+
+    Her kelimenin ilk `prefix_length` harfinden en fazla `max_distance`
+    harf silinerek elde edilen varyantlar kelimeye eşlenir. Sorguda aynı
+    varyantlar üretilip adaylar gerçek uzaklıkla doğrulanır.
+    """
+
+    def __init__(self, words=(), max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = {}
+        self.words = set()
+        self._lock = threading.Lock()
+        self.add_many(words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _variants(self, word):
+        variants = {word[:self.prefix_length]}
+        frontier = variants
+        for _ in range(self.max_distance):
+            frontier = {
+                variant[:i] + variant[i + 1:]
+                for variant in frontier
+                for i in range(len(variant))
+            }
+            variants |= frontier
+        return variants
+
+    def _add(self, word):
+        if word in self.words:
+            return
+        self.words.add(word)
+        for variant in self._variants(word):
+            bucket = self.deletes.get(variant)
+            # Bellek için tek kelimelik kovalar liste yerine str olarak tutulur
+            if bucket is None:
+                self.deletes[variant] = word
+            elif isinstance(bucket, str):
+                self.deletes[variant] = [bucket, word]
+            else:
+                bucket.append(word)
+
+    def add(self, word):
+        with self._lock:
+            self._add(word)
+
+    def add_many(self, words, chunk_size=1000):
+        """Kelimeleri parça parça ekle, aradaki sorgular kilitte uzun beklemesin"""
+        words = iter(words)
+        while True:
+            chunk = list(islice(words, chunk_size))
+            if not chunk:
+                return
+            with self._lock:
+                for word in chunk:
+                    self._add(word)
+
+    def remove(self, word):
+        with self._lock:
+            if word not in self.words:
+                return
+            self.words.discard(word)
+            for variant in self._variants(word):
+                bucket = self.deletes.get(variant)
+                if bucket == word:
+                    del self.deletes[variant]
+                elif isinstance(bucket, list) and word in bucket:
+                    bucket.remove(word)
+                    if len(bucket) == 1:
+                        self.deletes[variant] = bucket[0]
+
+    def clear(self):
+        with self._lock:
+            self.deletes.clear()
+            self.words.clear()
+
+    def lookup(self, word, limit=DEFAULT_LIMIT):
+        """Kelimeye en yakın kayıtları (uzaklık, kelime) olarak döndür"""
+        with self._lock:
+            candidates = set()
+            for variant in self._variants(word):
+                bucket = self.deletes.get(variant)
+                if bucket is None:
+                    continue
+                if isinstance(bucket, str):
+                    candidates.add(bucket)
+                else:
+                    candidates.update(bucket)
+
+        matches = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, self.max_distance)
+            if distance <= self.max_distance:
+                matches.append((distance, candidate))
+        matches.sort()
+        return matches[:limit]
+
+
+def turkish_fold(text):
+    """Türkçe kurallarına göre küçük harfe çevir (I -> ı, İ -> i)"""
+    return text.replace('I', 'ı').replace('İ', 'i').lower()
+
+
+def tokenize_meaning(meaning):
+    """Anlamı sözcüklere böl; virgül, noktalama ve boşluklar ayraç sayılır"""
+    return TOKEN_PATTERN.findall(turkish_fold(meaning))
+
+
+class ReverseIndex:
+    """Türkçe anlamlardaki sözcüklerden İngilizce kelimelere ters dizin.
+
+    Yaklaşık arama dizini gibi arka planda parça parça doldurulabilir.
+    """
+
+    def __init__(self, entries=()):
+        self.tokens = {}
+        self._lock = threading.Lock()
+        self.add_many(entries)
+
+    def _add(self, english, turkish):
+        for token in tokenize_meaning(turkish or ""):
+            self.tokens.setdefault(token, set()).add(english)
+
+    def add(self, english, turkish):
+        with self._lock:
+            self._add(english, turkish)
+
+    def add_many(self, entries, chunk_size=1000):
+        """(ingilizce, türkçe) kayıtlarını parça parça ekle"""
+        entries = iter(entries)
+        while True:
+            chunk = list(islice(entries, chunk_size))
+            if not chunk:
+                return
+            with self._lock:
+                for english, turkish in chunk:
+                    self._add(english, turkish)
+
+    def remove(self, english, turkish):
+        with self._lock:
+            for token in tokenize_meaning(turkish or ""):
+                words = self.tokens.get(token)
+                if words is None:
+                    continue
+                words.discard(english)
+                if not words:
+                    del self.tokens[token]
+
+    def clear(self):
+        with self._lock:
+            self.tokens.clear()
+
+    def lookup(self, query):
+        """Sorgudaki tüm sözcükleri anlamında içeren İngilizce kelimeleri döndür"""
+        tokens = tokenize_meaning(query)
+        if not tokens:
+            return []
+        result = None
+        with self._lock:
+            for token in tokens:
+                words = self.tokens.get(token, set())
+                result = set(words) if result is None else result & words
+                if not result:
+                    return []
+        return sorted(result)
@@ -0,0 +1,60 @@
+"""Çevrimdışı İngilizce-Türkçe sözlük (lexicon).
+
+Kullanıcının verdiği ya da uygulamayla gelen sekmeyle ayrılmış bir sözlük
+dosyası (FreeDict dökümleri gibi) okunur ve CompactDictionary olarak
+tutulur. Çeviri istenen kelime önce burada aranır; bulunursa Google'a
+istek atılmaz, internet yokken de öneri gösterilir.
+
+Dosya biçimi, satır başına bir kayıt:
+    ingilizce<TAB>türkçe
+'#' ile başlayan satırlar ve boş satırlar atlanır. Aynı kelime birden
+fazla satırda geçerse anlamlar virgülle birleştirilir. Dosya .gz ile
+bitiyorsa gzip olarak açılır.
+"""
+import gzip
+
+from dictionary_compact import CompactDictionary
+
+LEXICON_FILE = "ingilizce_turkce.tsv"
+
+
+def iter_lexicon(path):
+    """Sözlük dosyasındaki (ingilizce, türkçe) satırlarını döndür"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            english, separator, turkish = line.rstrip("\r\n").partition("\t")
+            english = english.strip().lower()
+            # FreeDict dökümlerinde ek sütunlar olabilir, yalnızca ikincisi alınır
+            turkish = turkish.split("\t")[0].strip()
+            if separator and english and turkish:
+                yield english, turkish
+
+
+class Lexicon:
+    """Salt okunur {ingilizce: türkçe} çeviri sözlüğü"""
+
+    def __init__(self, entries=()):
+        merged = {}
+        for english, turkish in entries:
+            meanings = merged.setdefault(english, [])
+            if turkish not in meanings:
+                meanings.append(turkish)
+        self._store = CompactDictionary(
+            (english, ", ".join(meanings)) for english, meanings in merged.items()
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(iter_lexicon(path))
+
+    def get(self, word):
+        return self._store.get(word)
+
+    def __contains__(self, word):
+        return word in self._store
+
+    def __len__(self):
+        return len(self._store)
@@ -0,0 +1,202 @@
+"""Birden çok sözlük dosyasını tek sözlükte birleştirme.
+
+Dosyalar pandas DataFrame'lerine okunur ve normalleştirilmiş İngilizce
+kelime üzerinden satır satır döngü kurulmadan, vektörel işlemlerle
+birleştirilir. İlk dosya yerel kopya sayılır. Aynı kelimenin farklı
+anlamları varsa çakışma şu kurallardan biriyle çözülür:
+
+    newest  Tarihi en yeni kayıt kazanır; tarihler eşitse öndeki dosya
+    both    Tüm anlamlar virgülle birleştirilir (tekrar edenler bir kez)
+    local   Öndeki dosya (önce yerel kopya) kazanır
+
+Çakışan kelimeler her dosyadaki anlamları ve sonuçla birlikte fark
+raporuna yazılır. Sonuç dictionary_export ile tek geçişte yazılır; .db
+hedefi ya da verilen depo için kayıtlar put_many ile işlenir, hedefteki
+aynı kelimelerin anlamı çözülmüş anlamla değiştirilir.
+
+Komut satırından:
+    python -m dictionary_cli merge benim.xlsx arkadas.xlsx -o birlesik.xlsx --rule newest --report fark.csv
+    python -m dictionary_cli merge sozluk.db arkadas.xlsx --apply
+
+pandas yalnızca birleştirme sırasında yüklenir.
+"""
+import os
+import sqlite3
+
+from dictionary_export import export_entries
+from dictionary_storage import SQLiteStorage, iter_rows
+
+RULES = ('newest', 'both', 'local')
+DEFAULT_RULE = 'newest'
+FIELDS = ['english', 'turkish', 'date']
+
+
+def _read_xlsx(path):
+    import pandas as pd
+    return pd.DataFrame.from_records(iter_rows(path), columns=FIELDS)
+
+
+def _read_csv(path):
+    import pandas as pd
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    frame.columns = [name.lower() for name in frame.columns]
+    return frame
+
+
+def _read_jsonl(path):
+    import pandas as pd
+    return pd.read_json(path, lines=True, dtype=False)
+
+
+def _read_database(path):
+    import pandas as pd
+    # Olmayan dosya için boş veritabanı oluşturulmasın
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return pd.read_sql_query("SELECT english, turkish, date FROM words", conn)
+    finally:
+        conn.close()
+
+
+READERS = {
+    '.xlsx': _read_xlsx,
+    '.csv': _read_csv,
+    '.jsonl': _read_jsonl,
+    '.db': _read_database,
+}
+
+
+def read_dictionary(path):
+    """Sözlük dosyasını normalleştirilmiş english/turkish/date sütunlarıyla oku.
+
+    Kelimeler sözlük anahtarı biçimine getirilir, kelimesi ya da anlamı
+    boş satırlar atlanır. Bir kelime dosyada birden çok kez geçiyorsa
+    tarihi en yeni olanı kalır.
+    """
+    reader = READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Desteklenmeyen sözlük dosyası: {path} (seçenekler: {', '.join(READERS)})")
+    if not os.path.exists(path):
+        raise ValueError(f"Dosya bulunamadı: {path}")
+    frame = reader(path)
+    missing = [name for name in ('english', 'turkish') if name not in frame.columns]
+    if missing:
+        raise ValueError(f"{path} dosyasında sütun eksik: {', '.join(missing)}")
+    if 'date' not in frame.columns:
+        frame['date'] = ""
+
+    frame = frame[FIELDS].fillna("").astype(str)
+    frame['english'] = frame['english'].str.strip().str.lower()
+    frame['turkish'] = frame['turkish'].str.strip()
+    frame['date'] = frame['date'].str.slice(0, 10)
+    frame = frame[(frame['english'] != "") & (frame['turkish'] != "")]
+    return (frame.sort_values(['english', 'date'], kind='stable')
+            .drop_duplicates('english', keep='last')
+            .reset_index(drop=True))
+
+
+def _join_meanings(conflicts):
+    """Çakışan kayıtların anlamlarını dosya sırasıyla, tekrarsız birleştir"""
+    if conflicts.empty:
+        return conflicts[FIELDS]
+    parts = conflicts.sort_values(['english', 'source'], kind='stable')
+    parts = parts.assign(turkish=parts['turkish'].str.split(',')).explode('turkish')
+    parts['turkish'] = parts['turkish'].str.strip()
+    parts = parts[parts['turkish'] != ""]
+    parts = parts.assign(folded=parts['turkish'].str.lower()).drop_duplicates(['english', 'folded'])
+    # groupby().agg(', '.join) her kelime için Python'a döner; bunun yerine
+    # anlamlar sıra numarasıyla sütunlara yayılıp sütun sütun birleştirilir
+    parts['position'] = parts.groupby('english', sort=False).cumcount()
+    wide = parts.pivot(index='english', columns='position', values='turkish')
+    meanings = wide[0]
+    for position in wide.columns[1:]:
+        meanings = meanings + (", " + wide[position]).fillna("")
+    dates = (conflicts.sort_values(['english', 'date'], kind='stable')
+             .drop_duplicates('english', keep='last').set_index('english')['date'])
+    return meanings.rename('turkish').to_frame().join(dates).reset_index()
+
+
+def merge_frames(frames, rule=DEFAULT_RULE):
+    """Sözlükleri birleştir; (sonuç, çakışmalar) DataFrame'lerini döndür.
+
+    Sonuç english/turkish/date sütunlarıyla alfabetik sıralıdır.
+    Çakışmalar her kelime için dosya sırasına (source) göre anlamları ve
+    tarihleri içerir.
+    """
+    import pandas as pd
+
+    if rule not in RULES:
+        raise ValueError(f"Bilinmeyen birleştirme kuralı: {rule} (seçenekler: {', '.join(RULES)})")
+    combined = pd.concat(
+        [frame[FIELDS].assign(source=i) for i, frame in enumerate(frames)], ignore_index=True
+    )
+    conflict = combined.groupby('english', sort=False)['turkish'].transform('nunique') > 1
+    conflicts = combined[conflict]
+
+    # Anlamı her dosyada aynı olan kelimelerden en yeni tarihli kayıt kalır
+    agreed = (combined[~conflict].sort_values(['english', 'date'], kind='stable')
+              .drop_duplicates('english', keep='last'))
+    if rule == 'both':
+        resolved = _join_meanings(conflicts)
+    elif rule == 'newest':
+        resolved = (conflicts.sort_values(['english', 'date', 'source'], ascending=[True, True, False])
+                    .drop_duplicates('english', keep='last'))
+    else:
+        resolved = conflicts.sort_values(['english', 'source']).drop_duplicates('english', keep='first')
+
+    result = pd.concat([agreed[FIELDS], resolved[FIELDS]], ignore_index=True)
+    result = result.sort_values('english', ignore_index=True)
+    return result, conflicts
+
+
+def diff_report(conflicts, result, names):
+    """Çakışan her kelime için dosyalardaki anlamları ve sonucu tablo olarak döndür"""
+    report = conflicts.pivot(index='english', columns='source', values='turkish')
+    report.columns = [names[source] for source in report.columns]
+    merged = result.set_index('english')['turkish'].rename('sonuç')
+    return report.join(merged, how='left').reset_index().fillna("")
+
+
+def write_storage(result, storage):
+    """Birleştirilmiş kayıtları depoya tek işlemde yaz"""
+    storage.put_many(
+        (english, turkish, date or None) for english, turkish, date in result.itertuples(index=False, name=None)
+    )
+
+
+def merge_files(paths, output=None, rule=DEFAULT_RULE, report=None, storage=None):
+    """Dosyaları birleştirip output dosyasına (biçim uzantıdan) ya da depoya yaz, özet döndür.
+
+    output .db ile bitiyorsa kayıtlar o SQLite sözlüğüne, storage
+    verilirse o depoya işlenir. report verilirse çakışmalar CSV fark
+    raporu olarak yazılır.
+    """
+    if len(paths) < 2:
+        raise ValueError("Birleştirmek için en az iki dosya gerekli")
+    if output is None and storage is None:
+        raise ValueError("Birleştirilen sözlüğün yazılacağı dosya ya da depo gerekli")
+    frames = [read_dictionary(path) for path in paths]
+    result, conflicts = merge_frames(frames, rule)
+
+    if storage is not None:
+        write_storage(result, storage)
+    if output is not None and os.path.splitext(output)[1].lower() == '.db':
+        target = SQLiteStorage(output)
+        try:
+            write_storage(result, target)
+        finally:
+            target.close()
+    elif output is not None:
+        export_entries(result.itertuples(index=False, name=None), output)
+    conflict_count = conflicts['english'].nunique()
+    if report is not None:
+        names = [os.path.basename(path) for path in paths]
+        if len(set(names)) < len(names):
+            names = list(paths)
+        diff_report(conflicts, result, names).to_csv(report, index=False, encoding='utf-8-sig')
+    return {
+        'sources': [len(frame) for frame in frames],
+        'entries': len(result),
+        'added': len(result) - len(frames[0]),
+        'conflicts': conflict_count,
+    }
@@ -0,0 +1,247 @@
+"""Sözlüğü yerel ağdaki istemcilere sunan asyncio tabanlı HTTP/JSON servisi.
+
+Sözlük bir kez belleğe alınır; okumalar olay döngüsünde doğrudan bellekten
+yanıtlanır, yazmalar tek bir yazıcı görevde sıraya alınıp toplu olarak
+veritabanına işlenir. Arayüz açmadan çalışır:
+
+    python -m dictionary_cli serve --port 8765
+
+Uç noktalar:
+    GET  /lookup?word=apple                 tam eşleşme
+    GET  /complete?prefix=app&limit=10      önekle başlayan kelimeler
+    GET  /reverse?meaning=elma              Türkçe anlamdan arama
+    POST /lookup  {"words": [...]}          toplu arama
+    POST /words   {"word": ..., "meaning": ...}  kelime ekleme
+    GET  /metrics                           uç nokta başına gecikme ölçümleri
+    GET  /health
+"""
+import asyncio
+import json
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from dictionary_core import normalize_word
+from dictionary_diagnostics import Diagnostics
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# Tek istekte kabul edilen en büyük gövde ve toplu aramadaki en fazla kelime
+MAX_BODY = 1024 * 1024
+MAX_BATCH = 1000
+# Yazıcı görevin tek işlemde veritabanına yazacağı en fazla kayıt
+MAX_WRITE_BATCH = 500
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class DictionaryServer:
+    """DictionaryCore'u HTTP üzerinden sunar; core önceden load() edilmiş olmalıdır"""
+
+    def __init__(self, core, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.core = core
+        self.host = host
+        self.port = port
+        self.metrics = Diagnostics(enabled=True)
+        self.started = time.time()
+        self._server = None
+        self._writes = None
+        self._writer_task = None
+        # Açık bağlantılar ve onları işleyen görevler
+        self._connections = {}
+        self.routes = {
+            ('GET', '/lookup'): self.lookup,
+            ('GET', '/complete'): self.complete,
+            ('GET', '/reverse'): self.reverse,
+            ('POST', '/lookup'): self.lookup_batch,
+            ('POST', '/words'): self.add_word,
+            ('GET', '/metrics'): self.metrics_report,
+            ('GET', '/health'): self.health,
+        }
+
+    async def start(self):
+        self._writes = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # port=0 verildiyse işletim sisteminin seçtiği port
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # Boşta bekleyen kalıcı bağlantılar kapatılıp görevlerin bitmesi beklenir
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*self._connections.values(), return_exceptions=True)
+            await self._server.wait_closed()
+        if self._writer_task is not None:
+            # Sıradaki yazmalar bitirilir
+            await self._writes.join()
+            self._writer_task.cancel()
+
+    async def _handle(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                start = time.perf_counter()
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY:
+                    status, payload, path = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': "istek çok büyük"}, None
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload, path = await self._dispatch(method, target, body)
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if path is not None:
+                    self.metrics.record(f"{method} {path}", time.perf_counter() - start)
+                if status.value >= 400:
+                    self.metrics.count(f"http_{status.value}")
+                if not keep_alive or length > MAX_BODY:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # Bozuk istek ya da istemci bağlantıyı kapattı
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            known = any(path == url.path for _, path in self.routes)
+            status = HTTPStatus.METHOD_NOT_ALLOWED if known else HTTPStatus.NOT_FOUND
+            return status, {'error': status.phrase}, None
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            data = json.loads(body) if body else {}
+            status, payload = await handler(query, data)
+        except HTTPError as e:
+            status, payload = e.status, {'error': str(e)}
+        except json.JSONDecodeError:
+            status, payload = HTTPStatus.BAD_REQUEST, {'error': "geçersiz JSON"}
+        except Exception as e:
+            print(f"Servis hatası: {e}")
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+        return status, payload, url.path
+
+    @staticmethod
+    def _required(values, name):
+        value = values.get(name)
+        if not isinstance(value, str) or not value.strip():
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{name}' gerekli")
+        return value
+
+    async def lookup(self, query, data):
+        word = normalize_word(self._required(query, 'word'))
+        return HTTPStatus.OK, {'word': word, 'meaning': self.core.lookup(word)}
+
+    async def complete(self, query, data):
+        prefix = self._required(query, 'prefix')
+        try:
+            limit = min(int(query.get('limit', 10)), MAX_BATCH)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'limit' sayı olmalı")
+        return HTTPStatus.OK, {'prefix': normalize_word(prefix), 'words': self.core.complete(prefix, limit)}
+
+    async def reverse(self, query, data):
+        meaning = self._required(query, 'meaning')
+        matches = self.core.reverse_lookup(meaning)[:MAX_BATCH]
+        return HTTPStatus.OK, {'meaning': meaning, 'matches': [list(match) for match in matches]}
+
+    async def lookup_batch(self, query, data):
+        words = data.get('words') if isinstance(data, dict) else None
+        if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'words' kelime listesi olmalı")
+        if len(words) > MAX_BATCH:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"en fazla {MAX_BATCH} kelime")
+        return HTTPStatus.OK, {'results': {word: self.core.lookup(word) for word in words}}
+
+    async def add_word(self, query, data):
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "JSON nesnesi bekleniyor")
+        word = normalize_word(self._required(data, 'word'))
+        meaning = self._required(data, 'meaning').strip()
+        future = asyncio.get_running_loop().create_future()
+        await self._writes.put((word, meaning, future))
+        if not await future:
+            raise HTTPError(HTTPStatus.CONFLICT, "Bu kelime zaten sözlükte mevcut!")
+        return HTTPStatus.CREATED, {'word': word, 'meaning': meaning}
+
+    async def _writer(self):
+        """Yazmaları sırayla, bekleyenleri tek veritabanı işleminde işler"""
+        while True:
+            batch = [await self._writes.get()]
+            while len(batch) < MAX_WRITE_BATCH and not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+            added = {}
+            for word, meaning, _ in batch:
+                if word not in added and not self.core.contains(word):
+                    added[word] = meaning
+            try:
+                if added:
+                    self.core.apply_changes(added, [])
+                    self.metrics.count('words_added', len(added))
+                # Aynı partide iki kez gönderilen kelimenin yalnızca ilki eklenmiş sayılır
+                for word, _, future in batch:
+                    future.set_result(added.pop(word, None) is not None)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._writes.task_done()
+
+    async def metrics_report(self, query, data):
+        summary = self.metrics.summary()
+        summary['uptime_s'] = round(time.time() - self.started, 1)
+        summary['words'] = self.core.count()
+        return HTTPStatus.OK, summary
+
+    async def health(self, query, data):
+        return HTTPStatus.OK, {'status': 'ok', 'words': self.core.count()}
+
+
+def serve(core, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Sözlüğü yükleyip servisi Ctrl+C'ye kadar çalıştır"""
+    core.load(build_fuzzy_index=False)
+    server = DictionaryServer(core, host, port)
+
+    async def main():
+        await server.start()
+        print(f"Sözlük servisi http://{host}:{server.port} adresinde ({core.count()} kelime)", flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    return 0
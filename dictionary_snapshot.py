@@ -0,0 +1,141 @@
+"""Sözlüğün mmap ile açılan ikili anlık görüntüsü.
+
+Dosya CompactDictionary'nin dizilerini olduğu gibi tutar; açılışta kayıtlar
+tek tek okunmaz, dosya belleğe eşlenip yerinde sorgulanır. Görüntü,
+yazıldığı andaki veritabanı kimliği ve sürümüyle etiketlenir; veritabanı
+o zamandan beri değiştiyse ya da dosya bozuksa kullanılmaz.
+
+Dosya düzeni (tüm sayılar little-endian):
+    başlık | kaynak (JSON) | kelime konumları | kelimeler | anlam konumları | anlamlar
+Konumlar dosya içindeki mutlak konumlardır ve 8 bayta hizalanır.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+from dictionary_compact import CompactDictionary
+
+MAGIC = b'SOZLUKS1'
+FORMAT_VERSION = 1
+
+# sihirli sayı, biçim, konum türü, kayıt sayısı, bölüm başlangıçları, dosya sonu,
+# kaynak uzunluğu, başlıktan sonrasının CRC32 değeri
+HEADER = struct.Struct('<8sIcxxxQQQQQQII')
+
+
+def _align(position):
+    return (position + 7) & ~7
+
+
+def write_snapshot(path, store, source, release=None):
+    """CompactDictionary'yi `source` etiketiyle dosyaya yaz.
+
+    Önce geçici dosyaya yazılır, sonra yerine taşınır. `release` verilirse
+    taşımadan hemen önce çağrılır; Windows'ta eşlenmiş eski dosyanın üzerine
+    yazılamadığı için eski eşlemeyi kapatmakta kullanılır.
+    """
+    keys, key_offsets, values, value_offsets = store.buffers()
+    count = len(key_offsets) - 1
+    source_bytes = json.dumps(source).encode('utf-8')
+
+    key_offsets_pos = _align(HEADER.size + len(source_bytes))
+    # Konum dizilerinin boyutu türe bağlı; önce 8 baytlık türle sınır hesaplanır
+    typecode = 'Q'
+    for candidate in ('I', 'Q'):
+        itemsize = array(candidate).itemsize
+        keys_pos = _align(key_offsets_pos + itemsize * (count + 1))
+        value_offsets_pos = _align(keys_pos + len(keys))
+        values_pos = _align(value_offsets_pos + itemsize * (count + 1))
+        end = values_pos + len(values)
+        if candidate == 'Q' or end < 2 ** 32:
+            typecode = candidate
+            break
+
+    absolute_keys = array(typecode, (offset + keys_pos for offset in key_offsets))
+    absolute_values = array(typecode, (offset + values_pos for offset in value_offsets))
+    sections = [
+        (HEADER.size, source_bytes),
+        (key_offsets_pos, absolute_keys),
+        (keys_pos, keys),
+        (value_offsets_pos, absolute_values),
+        (values_pos, values),
+    ]
+
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        # Başlık CRC hesaplandıktan sonra yazılır
+        f.write(bytes(HEADER.size))
+        crc = 0
+        position = HEADER.size
+        for start, data in sections:
+            for chunk in (bytes(start - position), data):
+                f.write(chunk)
+                crc = zlib.crc32(chunk, crc)
+            position = start + len(memoryview(data).cast('B'))
+        f.seek(0)
+        f.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, typecode.encode('ascii'), count,
+            key_offsets_pos, keys_pos, value_offsets_pos, values_pos, end,
+            len(source_bytes), crc,
+        ))
+    if release is not None:
+        release()
+    os.replace(tmp_file, path)
+    return count
+
+
+def open_snapshot(path, source):
+    """Görüntü `source` ile eşleşiyorsa mmap üzerinde CompactDictionary döndür.
+
+    Dosya yoksa, eskiyse ya da bozuksa None döner.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Boş dosya eşlenemez
+            return None
+    try:
+        store = _open_mapping(mapping, source)
+    except (ValueError, struct.error, UnicodeDecodeError) as e:
+        print(f"Sözlük görüntüsü okunamadı: {e}")
+        store = None
+    if store is None:
+        mapping.close()
+    return store
+
+
+def _open_mapping(mapping, source):
+    if len(mapping) < HEADER.size:
+        raise ValueError("dosya çok kısa")
+    (magic, version, typecode, count, key_offsets_pos, keys_pos, value_offsets_pos,
+     values_pos, end, source_length, crc) = HEADER.unpack_from(mapping)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("tanınmayan biçim")
+    if end != len(mapping):
+        raise ValueError("dosya boyutu tutmuyor")
+    stored_source = json.loads(bytes(mapping[HEADER.size:HEADER.size + source_length]).decode('utf-8'))
+    if stored_source != json.loads(json.dumps(source)):
+        # Veritabanı görüntü alındıktan sonra değişmiş
+        return None
+
+    view = memoryview(mapping)
+    try:
+        if zlib.crc32(view[HEADER.size:]) != crc:
+            raise ValueError("CRC tutmuyor")
+        typecode = typecode.decode('ascii')
+        itemsize = array(typecode).itemsize
+        key_offsets = view[key_offsets_pos:key_offsets_pos + itemsize * (count + 1)].cast(typecode)
+        value_offsets = view[value_offsets_pos:value_offsets_pos + itemsize * (count + 1)].cast(typecode)
+    finally:
+        view.release()
+    if key_offsets[0] != keys_pos or value_offsets[-1] != end:
+        key_offsets.release()
+        value_offsets.release()
+        raise ValueError("konum tablosu tutmuyor")
+    return CompactDictionary.from_buffers(mapping, key_offsets, mapping, value_offsets, mapping)
@@ -0,0 +1,340 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+
+# openpyxl yalnızca Excel işlemlerinde yüklenir, veritabanı erişimi hızlı başlar
+
+# Veri tabanı dosyası
+DATABASE_FILE = "sozluk.db"
+
+# Excel sütun başlıkları
+COLUMNS = ['English', 'Turkish', 'Date']
+
+# Günlük (journal) dosyalarının uzantıları
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".compacting"
+
+# iterate() ile tek seferde okunacak kayıt sayısı
+ITERATE_CHUNK_SIZE = 1000
+
+# Önek aramasında üst sınır; UTF-8 sıralamasında her kelimeden büyük karakter
+PREFIX_END = '\U0010ffff'
+
+
+def iter_rows(excel_file):
+    """Excel dosyasındaki (İngilizce, Türkçe, Tarih) kayıtlarını satır satır oku.
+
+    Çalışma kitabı salt okunur modda açılır, hücre nesneleri ve DataFrame
+    oluşturulmadan yalnızca değerler akıtılır.
+    """
+    from openpyxl import load_workbook
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        english_col = header.index('English')
+        turkish_col = header.index('Turkish')
+        date_col = header.index('Date') if 'Date' in header else len(header)
+        for row in rows:
+            if len(row) <= english_col or row[english_col] is None:
+                continue
+            turkish = row[turkish_col] if len(row) > turkish_col else None
+            date = row[date_col] if len(row) > date_col else None
+            yield (
+                str(row[english_col]).strip().lower(),
+                "" if turkish is None else str(turkish),
+                None if date is None else str(date)[:10],
+            )
+    finally:
+        workbook.close()
+
+
+def read_entries(excel_file):
+    """Excel dosyasındaki (İngilizce, Türkçe) çiftlerini satır satır oku"""
+    for english, turkish, _ in iter_rows(excel_file):
+        yield english, turkish
+
+
+def _legacy_journal_files(excel_file):
+    # .compacting, Excel dosyasına işlenirken yarıda kalmış eski günlüktür; önce okunur
+    return excel_file + COMPACTING_SUFFIX, excel_file + JOURNAL_SUFFIX
+
+
+def _read_legacy_journal(excel_file):
+    """Excel dönemindeki günlüklerden henüz dosyaya işlenmemiş kayıtları oku"""
+    entries = []
+    for path in _legacy_journal_files(excel_file):
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # Yarım yazılmış son satırı atla
+                    print(f"Günlük satırı okunamadı: {line!r}")
+    return entries
+
+
+def _remove_legacy_journal(excel_file):
+    for path in _legacy_journal_files(excel_file):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class DictionaryStorage(ABC):
+    """Sözlük depolama arayüzü.
+
+    Kayıtlar küçük harfli İngilizce kelimeye göre tutulur. DictionaryCore
+    ve Excel aktarımı yalnızca bu yöntemleri kullanır; başka bir depo
+    hepsini gerçekleştirmelidir.
+    """
+
+    @abstractmethod
+    def load(self):
+        """Tüm sözlüğü {ingilizce: türkçe} sözlüğü olarak döndür"""
+
+    @abstractmethod
+    def get(self, english):
+        """Kelimenin anlamını, yoksa None döndür"""
+
+    @abstractmethod
+    def put(self, english, turkish, date=None):
+        """Kaydı ekle ya da anlamını değiştir"""
+
+    @abstractmethod
+    def put_many(self, entries):
+        """(ingilizce, türkçe, tarih) kayıtlarını tek işlemde ekle"""
+
+    @abstractmethod
+    def delete(self, english):
+        """Kelimeyi sil"""
+
+    @abstractmethod
+    def delete_many(self, words):
+        """Kelimeleri tek işlemde sil"""
+
+    @abstractmethod
+    def count(self):
+        """Kayıt sayısını döndür"""
+
+    @abstractmethod
+    def iterate(self):
+        """(ingilizce, türkçe, tarih) kayıtlarını alfabetik sırayla döndür"""
+
+    @abstractmethod
+    def page(self, after=None, limit=ITERATE_CHUNK_SIZE, prefix="", descending=False):
+        """`after` kelimesinden sonraki en fazla `limit` kaydı sırayla döndür.
+
+        prefix verilirse yalnızca o önekle başlayan kelimeler döner.
+        """
+
+    @abstractmethod
+    def get_rows(self, words):
+        """Verilen kelimelerin (ingilizce, türkçe, tarih) kayıtlarını döndür"""
+
+    @abstractmethod
+    def version(self):
+        """(depo kimliği, sürüm) döndür; sürüm her yazma işleminde artar"""
+
+    @property
+    @abstractmethod
+    def writes(self):
+        """Bu nesnenin yaptığı yazma sayısı; version() ile karşılaştırılıp
+        başka bir sürecin depoya yazıp yazmadığı anlaşılır"""
+
+    @abstractmethod
+    def get_meta(self, key):
+        """Ayar/durum değerini (metin), yoksa None döndür"""
+
+    @abstractmethod
+    def set_meta(self, key, value):
+        """Ayar/durum değerini kaydet; sözlük sürümünü değiştirmez"""
+
+    @abstractmethod
+    def clear(self):
+        """Tüm kayıtları sil"""
+
+    def close(self):
+        pass
+
+
+class SQLiteStorage(DictionaryStorage):
+    """SQLite üzerinde çalışan sözlük deposu.
+
+    Her yazma işlemi meta tablosundaki 'version' değerini artırır; writes
+    bu bağlantının yaptığı yazma sayısıdır. İkisi karşılaştırılarak başka
+    bir sürecin (ör. komut satırı) veritabanına yazıp yazmadığı anlaşılır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            # english birincil anahtar olduğu için aramalar indeks üzerinden yapılır
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS words ("
+                "english TEXT PRIMARY KEY, turkish TEXT NOT NULL, date TEXT"
+                ") WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('database_id', ?)", (uuid.uuid4().hex,)
+            )
+
+    def _bump_version(self):
+        # Yazma işleminin içinde, aynı işlemde çağrılır
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', 1) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+        )
+        self._writes += 1
+
+    @property
+    def writes(self):
+        return self._writes
+
+    def load(self):
+        with self._lock:
+            return dict(self._conn.execute("SELECT english, turkish FROM words"))
+
+    def get(self, english):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT turkish FROM words WHERE english = ?", (english,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, english, turkish, date=None):
+        self.put_many([(english, turkish, date)])
+
+    def put_many(self, entries):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO words (english, turkish, date) VALUES (?, ?, ?)",
+                entries,
+            )
+            self._bump_version()
+
+    def delete(self, english):
+        self.delete_many([english])
+
+    def delete_many(self, words):
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM words WHERE english = ?", ((word,) for word in words))
+            self._bump_version()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+    def iterate(self):
+        # Kilidi uzun süre tutmamak için kayıtlar parça parça okunur
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT english, turkish, date FROM words WHERE english > ? "
+                    "ORDER BY english LIMIT ?",
+                    (last, ITERATE_CHUNK_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last = rows[-1][0]
+
+    def page(self, after=None, limit=ITERATE_CHUNK_SIZE, prefix="", descending=False):
+        # Sayfalar OFFSET yerine son kelimeden devam eder; sorgu her sayfada
+        # birincil anahtar indeksinde aralık taraması yapar
+        conditions = []
+        params = []
+        if prefix:
+            conditions.append("english >= ? AND english < ?")
+            params += [prefix, prefix + PREFIX_END]
+        if after is not None:
+            conditions.append("english < ?" if descending else "english > ?")
+            params.append(after)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        order = "DESC" if descending else "ASC"
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT english, turkish, date FROM words {where}ORDER BY english {order} LIMIT ?",
+                params + [limit],
+            ).fetchall()
+
+    def get_rows(self, words):
+        words = list(words)
+        rows = {}
+        with self._lock:
+            # SQLite'ın bağlı parametre sınırını aşmamak için parça parça
+            for i in range(0, len(words), ITERATE_CHUNK_SIZE // 2):
+                chunk = words[i:i + ITERATE_CHUNK_SIZE // 2]
+                rows.update(
+                    (row[0], row) for row in self._conn.execute(
+                        f"SELECT english, turkish, date FROM words WHERE english IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+        # Kayıtlar verilen sırayla, silinmiş olanlar atlanarak döner
+        return [rows[word] for word in words if word in rows]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM words")
+            self._bump_version()
+
+    def version(self):
+        with self._lock:
+            rows = dict(self._conn.execute(
+                "SELECT key, value FROM meta WHERE key IN ('database_id', 'version')"
+            ))
+        return rows['database_id'], int(rows.get('version', 0))
+
+    def get_meta(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_from_excel(storage, excel_file):
+    """Eski Excel sözlüğünü (ve işlenmemiş günlük kayıtlarını) depoya bir kez aktar"""
+    if storage.get_meta('excel_migrated'):
+        return 0
+
+    entries = {}
+    if os.path.exists(excel_file):
+        for english, turkish, date in iter_rows(excel_file):
+            entries[english] = (english, turkish, date)
+
+    for entry in _read_legacy_journal(excel_file):
+        entries[entry['English']] = (entry['English'], entry['Turkish'], entry['Date'])
+
+    storage.put_many(list(entries.values()))
+    storage.set_meta('excel_migrated', '1')
+    _remove_legacy_journal(excel_file)
+    return len(entries)
+
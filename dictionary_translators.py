@@ -0,0 +1,270 @@
+"""Değiştirilebilir çeviri sağlayıcıları.
+
+Her sağlayıcı deep_translator ile aynı arayüzü sunar: translate(text) ve
+translate_batch(words). Sağlayıcı SOZLUK_TRANSLATOR ortam değişkeniyle
+(ya da komut satırında --translator) seçilir:
+
+    google           Google Translate, kalıcı HTTP oturumu ve zaman aşımıyla (varsayılan)
+    deep-translator  Eski davranış; her istekte yeni bağlantı kurar
+    stub             Yerel sahte HTTP sunucusu; testler ve ölçümler için
+
+create_translator() sağlayıcıyı CircuitBreaker ile sarar; art arda
+başarısız olan sağlayıcı bir süre hiç çağrılmaz.
+"""
+import html
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from dictionary_diagnostics import diagnostics
+
+GOOGLE_URL = "https://translate.google.com/m"
+DEFAULT_PROVIDER = 'google'
+# Tek bir çeviri isteği için (bağlantı, okuma) zaman aşımı, saniye
+DEFAULT_TIMEOUT = 5
+# Oturumda tutulacak en fazla açık bağlantı; çeviri iş parçacığı sayısıyla aynı
+POOL_SIZE = 4
+
+# Art arda bu kadar hatadan sonra sağlayıcı COOLDOWN saniye çağrılmaz
+FAILURE_THRESHOLD = 3
+COOLDOWN = 30
+
+
+class TranslationError(Exception):
+    """Sağlayıcı geçerli bir çeviri döndüremedi"""
+
+
+class CircuitOpenError(TranslationError):
+    """Sağlayıcı art arda hata verdiği için şu an çağrılmıyor"""
+
+
+class TranslatorProvider:
+    """Çeviri sağlayıcılarının ortak arayüzü"""
+
+    def __init__(self, source='en', target='tr'):
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        raise NotImplementedError
+
+    def translate_batch(self, words):
+        return [self.translate(word) for word in words]
+
+    def close(self):
+        pass
+
+
+class GoogleProvider(TranslatorProvider):
+    """Google Translate'in mobil sayfasını kalıcı bir requests oturumuyla kullanır.
+
+    deep_translator her çağrıda yeni bağlantı kurar ve zaman aşımı
+    vermez; burada bağlantılar oturumda tekrar kullanılır ve her istek en
+    fazla `timeout` saniye bekler.
+    """
+
+    def __init__(self, source='en', target='tr', timeout=DEFAULT_TIMEOUT, base_url=GOOGLE_URL):
+        super().__init__(source, target)
+        self.timeout = timeout
+        self.base_url = base_url
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+
+    def translate(self, text):
+        import requests
+        from bs4 import BeautifulSoup
+
+        text = text.strip()
+        if not text:
+            return text
+        try:
+            response = self.session.get(
+                self.base_url,
+                params={'sl': self.source, 'tl': self.target, 'q': text},
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            raise TranslationError(f"istek başarısız: {e}") from e
+        with response:
+            if response.status_code != 200:
+                raise TranslationError(f"HTTP {response.status_code}")
+            soup = BeautifulSoup(response.text, "html.parser")
+        element = soup.find('div', {'class': 't0'}) or soup.find('div', {'class': 'result-container'})
+        if element is None:
+            raise TranslationError(f"çeviri bulunamadı: {text}")
+        return element.get_text(strip=True)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class DeepTranslatorProvider(TranslatorProvider):
+    """deep_translator.GoogleTranslator ile eski davranış"""
+
+    def __init__(self, source='en', target='tr', **options):
+        super().__init__(source, target)
+        from deep_translator import GoogleTranslator
+        self._translator = GoogleTranslator(source=source, target=target)
+
+    def translate(self, text):
+        return self._translator.translate(text=text)
+
+
+class StubTranslationServer:
+    """Google'ın mobil sayfasını taklit eden yerel HTTP sunucusu.
+
+    Her satırı ters çevirerek döndürür. `latency` saniye bekletir;
+    `status` 200 dışı bir değere ayarlanırsa o kodla hata verir.
+    """
+
+    def __init__(self, latency=0.0, status=200):
+        self.latency = latency
+        self.status = status
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Bağlantılar istekler arasında açık kalabilsin
+            protocol_version = 'HTTP/1.1'
+            # Başlık ve gövde ayrı yazıldığında Nagle gecikmesi ölçümü bozmasın
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                query = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+                if server.status == 200:
+                    translated = "\n".join(line[::-1] for line in query.split("\n"))
+                    body = f'<html><body><div class="result-container">{html.escape(translated)}</div></body></html>'
+                else:
+                    body = "hata"
+                data = body.encode('utf-8')
+                self.send_response(server.status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/m"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class StubProvider(GoogleProvider):
+    """Kendi yerel sahte sunucusunu başlatan Google sağlayıcısı"""
+
+    def __init__(self, source='en', target='tr', timeout=DEFAULT_TIMEOUT, latency=0.0):
+        self.server = StubTranslationServer(latency)
+        super().__init__(source, target, timeout, base_url=self.server.url)
+
+    def close(self):
+        super().close()
+        self.server.close()
+
+
+class CircuitBreaker(TranslatorProvider):
+    """Art arda `threshold` hata veren sağlayıcıyı `cooldown` saniye devre dışı bırakır.
+
+    Bekleme bitince tek bir deneme isteğine izin verilir; başarılı olursa
+    devre kapanır, olmazsa bekleme yeniden başlar. Devre açıkken çağrılar
+    ağa çıkmadan CircuitOpenError ile sonuçlanır.
+    """
+
+    def __init__(self, provider, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN, clock=time.monotonic):
+        super().__init__(provider.source, provider.target)
+        self.provider = provider
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if self.clock() - self.opened_at >= self.cooldown:
+            return 'half-open'
+        return 'open'
+
+    def _call(self, func, *args):
+        with self._lock:
+            if self.opened_at is not None:
+                if self._trial or self.clock() - self.opened_at < self.cooldown:
+                    self.rejected += 1
+                    diagnostics.count('translator_rejected')
+                    raise CircuitOpenError("çeviri servisi geçici olarak devre dışı")
+                # Bekleme bitti, yalnızca bu istek denenir
+                self._trial = True
+        try:
+            result = func(*args)
+        except Exception:
+            with self._lock:
+                self._trial = False
+                self.failures += 1
+                if self.opened_at is not None or self.failures >= self.threshold:
+                    self.opened_at = self.clock()
+                    diagnostics.count('translator_circuit_opened')
+            raise
+        with self._lock:
+            self._trial = False
+            self.failures = 0
+            self.opened_at = None
+        return result
+
+    def translate(self, text):
+        return self._call(self.provider.translate, text)
+
+    def translate_batch(self, words):
+        return self._call(self.provider.translate_batch, words)
+
+    def close(self):
+        self.provider.close()
+
+
+PROVIDERS = {
+    'google': GoogleProvider,
+    'deep-translator': DeepTranslatorProvider,
+    'stub': StubProvider,
+}
+
+
+def create_translator(name=None, timeout=None, source='en', target='tr'):
+    """Adı verilen (ya da SOZLUK_TRANSLATOR ile seçilen) sağlayıcıyı devre kesiciyle döndür"""
+    name = name or os.environ.get('SOZLUK_TRANSLATOR', DEFAULT_PROVIDER)
+    if name not in PROVIDERS:
+        raise ValueError(f"Bilinmeyen çeviri sağlayıcısı: {name} (seçenekler: {', '.join(PROVIDERS)})")
+    if timeout is None:
+        timeout = float(os.environ.get('SOZLUK_TRANSLATOR_TIMEOUT', DEFAULT_TIMEOUT))
+    return CircuitBreaker(PROVIDERS[name](source=source, target=target, timeout=timeout))
@@ -0,0 +1,324 @@
+import os
+import threading
+import urllib.request
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from dictionary_core import TRANSLATION_FAILED
+from dictionary_diagnostics import diagnostics
+
+# Aynı anda çalışabilecek en fazla çeviri isteği
+MAX_TRANSLATION_THREADS = 4
+# Önceden çeviri için ayrılan iş parçacıkları; aramaların önüne geçmesin diye az tutulur
+MAX_PREFETCH_THREADS = 2
+# Kullanılmayı bekleyen en fazla önceden çevrilmiş kelime
+MAX_PREFETCHED = 100
+
+# Bağlantı kontrolü ayarları (saniye)
+PROBE_URL = 'http://google.com'
+PROBE_TIMEOUT = 3
+ONLINE_CHECK_INTERVAL = 30
+OFFLINE_RETRY_MIN = 2
+OFFLINE_RETRY_MAX = 60
+
+# Dosyaya art arda yapılan yazmaların birleştirileceği süre (ms)
+WATCH_DELAY_MS = 1000
+
+
+class TranslationSignals(QObject):
+    """İş parçacığından ana iş parçacığına sonuç taşıyan sinyaller"""
+    finished = pyqtSignal(str, str)  # kelime, çeviri
+    dropped = pyqtSignal(str)  # sırası gelmeden geçersizleşen kelime
+
+
+class TranslationTask(QRunnable):
+    """Tek bir kelimeyi arka planda çeviren görev.
+
+    wanted verilirse görev sırası geldiğinde hâlâ gerekli mi diye sorulur.
+    """
+
+    def __init__(self, translate, word, signals, wanted=None):
+        super().__init__()
+        self.translate = translate
+        self.word = word
+        self.signals = signals
+        self.wanted = wanted
+
+    def run(self):
+        if self.wanted is not None and not self.wanted(self.word):
+            self.signals.dropped.emit(self.word)
+            return
+        try:
+            result = self.translate(self.word)
+        except Exception as e:
+            print(f"Çeviri hatası: {e}")
+            result = TRANSLATION_FAILED
+        self.signals.finished.emit(self.word, result)
+
+
+class TranslationWorker(QObject):
+    """Çevirileri iş parçacığı havuzunda çalıştırır, sonucu sinyal ile bildirir.
+
+    Aynı kelime için süren istekler birleştirilir; kullanıcı yeni bir kelime
+    yazdığında eski isteklerin sonuçları yok sayılır. prefetch() ile kelime
+    kullanıcı aramadan önce ayrı ve küçük bir havuzda çevrilir; arama
+    geldiğinde sonuç önbellekten okunur ya da süren isteğe katılınır.
+    """
+    translated = pyqtSignal(str, str)  # kelime, çeviri
+
+    def __init__(self, translate, parent=None):
+        super().__init__(parent)
+        self.translate = translate
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(MAX_TRANSLATION_THREADS)
+        self.prefetch_pool = QThreadPool(self)
+        self.prefetch_pool.setMaxThreadCount(MAX_PREFETCH_THREADS)
+        self.signals = TranslationSignals(self)
+        self.signals.finished.connect(self._on_finished)
+        self.signals.dropped.connect(self._on_dropped)
+        self.current_word = None
+        self.in_flight = set()
+        self.prefetch_word = None
+        self.prefetching = set()
+        # Önceden çevrilip henüz aranmamış kelimeler, eskiden yeniye
+        self.prefetched = {}
+        self.prefetch_counts = dict.fromkeys(
+            ('requested', 'dropped', 'completed', 'hits', 'joined', 'misses', 'unused'), 0
+        )
+
+    def prefetch(self, word):
+        """Kelimeyi arama beklemeden arka planda çevir (sonuç önbelleğe yazılır).
+
+        Sırası gelmeden başka bir kelime istenirse ya da kullanıcı yazmaya
+        devam ederse görev çalışmadan atlanır.
+        """
+        self.prefetch_word = word
+        if word in self.in_flight or word in self.prefetched:
+            return
+        self.in_flight.add(word)
+        self.prefetching.add(word)
+        self._count('requested')
+        self.prefetch_pool.start(TranslationTask(self.translate, word, self.signals, self._wanted))
+
+    def record_lookup(self, word):
+        """Kullanıcının çevirisini istediği kelimeyi ön çeviri sayaçlarına işle"""
+        if self.prefetched.pop(word, None) is not None:
+            self._count('hits')
+        elif word in self.prefetching:
+            self._count('joined')
+        else:
+            self._count('misses')
+
+    def prefetch_stats(self):
+        """Ön çeviri sayaçları; hit_rate çalışan ön çevirilerin ne kadarının kullanıldığıdır"""
+        stats = dict(self.prefetch_counts)
+        run = stats['requested'] - stats['dropped']
+        stats['hit_rate'] = (stats['hits'] + stats['joined']) / run if run else 0.0
+        return stats
+
+    def _wanted(self, word):
+        # İş parçacığından çağrılır; yalnızca okuma yapar
+        return word == self.prefetch_word or word == self.current_word
+
+    def _count(self, name):
+        self.prefetch_counts[name] += 1
+        diagnostics.count('prefetch_' + name)
+
+    def request(self, word):
+        """Kelimeyi çevir; sonuç yalnızca en son istenen kelime için yayınlanır"""
+        self.current_word = word
+        if word in self.in_flight:
+            # Aynı kelime zaten çevriliyor, yeni istek başlatma
+            return
+        self.in_flight.add(word)
+        self.pool.start(TranslationTask(self.translate, word, self.signals))
+
+    def cancel(self):
+        """Bekleyen sonucu ve sırası gelmemiş ön çeviriyi geçersiz say"""
+        self.current_word = None
+        self.prefetch_word = None
+
+    def shutdown(self, timeout_ms=2000):
+        self.cancel()
+        for pool in (self.pool, self.prefetch_pool):
+            pool.clear()
+            pool.waitForDone(timeout_ms)
+
+    def _on_dropped(self, word):
+        self.in_flight.discard(word)
+        self.prefetching.discard(word)
+        self._count('dropped')
+
+    def _on_finished(self, word, result):
+        self.in_flight.discard(word)
+        if word in self.prefetching:
+            self.prefetching.discard(word)
+            self._count('completed')
+            if word != self.current_word:
+                self.prefetched[word] = result
+                if len(self.prefetched) > MAX_PREFETCHED:
+                    del self.prefetched[next(iter(self.prefetched))]
+                    self._count('unused')
+        if word != self.current_word:
+            # Kullanıcı başka bir kelimeye geçmiş, sonucu yok say
+            return
+        self.current_word = None
+        self.translated.emit(word, result)
+
+
+class ConnectivityMonitor(QObject):
+    """İnternet bağlantısını arka plandaki bir iş parçacığında izler.
+
+    Bağlantı yokken kontroller üstel olarak seyrekleşir. Çeviri sonuçları
+    report_success/report_failure ile bildirilerek durum pasif olarak da
+    güncellenir. Durum değiştiğinde status_changed sinyali yayınlanır.
+    """
+    status_changed = pyqtSignal(bool)  # çevrimiçi mi
+
+    def __init__(self, parent=None, probe_url=PROBE_URL):
+        super().__init__(parent)
+        self.probe_url = probe_url
+        self.online = True
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout=1):
+        self._stop.set()
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def report_success(self):
+        """Başarılı bir ağ isteği bağlantının olduğunu gösterir"""
+        self._set_online(True)
+
+    def report_failure(self):
+        """Başarısız bir ağ isteği sonrası bağlantıyı hemen kontrol et"""
+        self._set_online(False)
+        self._wake.set()
+
+    @diagnostics.timed('check_internet_connection')
+    def check(self):
+        """Bağlantıyı bir kez kontrol et (engelleyici, arka planda çağrılır)"""
+        try:
+            urllib.request.urlopen(self.probe_url, timeout=PROBE_TIMEOUT).close()
+            return True
+        except Exception:
+            diagnostics.count('network_failures')
+            return False
+
+    def _set_online(self, online):
+        with self._lock:
+            if online == self.online:
+                return
+            self.online = online
+        self.status_changed.emit(online)
+
+    def _run(self):
+        delay = OFFLINE_RETRY_MIN
+        while not self._stop.is_set():
+            self._wake.clear()
+            self._set_online(self.check())
+            if self.online:
+                delay = OFFLINE_RETRY_MIN
+                wait = ONLINE_CHECK_INTERVAL
+            else:
+                wait = delay
+                delay = min(delay * 2, OFFLINE_RETRY_MAX)
+            self._wake.wait(wait)
+
+
+class BackgroundTask(QObject):
+    """Uzun süren bir işi arka planda çalıştırır, ilerlemeyi sinyal ile bildirir.
+
+    İş fonksiyonu tek argüman olarak bir `progress(tamamlanan, toplam)`
+    fonksiyonu alır.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, func, parent=None):
+        super().__init__(parent)
+        self.func = func
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            result = self.func(self.progress.emit)
+        except Exception as e:
+            print(f"Arka plan işi hatası: {e}")
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(result)
+
+
+class FileWatcher(QObject):
+    """Bir dosyanın dışarıdan değiştirilmesini izler.
+
+    Art arda gelen yazmalar tek bir changed sinyalinde birleştirilir.
+    Excel gibi programlar dosyayı silip yeniden oluşturduğunda izleme
+    düşer; bu yüzden klasör de izlenir ve dosya yeniden eklenir. Boyutu
+    ve değişiklik zamanı aynı kalan ya da silinen dosya için sinyal
+    yayınlanmaz.
+    """
+    changed = pyqtSignal(str)  # dosya yolu
+
+    def __init__(self, path, delay_ms=WATCH_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.path = os.path.abspath(path)
+        self._signature = self._stat()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_change)
+        self._watcher.directoryChanged.connect(self._on_change)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._check)
+
+    def start(self):
+        self._watcher.addPath(os.path.dirname(self.path))
+        if os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+
+    def stop(self):
+        self._timer.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _on_change(self, _):
+        if self.path not in self._watcher.files() and os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+        self._timer.start()
+
+    def _check(self):
+        signature = self._stat()
+        if signature == self._signature:
+            return
+        self._signature = signature
+        if signature is not None:
+            self.changed.emit(self.path)